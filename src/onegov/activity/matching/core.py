@@ -6,13 +6,15 @@ quadratic runtime.
 """
 from __future__ import annotations
 
+from itertools import combinations, groupby, product
+from onegov.activity import log
 from onegov.activity import Attendee, Booking, Occasion, BookingPeriod
 from onegov.activity.matching.score import Scoring
 from onegov.activity.matching.utils import overlaps, LoopBudget, HashableID
-from onegov.activity.matching.utils import booking_order, unblockable
-from itertools import groupby, product
+from onegov.activity.matching.utils import booking_order
 from sortedcontainers import SortedSet
-from sqlalchemy.orm import joinedload, defer
+from sqlalchemy.orm import defer, load_only
+from time import perf_counter
 
 
 from typing import Any, Literal, NamedTuple, TYPE_CHECKING
@@ -42,10 +44,11 @@ class AttendeeAgent[BookingT: Booking | MatchableBooking](HashableID):
 
     """
 
-    __slots__ = ('id', 'wishlist', 'accepted', 'blocked')
+    __slots__ = ('id', 'wishlist', 'accepted', 'blocked', 'conflicts')
 
     accepted: set[BookingT]
     blocked: set[BookingT]
+    conflicts: dict[BookingT, set[BookingT]]
 
     def __init__(
         self,
@@ -63,6 +66,14 @@ class AttendeeAgent[BookingT: Booking | MatchableBooking](HashableID):
         self.minutes_between = minutes_between
         self.alignment = alignment
 
+        # the bookings of an attendee never change during the matching, so
+        # we only need to check which of them block each other once
+        self.conflicts = {booking: set() for booking in self.wishlist}
+        for a, b in combinations(self.wishlist, 2):
+            if self.blocks(a, b):
+                self.conflicts[a].add(b)
+                self.conflicts[b].add(a)
+
     def blocks(
         self,
         subject: BookingT,
@@ -82,7 +93,7 @@ class AttendeeAgent[BookingT: Booking | MatchableBooking](HashableID):
             self.blocked |= self.wishlist
         else:
             self.blocked |= {
-                b for b in self.wishlist if self.blocks(booking, b)
+                b for b in self.conflicts[booking] if b in self.wishlist
             }
 
         self.wishlist -= self.blocked
@@ -94,11 +105,11 @@ class AttendeeAgent[BookingT: Booking | MatchableBooking](HashableID):
         self.accepted.remove(booking)
 
         # remove bookings from the blocked list which are not blocked anymore
-        for booking in unblockable(
-                self.accepted, self.blocked, with_anti_affinity_check=True):
+        unblocked = self.blocked.difference(
+            *(self.conflicts[a] for a in self.accepted))
 
-            self.blocked.remove(booking)
-            self.wishlist.add(booking)
+        self.blocked -= unblocked
+        self.wishlist |= unblocked
 
     @property
     def is_valid(self) -> bool:
@@ -369,6 +380,20 @@ def deferred_acceptance[
     )
 
 
+class MatchingBenchmark(NamedTuple):
+    """ The time in seconds spent on each step of a matching run. """
+
+    bookings: int
+    attendees: int
+    load: float
+    match: float
+    store: float
+
+    @property
+    def total(self) -> float:
+        return self.load + self.match + self.store
+
+
 def deferred_acceptance_from_database(
     session: Session,
     period_id: UUID,
@@ -377,19 +402,14 @@ def deferred_acceptance_from_database(
     validity_check: bool = True,
     stability_check: bool = False,
     hard_budget: bool = True,
-) -> None:
+) -> MatchingBenchmark:
+
+    start = perf_counter()
 
     period = session.query(BookingPeriod).filter(
         BookingPeriod.id == period_id
     ).one()
 
-    b = session.query(Booking)
-    b = b.options(joinedload(Booking.occasion))
-    b = b.filter(Booking.period_id == period_id)
-    b = b.filter(Booking.state != 'cancelled')
-    b = b.filter(Booking.created >= period.created)
-    b = b.order_by(Booking.attendee_id)
-
     o = session.query(Occasion)
     o = o.filter(Occasion.period_id == period_id)
     o = o.options(
@@ -398,6 +418,27 @@ def deferred_acceptance_from_database(
         defer(Occasion.cost)
     )
 
+    # the occasions are loaded before the bookings, so the bookings can
+    # get their occasion from the identity map instead of joining it
+    occasions = list(o)
+
+    b = session.query(Booking)
+    b = b.options(load_only(
+        Booking.id,
+        Booking.username,
+        Booking.priority,
+        Booking.group_code,
+        Booking.attendee_id,
+        Booking.occasion_id,
+        Booking.period_id,
+        Booking.score,
+        Booking.state
+    ))
+    b = b.filter(Booking.period_id == period_id)
+    b = b.filter(Booking.state != 'cancelled')
+    b = b.filter(Booking.created >= period.created)
+    b = b.order_by(Booking.attendee_id)
+
     if period.max_bookings_per_attendee:
         default_limit = period.max_bookings_per_attendee
         attendee_limits = None
@@ -411,9 +452,11 @@ def deferred_acceptance_from_database(
     # fetch it here as it'll be reused multiple times
     bookings = list(b)
 
+    loaded = perf_counter()
+
     results = deferred_acceptance(
         bookings=bookings,
-        occasions=o,
+        occasions=occasions,
         default_limit=default_limit,
         attendee_limits=attendee_limits,
         minutes_between=period.minutes_between or 0,
@@ -424,21 +467,42 @@ def deferred_acceptance_from_database(
         hard_budget=hard_budget
     )
 
-    # write the changes to the database
+    matched = perf_counter()
+
+    # write the changes to the database, one statement per state
     def update_bookings(targets: set[Booking], state: BookingState) -> None:
+        if not targets:
+            return
+
         q = session.query(Booking)
         q = q.filter(Booking.state != state)
         q = q.filter(Booking.state != 'cancelled')
         q = q.filter(Booking.period_id == period_id)
-        q = q.filter(Booking.id.in_(t.id for t in targets))
+        q = q.filter(Booking.id.in_([t.id for t in targets]))
+        q.update({Booking.state: state}, synchronize_session='evaluate')
+
+    update_bookings(results.open, 'open')
+    update_bookings(results.accepted, 'accepted')
+    update_bookings(results.blocked, 'blocked')
+
+    # the changed scores are written by the next flush
+    session.flush()
+
+    benchmark = MatchingBenchmark(
+        bookings=len(bookings),
+        attendees=len({b.attendee_id for b in bookings}),
+        load=loaded - start,
+        match=matched - loaded,
+        store=perf_counter() - matched
+    )
 
-        for booking in q:
-            booking.state = state
+    log.info(
+        f'Matched {benchmark.bookings} bookings of {benchmark.attendees} '
+        f'attendees in {benchmark.total:.2f}s (load: {benchmark.load:.2f}s, '
+        f'match: {benchmark.match:.2f}s, store: {benchmark.store:.2f}s)'
+    )
 
-    with session.no_autoflush:
-        update_bookings(results.open, 'open')
-        update_bookings(results.accepted, 'accepted')
-        update_bookings(results.blocked, 'blocked')
+    return benchmark
 
 
 def is_stable[BookingT: Booking | MatchableBooking](
@@ -7,9 +7,12 @@ from onegov.agency.collections import ExtendedPersonCollection
 from onegov.agency.collections import PaginatedAgencyCollection
 from onegov.agency.collections import PaginatedMembershipCollection
 from onegov.agency.forms.person import AuthenticatedPersonMutationForm
+from onegov.agency.models import ExtendedAgency
 from onegov.api import ApiEndpoint, ApiInvalidParamException
 from onegov.api.utils import is_authorized
 from onegov.gis import Coordinates
+from onegov.people import AgencyOrganigram
+from sqlalchemy import func, select
 from uuid import UUID
 
 
@@ -17,9 +20,9 @@ from typing import Any
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from onegov.agency.forms import PersonMutationForm
+    from onegov.api.models import LastChange
     from onegov.core.request import CoreRequest
     from onegov.agency.app import AgencyApp
-    from onegov.agency.models import ExtendedAgency
     from onegov.agency.models import ExtendedAgencyMembership
     from onegov.agency.models import ExtendedPerson
     from onegov.core.orm.mixins import ContentMixin
@@ -213,7 +216,7 @@ class PersonApiEndpoint(ApiEndpoint['ExtendedPerson', UUID], ApisMixin):
         do_report_person_change(item, form.meta.request, form)
 
 
-class AgencyApiEndpoint(ApiEndpoint['ExtendedAgency', int], ApisMixin):
+class AgencyApiEndpoint(ApiEndpoint[ExtendedAgency, int], ApisMixin):
     request: CoreRequest
     app: AgencyApp
     endpoint = 'agencies'
@@ -252,6 +255,14 @@ class AgencyApiEndpoint(ApiEndpoint['ExtendedAgency', int], ApisMixin):
         result.batch_size = self.batch_size
         return result
 
+    @property
+    def last_changes(self) -> tuple[LastChange, ...]:
+        # the organigram is linked, replacing it doesn't change the agency
+        return (
+            ExtendedAgency.last_change,
+            select(func.max(AgencyOrganigram.last_change)).scalar_subquery()
+        )
+
     def item_data(self, item: ExtendedAgency) -> dict[str, Any]:
         return {
             'title': item.title,
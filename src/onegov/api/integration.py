@@ -5,43 +5,40 @@ from morepath import App
 
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
-    from onegov.core import cache
+    from onegov.core.rate_limit import RateLimiter
 
 
 class ApiApp(App):
 
     if TYPE_CHECKING:
-        # forward declare Framework.get_cache
-        def get_cache(
-            self,
-            name: str,
-            expiration_time: float
-        ) -> cache.RedisCacheRegion: ...
+        # forward declare Framework.rate_limiter
+        @property
+        def rate_limiter(self) -> RateLimiter: ...
 
     def configure_api(self, **cfg: Any) -> None:
         """ Configures the API.
 
         The following configuration options are accepted:
 
-        :rate_limit:
-            A tuple with number of request per expiration time in seconds.
+        :api_rate_limit:
+            The number of ``requests`` per ``expiration`` time in seconds
+            allowed for anonymous clients (per address). Clients using a
+            token are limited per token, to ``token_requests`` requests.
 
         Since providing an API is not our main focus, we keep the rate limit
         rather low (<10 requests per minute) while still allowing small crawl
         bursts by default.
 
         """
+        api_rate_limit = cfg.get('api_rate_limit', {})
         self.rate_limit = (
-            cfg.get('api_rate_limit', {}).get('requests', 100),
-            cfg.get('api_rate_limit', {}).get('expiration', 15 * 60)
+            api_rate_limit.get('requests', 100),
+            api_rate_limit.get('expiration', 15 * 60)
+        )
+        self.token_rate_limit = (
+            api_rate_limit.get('token_requests', 1000),
+            api_rate_limit.get('expiration', 15 * 60)
         )
-
-    @property
-    def rate_limit_cache(self) -> cache.RedisCacheRegion:
-        """ A cache for rate limits. """
-
-        _limit, expiration = self.rate_limit
-        return self.get_cache('rate_limits', expiration)
 
 
 @ApiApp.setting(section='api', name='endpoints')
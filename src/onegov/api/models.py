@@ -6,11 +6,15 @@ from functools import cached_property
 from json import JSONDecodeError
 from logging import getLogger
 from logging import NullHandler
+from onegov.core.collection import Pagination
 from onegov.core.orm import Base
+from onegov.core.utils import hash_dictionary
 from onegov.form.fields import HoneyPotField
 from onegov.form.utils import get_fields_from_class
 from onegov.user import User
+from sqlalchemy import func
 from sqlalchemy import ForeignKey
+from sqlalchemy import inspect
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
 from sqlalchemy.orm import Mapped
@@ -28,6 +32,7 @@ if TYPE_CHECKING:
     from onegov.core.request import CoreRequest
     from onegov.form import Form
     from sqlalchemy.orm import DeclarativeBase, Query, Session
+    from sqlalchemy.sql import ColumnElement
     from typing import Protocol
     from webob.request import _FieldStorageWithFile
 
@@ -63,6 +68,10 @@ if TYPE_CHECKING:
         @property
         def next(self) -> Self | None: ...
 
+    # (number of items, last change of any item)
+    type Fingerprint = tuple[int, datetime | None]
+    type LastChange = ColumnElement[datetime] | ColumnElement[datetime | None]
+
 log = getLogger('onegov.api')
 log.addHandler(NullHandler())
 
@@ -120,6 +129,76 @@ class ApiInvalidParamException(ApiException):
         self.status_code = status_code
 
 
+def keyset_batch[M: DeclarativeBase](
+    query: Query[M],
+    cursor: str | None,
+    batch_size: int,
+    transform: Callable[[Query[M]], Query[M]] | None = None
+) -> tuple[tuple[M, ...], str | None]:
+    """ Returns the items of the given query following the item with the
+    given cursor together with the cursor of the next batch (if there are
+    more items).
+
+    The items are ordered by their primary key, which doesn't change and is
+    indexed. Unlike offsets, this stays fast for deep pages and doesn't skip
+    or repeat items if items are added or removed in between requests.
+
+    """
+
+    mapper = inspect(query.column_descriptions[0]['entity'])
+    key = mapper.primary_key[0]
+
+    query = query.order_by(None).order_by(key)
+    if cursor:
+        try:
+            value = key.type.python_type(cursor)
+        except Exception:
+            raise ApiInvalidParamException(
+                f'Invalid cursor {cursor!r}'
+            ) from None
+        query = query.filter(key > value)
+
+    # fetch one more item to find out if there is a next batch
+    query = query.limit(batch_size + 1)
+    if transform is not None:
+        query = transform(query)
+
+    items = tuple(query)
+    if len(items) <= batch_size:
+        return items, None
+
+    items = items[:batch_size]
+    last = mapper.primary_key_from_instance(items[-1])[0]
+    return items, last.hex if isinstance(last, UUID) else str(last)
+
+
+def query_fingerprint(
+    query: Query[Any],
+    *last_changes: LastChange
+) -> Fingerprint | None:
+    """ Returns the number of items of the given query and the last
+    change of any of them, using a single aggregate query.
+
+    By default, the last change of the queried model is used, additional
+    columns may be passed for joined models, or scalar subqueries for
+    related models. Returns None if the queried model doesn't keep track
+    of changes.
+
+    """
+
+    if not last_changes:
+        model = query.column_descriptions[0]['entity']
+        if not hasattr(model, 'last_change'):
+            return None
+        last_changes = (model.last_change, )
+
+    count, *changes = query.order_by(None).with_entities(
+        func.count(),
+        *(func.max(column) for column in last_changes)
+    ).one()
+    return count, max((c for c in changes if c is not None), default=None)
+
+
 class ApiEndpointItem[M: DeclarativeBase, IdT: PKType]:
     """ A single instance of an item of a specific endpoint.
 
@@ -175,6 +254,9 @@ class ApiEndpoint[M: DeclarativeBase, IdT: PKType]:
     expected to be to provide the functionality of
     ``onegov.core.collection.Pagination``.
 
+    Endpoints are paginated by page, or by cursor if a cursor is given (an
+    empty cursor for the first batch), see :func:`keyset_batch`.
+
     """
 
     endpoint: str = ''
@@ -186,11 +268,13 @@ class ApiEndpoint[M: DeclarativeBase, IdT: PKType]:
         request: CoreRequest,
         extra_parameters: dict[str, list[str]] | None = None,
         page: int | None = None,
+        cursor: str | None = None,
     ):
         self.request = request
         self.app = request.app
         self.extra_parameters = extra_parameters or {}
         self.page = int(page) if page else page
+        self.cursor = cursor
         self.batch_size = 100
 
     @cached_property
@@ -224,6 +308,18 @@ class ApiEndpoint[M: DeclarativeBase, IdT: PKType]:
 
         return self.__class__(self.request, self.extra_parameters, page)
 
+    def for_cursor(self, cursor: str) -> Self:
+        """ Return a new endpoint instance with the given cursor while keeping
+        the current filters.
+
+        """
+
+        return self.__class__(
+            self.request,
+            self.extra_parameters,
+            cursor=cursor
+        )
+
     def for_filter(self, **filters: list[str]) -> Self:
         """ Return a new endpoint instance with the given filters while
         discarding the current filters and page.
@@ -323,16 +419,45 @@ class ApiEndpoint[M: DeclarativeBase, IdT: PKType]:
     def session(self) -> Session:
         return self.app.session()
 
+    @cached_property
+    def cached_collection(self) -> PaginationWithById[M, Any]:
+        return self.collection
+
+    @cached_property
+    def keyset(self) -> tuple[tuple[M, ...], str | None]:
+        """ The items following the cursor and the cursor of the next
+        batch, see :func:`keyset_batch`.
+
+        """
+        collection = self.cached_collection
+        if hasattr(collection, 'keyset_batch'):
+            # the collection knows best how to paginate itself
+            return collection.keyset_batch(self.cursor)
+
+        return keyset_batch(
+            collection.cached_subset,
+            self.cursor,
+            collection.batch_size,
+            getattr(collection, 'transform_batch_query', None)
+        )
+
     @property
     def links(self) -> dict[str, Self | None]:
         """ A dictionary with pagination instances. """
 
         result: dict[str, Self | None] = {'prev': None, 'next': None}
 
-        previous = self.collection.previous
+        if self.cursor is not None:
+            # cursors only go forward
+            __, cursor = self.keyset
+            if cursor:
+                result['next'] = self.for_cursor(cursor)
+            return result
+
+        previous = self.cached_collection.previous
         if previous:
             result['prev'] = self.for_page(previous.page)
-        next_ = self.collection.next
+        next_ = self.cached_collection.next
         if next_:
             result['next'] = self.for_page(next_.page)
         return result
@@ -340,10 +465,72 @@ class ApiEndpoint[M: DeclarativeBase, IdT: PKType]:
     @property
     def batch(self) -> dict[ApiEndpointItem[M, IdT], M]:
         """ A dictionary with endpoint item instances and their titles. """
-        return {
-            self.for_item(item): item
-            for item in self.collection.batch
-        }
+        if self.cursor is not None:
+            items, __ = self.keyset
+        else:
+            items = self.cached_collection.batch
+
+        return {self.for_item(item): item for item in items}
+
+    @property
+    def last_changes(self) -> tuple[LastChange, ...]:
+        """ The columns holding the last change of the items, used for the
+        :attr:`fingerprint`. Endpoints including data or links of related
+        models should add their last change as well.
+
+        Defaults to the last change of the queried model.
+
+        """
+        return ()
+
+    @cached_property
+    def fingerprint(self) -> Fingerprint | None:
+        """ The number of items and their last change, used to tell if
+        the endpoint changed. None if this can't be determined.
+
+        """
+        collection = self.cached_collection
+        if hasattr(collection, 'fingerprint'):
+            return collection.fingerprint
+        if not isinstance(collection, Pagination):
+            return None
+
+        fingerprint = query_fingerprint(
+            collection.cached_subset,
+            *self.last_changes
+        )
+        if fingerprint is not None:
+            # spare the pagination from counting the items again
+            vars(collection).setdefault('subset_count', fingerprint[0])
+        return fingerprint
+
+    @cached_property
+    def etag(self) -> str | None:
+        """ The entity tag of the current response, changes whenever the
+        items change or the response differs for the current client.
+
+        """
+        if self.fingerprint is None:
+            return None
+
+        count, last_change = self.fingerprint
+
+        # the settings of the organisation may change what is shown
+        org = getattr(self.app, 'org', None)
+        settings_change = getattr(org, 'last_change', None)
+
+        return hash_dictionary({
+            'version': self.app.version,
+            'url': self.request.url,
+            'locale': self.request.locale,
+            'role': getattr(self.request.identity, 'role', None),
+            'authorized': self.request.authorization is not None,
+            'count': count,
+            'last_change': last_change.isoformat() if last_change else None,
+            'settings_change': (
+                settings_change.isoformat() if settings_change else None
+            )
+        })
 
     def item_data(self, item: M) -> dict[str, Any]:
         """ Return the data properties of the collection item as a dictionary.
@@ -478,17 +665,21 @@ class ApiEndpoint[M: DeclarativeBase, IdT: PKType]:
     #       supports scalar values, but we want to support lists
     #       of values for extra_parameters.
     def __link_alias__(self) -> str:
+        query_params = MultiDict(
+            (key, value)
+            for key, values in self.extra_parameters.items()
+            for value in values
+        )
+        if self.cursor is not None:
+            query_params['cursor'] = self.cursor
+
         return self.request.class_link(
             self.__class__,
             {
                 'endpoint': self.endpoint,
                 'page': self.page,
             },
-            query_params=MultiDict(
-                (key, value)
-                for key, values in self.extra_parameters.items()
-                for value in values
-            )
+            query_params=query_params
         )
 
 
@@ -511,7 +702,8 @@ class ApiEndpointCollection:
             self,
             name: str,
             page: int = 0,
-            extra_parameters: dict[str, list[str]] | None = None
+            extra_parameters: dict[str, list[str]] | None = None,
+            cursor: str | None = None
     ) -> ApiEndpoint[Any, Any] | None:
         endpoint = self.endpoints.get(name)
         if endpoint is None:
@@ -519,7 +711,9 @@ class ApiEndpointCollection:
 
         if extra_parameters:
             endpoint = endpoint.for_filter(**extra_parameters)
-        if page:
+        if cursor is not None:
+            endpoint = endpoint.for_cursor(cursor)
+        elif page:
             endpoint = endpoint.for_page(page)
         return endpoint
 
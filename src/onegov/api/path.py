@@ -45,10 +45,16 @@ def get_api_endpoint(
     extra_parameters = request.GET.dict_of_lists()
     extra_parameters.pop('page', None)
 
+    # NOTE: An empty cursor is valid and requests the first batch, so we
+    #       have to distinguish it from a missing cursor
+    cursor = request.GET.get('cursor')
+    extra_parameters.pop('cursor', None)
+
     item = ApiEndpointCollection(request).get_endpoint(
         endpoint,
         page=page,
-        extra_parameters=extra_parameters
+        extra_parameters=extra_parameters,
+        cursor=cursor
     )
     if not item:
         raise ApiException('Not found', status_code=404)
@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import jwt
 
-from datetime import timedelta
 from functools import lru_cache
 from onegov.api import ApiApp
 from onegov.api.models import ApiException, ApiKey
 from onegov.api.token import try_get_encoded_token, jwt_decode
-from sedate import utcnow
+from onegov.core.rate_limit import client_address, RateLimit
 from webob.exc import HTTPUnauthorized, HTTPClientError
 
 
@@ -52,53 +51,42 @@ def is_authorized(request: CoreRequest) -> bool:
 
 
 def check_rate_limit(request: CoreRequest) -> dict[str, str]:
-    """ Checks if the rate limit for the current client.
+    """ Checks the rate limit for the current client.
 
     Raises an exception if the rate limit is reached. Returns response headers
     containing informations about the remaining rate limit.
 
-    Logged in users don't have rate limits. The same is true for users that
-    have authenticated with a token.
+    Logged in users don't have rate limits. Users that have authenticated
+    with a token are limited per token, all others per address.
 
     """
 
     if request.is_logged_in:
         return {}
 
-    if request.authorization:
-        authenticate(request)
-        return {}
-
     assert isinstance(request.app, ApiApp)
-    addr = request.client_addr or 'unknown'
-
-    limit, expiration = request.app.rate_limit
-    requests, timestamp = request.app.rate_limit_cache.get_or_create(
-        addr,
-        creator=lambda: (0, utcnow()),
-    )
-    if (utcnow() - timestamp).seconds < expiration:
-        requests += 1
+    if request.authorization:
+        api_key = authenticate(request)
+        result = request.app.rate_limiter.hit(
+            'api-token',
+            f'token:{api_key.id}',
+            RateLimit(*request.app.token_rate_limit)
+        )
     else:
-        timestamp = utcnow()
-        requests = 1
-    request.app.rate_limit_cache.set(
-        addr, (requests, timestamp)
-    )
-    reset = timestamp + timedelta(seconds=expiration)
-    headers = {
-        'X-RateLimit-Limit': str(limit),
-        'X-RateLimit-Remaining': str(max(limit - requests, 0)),
-        'X-RateLimit-Reset': reset.strftime('%a, %d %b %Y %H:%M:%S GMT')
-    }
+        result = request.app.rate_limiter.hit(
+            'api',
+            client_address(request),
+            RateLimit(*request.app.rate_limit)
+        )
+
+    headers = result.headers
 
     @request.after
     def add_headers(response: Response) -> None:
         for header in headers.items():
             response.headers.add(*header)
 
-    if requests > limit:
-        headers['Retry-After'] = headers['X-RateLimit-Reset']
+    if not result.allowed:
         raise ApiException(
             'Rate limit exceeded', status_code=429, headers=headers
         )
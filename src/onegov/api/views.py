@@ -9,7 +9,8 @@ from onegov.api.token import get_token
 from onegov.api.utils import authenticate, check_rate_limit
 from onegov.core.security import Public
 from onegov.form.fields import HoneyPotField
-from webob.exc import HTTPMethodNotAllowed, HTTPNotFound, HTTPUnauthorized
+from webob.exc import HTTPMethodNotAllowed, HTTPNotFound, HTTPNotModified
+from webob.exc import HTTPUnauthorized
 from wtforms import HiddenField
 
 
@@ -94,13 +95,25 @@ def view_api_endpoints(
 )
 def view_api_endpoint(
     self: ApiEndpoint[Any, Any], request: CoreRequest
-) -> dict[str, Any]:
+) -> dict[str, Any] | HTTPNotModified:
 
     headers = check_rate_limit(request)
 
+    with ApiException.capture_exceptions(headers=headers):
+        etag = self.etag
+        last_change = self.fingerprint[1] if self.fingerprint else None
+
     @request.after
     def add_headers(response: Response) -> None:
         response.headers['Content-Type'] = 'application/vnd.collection+json'
+        if etag is not None:
+            response.etag = (etag, False)
+        if last_change is not None:
+            response.last_modified = last_change
+
+    # harvesters may skip unchanged pages without us rendering them
+    if etag is not None and etag in request.if_none_match:
+        return HTTPNotModified()
 
     with ApiException.capture_exceptions(headers=headers):
         payload: dict[str, JSONObject] = {
@@ -11,6 +11,7 @@ from redis import ConnectionPool
 from typing import Any, TYPE_CHECKING
 if TYPE_CHECKING:
     from dogpile.cache.api import NoValue
+    from redis.lock import Lock
 
 
 def msgpack_deserialize(value: bytes | NoValue) -> Any:
@@ -77,6 +78,16 @@ class RedisCacheRegion(CacheRegion):
             return #keys
         """, 0, f'{self.namespace}:*')
 
+    def lock(self, key: str, timeout: float) -> Lock:
+        """ Returns a lock shared by all processes using this region. The
+        lock is released automatically after the given number of seconds.
+
+        """
+        return self.backend.writer_client.lock(
+            f'{self.namespace}:lock:{key}',
+            timeout=timeout
+        )
+
 
 # TODO: Remove these deprecated aliases
 keys = RedisCacheRegion.keys
@@ -850,6 +850,48 @@ def upgrade(
     return tuple(upgrade_steps())
 
 
+@cli.command(name='compile-themes', context_settings={
+    'default_selector': '*'
+})
+@click.option('--force', default=False, is_flag=True,
+              help='Compile the themes even if they exist already.')
+def compile_themes(force: bool) -> Callable[[CoreRequest, Framework], None]:
+    """ Compiles the themes of all selected applications ahead of time, so
+    the first request after a deploy doesn't have to.
+
+    Applications with identical theme options share their theme, it is
+    only compiled once. Use --jobs to compile them in parallel:
+
+        onegov-core --select '/onegov_org/*' --jobs 4 compile-themes
+
+    """
+
+    compiled = set()
+
+    def compile_theme(request: CoreRequest, app: Framework) -> None:
+        theme = app.settings.core.theme
+        if theme is None or app.themestorage is None:
+            return
+
+        options = app.theme_options
+        filename = app.modules.theme.get_filename(theme, options)
+        if filename in compiled:
+            force_compile = False
+        else:
+            force_compile = force
+            compiled.add(filename)
+
+        filename = app.modules.theme.compile(
+            app.themestorage, theme, options,
+            force=force_compile,
+            cache=app.theme_cache
+        )
+        app.theme_cache.set(app.application_id, filename)
+        click.echo(f'{app.application_id}: {filename}')
+
+    return compile_theme
+
+
 class EnhancedInteractiveConsole(InteractiveConsole):
     """ Wraps the InteractiveConsole with some basic shell features:
 
@@ -182,15 +182,37 @@ To do that, we use::
 If a selector is passed which matches more than one application, the command
 is not executed.
 
+Running Against Many Applications in Parallel
+---------------------------------------------
+
+Commands run against one application after the other by default. To spread
+the matching applications across multiple worker processes, we pass the
+number of workers before the subcommand::
+
+    bin/onegov-core --select '/onegov_town6/*' --jobs 8 upgrade
+
+Each application is handled in isolation. If it fails, the error is reported
+and the remaining applications are still handled. The output of each
+application is printed at once, when it is done. The command exits with a
+return code of 1 if any of the applications failed.
+
+Functions without a 'request' parameter are not run in parallel, they are
+called in the main process for all matching applications, before the others
+are handed to the workers.
+
 """
 from __future__ import annotations
 
 import click
 import inspect
 import logging.config
+import multiprocessing
 import sys
+import traceback
 
+from contextlib import redirect_stderr, redirect_stdout
 from fnmatch import fnmatch
+from io import StringIO
 from onegov.core.security import Public
 from onegov.core.utils import scan_morepath_modules
 from onegov.core.orm import query_schemas, DB_CONNECTION_ERRORS
@@ -226,6 +248,7 @@ if TYPE_CHECKING:
         creates_path: bool
         skip_search_indexing: bool
         logging: bool
+        jobs: int
 
     class ContextSpecificSettings(TypedDict, total=False):
         default_selector: str
@@ -380,6 +403,10 @@ class GroupContext(GroupContextGuard):
         Whether or not the application-level logging messages should be
         visible as part of the command's output.
 
+    :param jobs:
+        The number of worker processes the matching applications are
+        spread across. See :func:`run_processors`.
+
     """
 
     def __init__(
@@ -394,6 +421,7 @@ class GroupContext(GroupContextGuard):
         # FIXME: It might make more sense if this defaults to `False`
         #        But we will need to check which commands rely on logging
         logging: bool = True,
+        jobs: int = 1,
     ) -> None:
 
         if isinstance(config, dict):
@@ -405,6 +433,7 @@ class GroupContext(GroupContextGuard):
         self.creates_path = creates_path
         self.skip_search_indexing = skip_search_indexing
         self.logging = logging
+        self.jobs = max(jobs, 1)
 
         if self.creates_path:
             self.singular = True
@@ -575,6 +604,10 @@ def get_context_specific_settings(
 pass_group_context = click.make_pass_decorator(GroupContext, ensure=True)
 
 
+def expects_request(processor: Callable[..., Any]) -> bool:
+    return 'request' in processor.__code__.co_varnames
+
+
 def run_processors(
     group_context: GroupContext,
     processors: Sequence[Callable[..., Any]]
@@ -587,18 +620,42 @@ def run_processors(
     may go on to run forever without the additional overhead
     (e.g. to implement a spooler)
 
+    If the group context asks for multiple jobs, the matching applications
+    are spread across worker processes, see :func:`run_in_parallel`.
+
     """
 
     if not processors:
         return
 
+    matches = list(group_context.matches)
+    jobs = min(group_context.jobs, len(matches))
+
+    if jobs > 1:
+        run_in_parallel(group_context, processors, matches, jobs)
+        return
+
+    run = processors_runner(group_context, processors)
+
+    for match in matches:
+        run(match)
+
+
+def processors_runner(
+    group_context: GroupContext,
+    processors: Sequence[Callable[..., Any]]
+) -> Callable[[str], None]:
+    """ Loads all applications into a server and returns a function which
+    runs the given processors for a single match.
+
+    """
+
     # load all applications into the server
     view_path = uuid4().hex
     applications = []
 
     # NOTE: we initialize processor here, just to absolutely make sure
-    #       the variable exists in locals() when we go to look it up
-    #       below.
+    #       the variable exists when the view below looks it up
     processor = processors[0]
 
     CliApplication: type[Framework]  # ruff:ignore[non-lowercase-variable-in-function]
@@ -636,10 +693,10 @@ def run_processors(
 
         @CliApplication.view(model=Model, permission=Public)
         def run_command(self: Model, request: CoreRequest) -> None:
-            # NOTE: This is kind of fragile, this depends on the loop
-            #       variable 'processor' from the loop below, this works
-            #       because Python will look up the variable at the time
-            #       of the call and not when we define this function.
+            # NOTE: This is kind of fragile, this depends on the variable
+            #       'processor' which is set by the function below, this
+            #       works because Python will look up the variable at the
+            #       time of the call and not when we define this function.
             processor(request, request.app)
 
         @CliApplication.setting(section='cronjobs', name='enabled')
@@ -673,18 +730,16 @@ def run_processors(
         configure_logging=False
     )
 
-    def expects_request(processor: Callable[..., Any]) -> bool:
-        return 'request' in processor.__code__.co_varnames
+    client = Client(server)
 
     # call the matching applications
-    client = Client(server)
-    matches = list(group_context.matches)
+    def run(match: str) -> None:
+        nonlocal processor
 
-    for match in matches:
         for processor in processors:
             if expects_request(processor):
                 # FIXME: The way this works is a bit fragile, we depend
-                #        on the way Python looks up locals here, it would
+                #        on the way Python looks up closures here, it would
                 #        be better if we passed the index as a query param
                 path = group_context.match_to_path(match)
                 if path is None:
@@ -698,6 +753,100 @@ def run_processors(
 
                 processor(group_context, appcfg_)
 
+    return run
+
+
+#: The processors handed to the worker processes by :func:`run_in_parallel`.
+#: The worker processes are forked, so they inherit them without having to
+#: pickle them (they are usually closures).
+_parallel_processors: tuple[GroupContext, Sequence[Callable[..., Any]]]
+#: The runner of the current worker process, it's created on first use
+_worker_runner: Callable[[str], None] | None = None
+
+
+def run_match_in_worker(match: str) -> tuple[str, str, str | None]:
+    """ Runs the processors for a single match inside a worker process.
+
+    Returns the match, the captured output and the formatted traceback if
+    the processors failed.
+
+    """
+    global _worker_runner
+
+    output = StringIO()
+    error = None
+
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            if _worker_runner is None:
+                _worker_runner = processors_runner(*_parallel_processors)
+            _worker_runner(match)
+        except BaseException:
+            error = traceback.format_exc()
+
+    return match, output.getvalue(), error
+
+
+def run_in_parallel(
+    group_context: GroupContext,
+    processors: Sequence[Callable[..., Any]],
+    matches: Sequence[str],
+    jobs: int
+) -> None:
+    """ Runs the processors for each match in one of the given number of
+    worker processes, printing the progress and the output of each match.
+
+    Processors without a request are run in the main process first, since
+    they usually handle all applications of a config at once.
+
+    Aborts with a return code of 1 if any of the matches failed.
+
+    """
+    global _parallel_processors
+
+    raw_processors = [p for p in processors if not expects_request(p)]
+    for match in matches:
+        appcfg = group_context.match_to_appcfg(match)
+        if appcfg is None:
+            continue
+
+        for processor in raw_processors:
+            processor(group_context, appcfg)
+
+    processors = [p for p in processors if expects_request(p)]
+    if not processors:
+        return
+
+    _parallel_processors = (group_context, processors)
+
+    total = len(matches)
+    failed = []
+
+    click.secho(f'Running {total} applications in {jobs} jobs')
+
+    pool = multiprocessing.get_context('fork').Pool(jobs)
+    try:
+        results = pool.imap_unordered(run_match_in_worker, matches)
+        for done, (match, output, error) in enumerate(results, start=1):
+            if output:
+                click.echo(output, nl=False)
+
+            if error:
+                failed.append(match)
+                click.echo(error, err=True, nl=False)
+                click.secho(f'[{done}/{total}] {match} failed', fg='red')
+            else:
+                click.secho(f'[{done}/{total}] {match}', fg='green')
+    finally:
+        pool.terminate()
+        pool.join()
+
+    if failed:
+        abort('\n'.join((
+            f'{len(failed)} of {total} applications failed:',
+            *(f' - {match}' for match in sorted(failed))
+        )))
+
 
 def command_group() -> click.Group:
     """ Generates a click command group for individual modules.
@@ -723,11 +872,15 @@ def command_group() -> click.Group:
     @click.option(
         '--config', default='onegov.yml',
         help='The onegov config file')
-    def command_group(select: str | None, config: str) -> None:
+    @click.option(
+        '--jobs', default=1, type=int,
+        help='The number of applications handled in parallel')
+    def command_group(select: str | None, config: str, jobs: int) -> None:
         try:
             context = click.get_current_context()
             context_settings = get_context_specific_settings(context)
-            context.obj = GroupContext(select, config, **context_settings)
+            context.obj = GroupContext(
+                select, config, jobs=jobs, **context_settings)
             context.obj.validate_guard_conditions(context)
             if context.obj.logging:
                 context.obj.config.logging.setdefault('version', 1)
@@ -740,7 +893,8 @@ def command_group() -> click.Group:
     def process_results(
         processor: Callable[..., Any] | Sequence[Callable[..., Any]],
         select: str,
-        config: str
+        config: str,
+        jobs: int
     ) -> None:
         """ Calls the function returned by the command once for each
         application matching the selector.
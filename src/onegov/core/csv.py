@@ -11,6 +11,7 @@ import xlrd
 from xlrd.biffh import XLRDError
 
 from collections import namedtuple, OrderedDict
+from collections.abc import Sequence
 from csv import DictWriter, Sniffer, QUOTE_ALL
 from csv import Error as CsvError
 from csv import reader as csv_reader
@@ -18,7 +19,7 @@ from csv import writer as csv_writer
 from datetime import datetime
 from functools import lru_cache
 from io import BytesIO, StringIO, TextIOWrapper
-from itertools import permutations
+from itertools import chain, islice, permutations
 from onegov.core import errors
 from ordered_set import OrderedSet
 from rapidfuzz.distance import Levenshtein
@@ -31,9 +32,12 @@ from typing import overload, Any, IO, TYPE_CHECKING
 if TYPE_CHECKING:
     from _typeshed import SupportsRichComparison
     from collections.abc import (
-        Callable, Collection, Iterable, Iterator, Sequence)
+        Callable, Collection, Generator, Iterable, Iterator)
     from csv import Dialect
-    from openpyxl.worksheet.worksheet import Worksheet
+    from openpyxl.cell.read_only import EmptyCell, ReadOnlyCell
+    from openpyxl.worksheet._read_only import ReadOnlyWorksheet
+    from xlsxwriter.worksheet import Worksheet as XlsxWorksheet
+    from xlrd.sheet import Cell as XLSCell
     from typing import Protocol
 
     class _RowConstructor[T_co](Protocol):
@@ -52,6 +56,10 @@ VALID_CSV_DELIMITERS = ',;\t'
 WHITESPACE = re.compile(r'\s+')
 INVALID_XLSX_TITLE = re.compile(r'[\\*?:/\[\]]')
 
+#: the number of rows sampled to infer the headers of exports which consume
+#: their rows only once, and the column widths of xlsx exports
+SAMPLE_SIZE = 1000
+
 small_chars = 'fijlrt:,;.+i '
 large_chars = 'GHMWQ_'
 
@@ -147,12 +155,21 @@ class CSVFile[RowT = DefaultRow]:
         # match the headers
         self.csvfile.seek(0)
 
-        # if no expected headers expect, we just take what we can get
         headers = parse_header(
             self.csvfile.readline(),
             self.dialect,
             rename_duplicate_column_names
         )
+        self._setup_headers(headers, expected_headers, rowtype)
+
+    def _setup_headers(
+        self,
+        headers: list[str],
+        expected_headers: Collection[str] | None,
+        rowtype: _RowConstructor[RowT] | None
+    ) -> None:
+
+        # if no expected headers expect, we just take what we can get
         expected_headers = expected_headers or headers
 
         self.headers = OrderedDict(
@@ -190,10 +207,12 @@ class CSVFile[RowT = DefaultRow]:
     @property
     def lines(self) -> Iterator[RowT]:
         self.csvfile.seek(0)
+        yield from self._lines(csv_reader(self.csvfile, self.dialect))
 
+    def _lines(self, rows: Iterable[Sequence[str]]) -> Iterator[RowT]:
         encountered_empty_line = False
 
-        for ix, line in enumerate(csv_reader(self.csvfile, self.dialect)):
+        for ix, line in enumerate(rows):
 
             # raise an empty line error if we found one somewhere in the
             # middle -> at the end they don't count
@@ -217,6 +236,84 @@ class CSVFile[RowT = DefaultRow]:
             )
 
 
+class ExcelFile[RowT = DefaultRow](CSVFile[RowT]):
+    """ Provides access to a worksheet of an xls/xlsx file, just like
+    :class:`CSVFile` does for csv files.
+
+    The rows are read from the worksheet directly instead of converting the
+    file to csv first. Xlsx files are opened read-only, so their rows are
+    streamed and even large files are read with bounded memory.
+
+    :param excelfile:
+        The excel file to be accessed. Must be an open file (not a path),
+        opened in binary mode.
+
+    :param sheet_name:
+        The name of the worksheet to be accessed. By default, the first
+        worksheet is used.
+
+    The other parameters work like the ones of :class:`CSVFile`.
+
+    The first iteration of the lines continues reading the worksheet where
+    the headers were read, later iterations open the worksheet again. Use
+    :meth:`load` to read the worksheet only once and keep its lines.
+
+    """
+
+    def __init__(
+        self,
+        excelfile: IO[bytes],
+        expected_headers: Collection[str] | None = None,
+        sheet_name: str | None = None,
+        rename_duplicate_column_names: bool = False,
+        rowtype: _RowConstructor[RowT] | None = None
+    ) -> None:
+
+        self.excelfile = excelfile
+        self.sheet_name = sheet_name
+        self.loaded: tuple[RowT, ...] | None = None
+
+        rows = self.rows()
+        header = next(rows, None)
+
+        if header is None:
+            rows.close()
+            raise errors.EmptyFileError()
+
+        try:
+            headers = normalize_headers(header, rename_duplicate_column_names)
+            self._setup_headers(headers, expected_headers, rowtype)
+        except BaseException:
+            rows.close()
+            raise
+
+        self.pending: Iterator[list[str]] | None = chain((header, ), rows)
+
+    def rows(self) -> Generator[list[str]]:
+        """ Opens the worksheet and returns its rows as lists of strings. """
+        return excel_rows(self.excelfile, self.sheet_name)
+
+    def load(self) -> tuple[RowT, ...]:
+        """ Reads all the lines at once, raising any errors right away.
+
+        The lines are kept in memory and returned by any further iterations,
+        without reading the worksheet again.
+
+        """
+        if self.loaded is None:
+            self.loaded = tuple(self.lines)
+        return self.loaded
+
+    @property
+    def lines(self) -> Iterator[RowT]:
+        if self.loaded is not None:
+            yield from self.loaded
+            return
+
+        rows, self.pending = self.pending, None
+        yield from self._lines(rows if rows is not None else self.rows())
+
+
 def detect_encoding(csvfile: IO[bytes]) -> str:
     """ Since encoding detection is hard to get right (and work correctly
     every time), we limit ourselves here to UTF-8 or CP1252, whichever works
@@ -277,80 +374,83 @@ def normalize_header(header: str) -> str:
     return header
 
 
-def convert_xlsx_to_csv(
+def xlsx_rows(
     xlsx: IO[bytes],
     sheet_name: str | None = None
-) -> BytesIO:
-    """ Takes an XLS file and returns a csv file using the given worksheet
-    name or the first worksheet found.
+) -> Generator[list[str]]:
+    """ Takes an XLSX file and returns the non-empty rows of the given
+    worksheet name or the first worksheet found as lists of strings.
+
+    The workbook is opened read-only, the rows are streamed from the file
+    while they are consumed. The file is opened right away, so invalid
+    files and missing sheets raise before the first row is read.
 
     """
 
     xlsx.seek(0)
 
     try:
-        excel = openpyxl.load_workbook(xlsx, data_only=True)
+        excel = openpyxl.load_workbook(xlsx, read_only=True, data_only=True)
     except Exception as exception:
         raise OSError('Could not read XLSX file') from exception
 
-    sheet: Worksheet
+    sheet: ReadOnlyWorksheet
     if sheet_name:
         try:
-            sheet = excel[sheet_name]
+            sheet = excel[sheet_name]  # type: ignore[assignment]
         except KeyError as exception:
+            excel.close()
             raise KeyError(
                 'Could not find the given sheet in this excel file!'
             ) from exception
     else:
-        sheet = excel.worksheets[0]
+        sheet = excel.worksheets[0]  # type: ignore[assignment]
 
-    # FIXME: We should probably do this check at runtime eventually since
-    # Workbook[name] might return a Worksheet, ReadOnlyWorksheet or a
-    # a WriteOnlyWorksheet. Workbook.worksheet[index] might additionaly return
-    # a Chartsheet.
-    if TYPE_CHECKING:
-        assert isinstance(sheet, Worksheet)
+    # the dimensions stored in the file are not always reliable, without
+    # them the rows end with their last cell, so we pad them ourselves
+    sheet.reset_dimensions()
 
-    output = TextIOWrapper(
-        BytesIO(),
-        encoding='utf-8',
-        newline='',
-        write_through=True
-    )
-    writecsv = csv_writer(output, quoting=QUOTE_ALL)
+    def rows() -> Generator[list[str]]:
+        width = 0
 
-    for row in range(1, sheet.max_row + 1):
-        values = []
-
-        for column in range(1, sheet.max_column + 1):
-            cell = sheet.cell(row, column)
-
-            if cell.value is None:
-                value = ''
-            elif cell.data_type == 's':
-                value = cell.value  # type:ignore[assignment]
-            elif cell.data_type == 'n':
-                if (int_value := int(cell.value)) == cell.value:  # type:ignore
-                    value = str(int_value)
-                else:
-                    value = str(cell.value)
-            elif cell.data_type == 'd':
-                value = cell.value.isoformat()  # type:ignore[union-attr]
-            elif cell.data_type == 'b':
-                value = '1' if cell.value else '0'
-            else:
-                raise NotImplementedError
+        try:
+            for row in sheet.iter_rows():
+                values = [xlsx_cell_value(cell) for cell in row]
 
-            values.append(value)
+                if not any(values):
+                    continue
 
-        if any(values):
-            writecsv.writerow(values)
+                width = max(width, len(values))
+                values.extend('' for _ in range(width - len(values)))
+                yield values
+        finally:
+            excel.close()
 
-    return output.detach()
+    return rows()
 
 
-def convert_xls_to_csv(
-    xls: IO[bytes],
+def xlsx_cell_value(cell: ReadOnlyCell | EmptyCell) -> str:
+    """ Returns the value of the given XLSX cell as string. """
+
+    if cell.value is None:
+        return ''
+    elif cell.data_type == 's':
+        return cell.value  # type:ignore[return-value]
+    elif cell.data_type == 'n':
+        if (int_value := int(cell.value)) == cell.value:  # type:ignore
+            return str(int_value)
+        else:
+            return str(cell.value)
+    elif cell.data_type == 'd':
+        return cell.value.isoformat()  # type:ignore[union-attr]
+    elif cell.data_type == 'b':
+        return '1' if cell.value else '0'
+    else:
+        raise NotImplementedError
+
+
+def convert_xlsx_to_csv(
+    xlsx: IO[bytes],
     sheet_name: str | None = None
 ) -> BytesIO:
     """ Takes an XLS file and returns a csv file using the given worksheet
@@ -358,6 +458,21 @@ def convert_xls_to_csv(
 
     """
 
+    return write_rows_to_csv(xlsx_rows(xlsx, sheet_name))
+
+
+def xls_rows(
+    xls: IO[bytes],
+    sheet_name: str | None = None
+) -> Generator[list[str]]:
+    """ Takes an XLS file and returns the rows of the given worksheet name
+    or the first worksheet found as lists of strings.
+
+    Unlike XLSX files, XLS files can't be streamed, the whole workbook is
+    read into memory.
+
+    """
+
     xls.seek(0)
 
     try:
@@ -375,6 +490,49 @@ def convert_xls_to_csv(
     else:
         sheet = excel.sheet_by_index(0)
 
+    def value(cell: XLSCell) -> str:
+        if cell.ctype == xlrd.XL_CELL_TEXT:
+            return cell.value
+        elif cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+            return ''
+        elif cell.ctype == xlrd.XL_CELL_NUMBER:
+            number = float(cell.value)
+            if number.is_integer():
+                return str(int(number))
+            else:
+                return str(number)
+        elif cell.ctype == xlrd.XL_CELL_DATE:
+            date_tuple = xlrd.xldate_as_tuple(
+                float(cell.value), excel.datemode
+            )
+            return datetime(*date_tuple).isoformat()
+        elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
+            return str(cell.value)
+        else:
+            raise NotImplementedError
+
+    def rows() -> Generator[list[str]]:
+        for rownum in range(sheet.nrows):
+            yield [value(cell) for cell in sheet.row(rownum)]
+
+    return rows()
+
+
+def convert_xls_to_csv(
+    xls: IO[bytes],
+    sheet_name: str | None = None
+) -> BytesIO:
+    """ Takes an XLS file and returns a csv file using the given worksheet
+    name or the first worksheet found.
+
+    """
+
+    return write_rows_to_csv(xls_rows(xls, sheet_name))
+
+
+def write_rows_to_csv(rows: Iterable[Sequence[str]]) -> BytesIO:
+    """ Writes the given rows to an in-memory csv file. """
+
     output = TextIOWrapper(
         BytesIO(),
         encoding='utf-8',
@@ -382,37 +540,24 @@ def convert_xls_to_csv(
         write_through=True
     )
     writecsv = csv_writer(output, quoting=QUOTE_ALL)
+    writecsv.writerows(rows)
 
-    for rownum in range(sheet.nrows):
-        values = []
-
-        for cell in sheet.row(rownum):
-
-            if cell.ctype == xlrd.XL_CELL_TEXT:
-                value = cell.value
-            elif cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
-                value = ''
-            elif cell.ctype == xlrd.XL_CELL_NUMBER:
-                number = float(cell.value)
-                if number.is_integer():
-                    value = str(int(number))
-                else:
-                    value = str(number)
-            elif cell.ctype == xlrd.XL_CELL_DATE:
-                date_tuple = xlrd.xldate_as_tuple(
-                    float(cell.value), excel.datemode
-                )
-                value = datetime(*date_tuple).isoformat()
-            elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
-                value = str(cell.value)
-            else:
-                raise NotImplementedError
+    return output.detach()
 
-            values.append(value)
 
-        writecsv.writerow(values)
+def excel_rows(
+    file: IO[bytes],
+    sheet_name: str | None = None
+) -> Generator[list[str]]:
+    """ Takes an XLS/XLSX file and returns the rows of the given worksheet
+    name or the first worksheet found as lists of strings.
 
-    return output.detach()
+    """
+
+    try:
+        return xlsx_rows(file, sheet_name)
+    except OSError:
+        return xls_rows(file, sheet_name)
 
 
 def convert_excel_to_csv(
@@ -543,6 +688,44 @@ def convert_list_of_dicts_to_csv(
     return output.read()
 
 
+def convert_list_of_dicts_to_csv_file(
+    rows: Iterable[dict[str, Any]],
+    fields: Sequence[str] | None = None,
+    key: KeyFunc[str] | None = None,
+    reverse: bool = False,
+    sample_size: int = SAMPLE_SIZE
+) -> IO[bytes]:
+    """ Takes an iterable of dictionaries and returns a temporary file
+    containing the utf-8 encoded csv.
+
+    Unlike :func:`convert_list_of_dicts_to_csv`, the rows are consumed only
+    once and written to disk as they come, so generators of any size may be
+    exported with bounded memory. If no fields are provided, they are taken
+    from all rows of sequences. For other iterables they are taken from the
+    first rows (see ``sample_size``), keys only found in later rows are not
+    exported in this case.
+
+    """
+
+    sample, all_rows = sample_rows(rows, sample_size)
+    fields = fields or get_keys_from_sampled_rows(rows, sample, key, reverse)
+
+    file = tempfile.TemporaryFile()  # ruff:ignore[open-file-with-context-handler]
+    output = TextIOWrapper(file, encoding='utf-8', newline='')
+
+    if sample:
+        writer = DictWriter(output, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(
+            {field: row.get(field, '') for field in fields}
+            for row in all_rows
+        )
+
+    output.detach()
+    file.seek(0)
+    return file
+
+
 def convert_list_of_dicts_to_xlsx(
     rows: Iterable[dict[str, Any]],
     fields: Sequence[str] | None = None,
@@ -555,45 +738,41 @@ def convert_list_of_dicts_to_xlsx(
 
     """
 
-    with tempfile.NamedTemporaryFile() as file:
-        workbook = Workbook(file.name, options={'constant_memory': True})
-        cellformat = workbook.add_format({'text_wrap': True})
-
-        worksheet = workbook.add_worksheet()
-
-        fields_ = fields or get_keys_from_list_of_dicts(rows, key, reverse)
-
-        # write the header
-        worksheet.write_row(0, 0, fields_, cellformat)
-
-        # keep track of the maximum character width
-        column_widths = [estimate_width(field) for field in fields_]
+    fields = fields or get_keys_from_list_of_dicts(rows, key, reverse)
 
-        def values(row: dict[str, Any]) -> Iterator[str]:
-            for ix, field in enumerate(fields_):
-                value = row.get(field, '')
-                column_widths[ix] = max(
-                    column_widths[ix],
-                    estimate_width(str(value))
-                )
+    with convert_list_of_dicts_to_xlsx_file(rows, fields) as file:
+        return file.read()
 
-                if isinstance(value, str):
-                    value = value.replace('\r', '')
 
-                yield value
+def convert_list_of_dicts_to_xlsx_file(
+    rows: Iterable[dict[str, Any]],
+    fields: Sequence[str] | None = None,
+    key: KeyFunc[str] | None = None,
+    reverse: bool = False,
+    sample_size: int = SAMPLE_SIZE
+) -> IO[bytes]:
+    """ Takes an iterable of dictionaries and returns a temporary file
+    containing the xlsx.
 
-        # write the rows
-        for r, row in enumerate(rows, start=1):
-            worksheet.write_row(r, 0, values(row), cellformat)
+    This behaves the same way as :func:`convert_list_of_dicts_to_csv_file`.
 
-        # set the column widths
-        for col, width in enumerate(column_widths):
-            worksheet.set_column(col, col, width)
+    """
 
-        workbook.close()
+    file = tempfile.NamedTemporaryFile()  # ruff:ignore[open-file-with-context-handler]
+    workbook = Workbook(file.name, options={'constant_memory': True})
+    write_list_of_dicts_to_worksheet(
+        workbook,
+        workbook.add_worksheet(),
+        rows,
+        fields,
+        key,
+        reverse,
+        sample_size
+    )
+    workbook.close()
 
-        file.seek(0)
-        return file.read()
+    file.seek(0)
+    return file
 
 
 def convert_list_of_list_of_dicts_to_xlsx(
@@ -614,45 +793,98 @@ def convert_list_of_list_of_dicts_to_xlsx(
         if key_list is None:
             key_list = [None] * len(titles_list)
         for rows, title, key in zip(row_list, titles_list, key_list):
+            write_list_of_dicts_to_worksheet(
+                workbook,
+                workbook.add_worksheet(title),
+                rows,
+                get_keys_from_list_of_dicts(rows, key, reverse)
+            )
 
-            cellformat = workbook.add_format({'text_wrap': True})
-            worksheet = workbook.add_worksheet(title)
-            fields = get_keys_from_list_of_dicts(rows, key, reverse)
+        workbook.close()
+        file.seek(0)
+        return file.read()
 
-            # write the header
-            worksheet.write_row(0, 0, fields, cellformat)
 
-            # keep track of the maximum character width
-            column_widths = [estimate_width(field) for field in fields]
+def write_list_of_dicts_to_worksheet(
+    workbook: Workbook,
+    worksheet: XlsxWorksheet,
+    rows: Iterable[dict[str, Any]],
+    fields: Sequence[str] | None = None,
+    key: KeyFunc[str] | None = None,
+    reverse: bool = False,
+    sample_size: int = SAMPLE_SIZE
+) -> None:
+    """ Writes the given dictionaries to the given worksheet, consuming them
+    only once.
 
-            def values(
-                row: dict[str, Any],
-                fields: tuple[str, ...] = fields,
-                column_widths: list[float] = column_widths
-            ) -> Iterator[str]:
-                for ix, field in enumerate(fields):
-                    value = row.get(field, '')
-                    column_widths[ix] = max(
-                        column_widths[ix],
-                        estimate_width(str(value))
-                    )
+    If no fields are provided, they are taken from all rows of sequences,
+    or from the first rows of other iterables. The column widths are
+    estimated using the first rows.
 
-                    if isinstance(value, str):
-                        value = value.replace('\r', '')
+    """
 
-                    yield value
+    cellformat = workbook.add_format({'text_wrap': True})
 
-            # write the list_of_rows
-            for r, row in enumerate(rows, start=1):
-                worksheet.write_row(r, 0, values(row), cellformat)
+    sample, all_rows = sample_rows(rows, sample_size)
+    fields = fields or get_keys_from_sampled_rows(rows, sample, key, reverse)
 
-            # set the column widths
-            for col, width in enumerate(column_widths):
-                worksheet.set_column(col, col, width)
+    # write the header
+    worksheet.write_row(0, 0, fields, cellformat)
 
-        workbook.close()
-        file.seek(0)
-        return file.read()
+    # set the column widths using the sampled rows
+    for col, field in enumerate(fields):
+        width = max(
+            (estimate_width(str(row.get(field, ''))) for row in sample),
+            default=0
+        )
+        worksheet.set_column(col, col, max(estimate_width(field), width))
+
+    def values(row: dict[str, Any]) -> Iterator[Any]:
+        for field in fields:
+            value = row.get(field, '')
+
+            if isinstance(value, str):
+                value = value.replace('\r', '')
+
+            yield value
+
+    # write the rows
+    for r, row in enumerate(all_rows, start=1):
+        worksheet.write_row(r, 0, values(row), cellformat)
+
+
+def sample_rows[T](
+    rows: Iterable[T],
+    size: int = SAMPLE_SIZE
+) -> tuple[list[T], Iterator[T]]:
+    """ Takes the first rows of the given iterable as a sample. Returns the
+    sample and an iterator over all rows, the sample included.
+
+    """
+
+    iterator = iter(rows)
+    sample = list(islice(iterator, size))
+    return sample, chain(sample, iterator)
+
+
+def get_keys_from_sampled_rows(
+    rows: Iterable[dict[str, Any]],
+    sample: list[dict[str, Any]],
+    key: KeyFunc[str] | None = None,
+    reverse: bool = False
+) -> tuple[str, ...]:
+    """ Returns the keys of the given rows, see
+    :func:`get_keys_from_list_of_dicts`.
+
+    Rows which are already in memory are inspected completely, since later
+    rows may have additional keys. Other iterables can only be consumed
+    once, so just the sampled rows are inspected.
+
+    """
+
+    if isinstance(rows, Sequence):
+        return get_keys_from_list_of_dicts(rows, key, reverse)
+    return get_keys_from_list_of_dicts(sample, key, reverse)
 
 
 def normalize_sheet_titles(titles: Sequence[str]) -> list[str]:
@@ -751,10 +983,25 @@ def parse_header(
     except errors.EmptyFileError:
         return []
 
-    headers = next(csv_reader(
-        csv.splitlines(),
-        dialect=dialect  # type: ignore[arg-type]
-    ))
+    return normalize_headers(
+        next(csv_reader(
+            csv.splitlines(),
+            dialect=dialect  # type: ignore[arg-type]
+        )),
+        rename_duplicate_column_names
+    )
+
+
+def normalize_headers(
+    headers: Iterable[str],
+    rename_duplicate_column_names: bool = False
+) -> list[str]:
+    """ Normalizes the given headers, see :func:`normalize_header`, and
+    drops the empty ones.
+
+    Duplicate headers are renamed with a suffix if requested.
+
+    """
     headers = [normalize_header(h) for h in headers if h]
 
     if rename_duplicate_column_names:
@@ -49,7 +49,7 @@ from more.webassets.core import webassets_injector_tween
 from more.webassets.tweens import METHODS, CONTENT_TYPES
 from reg import ClassIndex
 
-from onegov.core import cache, log, utils
+from onegov.core import cache, log, rate_limit, utils
 from onegov.core import directives
 from onegov.core.crypto import stored_random_token
 from onegov.core.datamanager import FileDataManager
@@ -67,6 +67,7 @@ from purl import URL
 from sqlalchemy.exc import OperationalError
 from urllib.parse import urlencode
 from webob.exc import HTTPConflict, HTTPServiceUnavailable
+from webob.exc import HTTPTooManyRequests
 
 
 from typing import overload, Any, Literal, TYPE_CHECKING
@@ -242,6 +243,7 @@ class Framework(
 
     def clear_request_cache(self) -> None:
         self.request_cache = {}
+        self.orm_cache_timestamps = None
 
     # FIXME: This is really bad for static type checking, we need to be
     #        really vigilant to import the actual module in TYPE_CHECKING
@@ -720,6 +722,27 @@ class Framework(
             if not self.is_orm_cache_setup:
                 self.setup_orm_cache()
 
+    @cache.instance_lru_cache(maxsize=4096)
+    def class_path_url(
+        self,
+        model: type[Any],
+        variables: tuple[tuple[str, type[Any], Any], ...],
+        name: str,
+        prefix: str
+    ) -> str | None:
+        """ Returns the url to the view of the given model class, without
+        the host. Returns None if the model has no path in this application.
+
+        The variables are passed as a tuple of (name, type, value), so the
+        urls can be cached across requests. See
+        :meth:`onegov.core.request.CoreRequest.link`.
+
+        """
+        info = self._class_path(model, {
+            key: value for key, _type, value in variables
+        })
+        return None if info is None else info.url(prefix, name)
+
     def get_cache(
         self,
         name: str,
@@ -743,6 +766,30 @@ class Framework(
         """ A cache that might be invalidated frequently. """
         return self.get_cache('short-term', expiration_time=3600)
 
+    @property
+    def rate_limiter(self) -> rate_limit.RateLimiter:
+        """ The rate limits of the clients of this application, see
+        :mod:`onegov.core.rate_limit`.
+
+        """
+        return rate_limit.get(
+            namespace=f'{self.application_id}:rate-limits',
+            redis_url=self.redis_url
+        )
+
+    @property
+    def theme_cache(self) -> cache.RedisCacheRegion:
+        """ A cache shared by all applications, used to coordinate the
+        compilation of themes.
+
+        """
+        day = 60 * 60 * 24
+        return cache.get(
+            namespace='global-theme',
+            expiration_time=30 * day,
+            redis_url=self.redis_url
+        )
+
     @property
     def settings(self) -> SettingRegistry:
         return self.config.setting_registry
@@ -1645,6 +1692,12 @@ def get_retry_attempts() -> int:
     return 2
 
 
+@Framework.setting(section='rate_limits', name='rules')
+def get_rate_limit_rules() -> tuple[rate_limit.RateLimitRule, ...]:
+    """ The paths limited by :func:`rate_limit_tween_factory`. """
+    return ()
+
+
 @Framework.setting(section='cronjobs', name='enabled')
 def get_cronjobs_enabled() -> bool:
     """ If this value is set to False, all cronjobs are disabled. Only use
@@ -1774,6 +1827,45 @@ def http_conflict_tween_factory(
     return http_conflict_tween
 
 
+@Framework.tween_factory(over=transaction_tween_factory)
+def rate_limit_tween_factory(
+    app: Framework,
+    handler: Callable[[CoreRequest], Response]
+) -> Callable[[CoreRequest], Response]:
+
+    rules: tuple[rate_limit.RateLimitRule, ...] = (
+        app.settings.rate_limits.rules)
+
+    if not rules:
+        return handler
+
+    def rate_limit_tween(request: CoreRequest) -> Response:
+        """ Limits the rate of anonymous requests to the paths of the
+        configured rules, per client address.
+
+        Blocked requests are answered with 429 Too Many Requests, before
+        any work is done.
+
+        """
+
+        path = request.path_info or '/'
+        rule = next((rule for rule in rules if rule.matches(path)), None)
+        if rule is None or request.is_logged_in:
+            return handler(request)
+
+        result = app.rate_limiter.hit(
+            rule.name, rate_limit.client_address(request), rule.limit)
+
+        if not result.allowed:
+            return HTTPTooManyRequests(headers=result.headers)
+
+        response = handler(request)
+        response.headers.update(result.headers)
+        return response
+
+    return rate_limit_tween
+
+
 @Framework.tween_factory(over=transaction_tween_factory)
 def activate_session_manager_factory(
     app: Framework,
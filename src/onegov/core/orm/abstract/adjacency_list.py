@@ -6,7 +6,7 @@ from itertools import chain
 from lazy_object_proxy import Proxy  # type:ignore[import-untyped]
 from onegov.core.orm import Base, observes
 from onegov.core.utils import is_sorted, normalize_for_url, increment_name
-from sqlalchemy import ForeignKey, Numeric
+from sqlalchemy import event, func, inspect, update, ForeignKey, Numeric
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import (
@@ -14,9 +14,10 @@ from sqlalchemy.orm import (
     mapped_column,
     relationship,
     validates,
-    Mapped
+    Mapped,
+    Session
 )
-from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.orm.attributes import get_history, set_committed_value
 from sqlalchemy.schema import Index
 from sqlalchemy.sql.expression import column, nullsfirst
 
@@ -25,7 +26,7 @@ from typing import overload, Any, Literal, TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterator, Sequence
     from sqlalchemy.orm.query import Query
-    from sqlalchemy.orm.session import Session
+    from sqlalchemy.orm.unitofwork import UOWTransaction
     from typing import Self
     from _typeshed import SupportsRichComparison
 
@@ -121,6 +122,14 @@ class AdjacencyList(Base):
             back_populates='children'
         )
 
+    #: the path of the item, i.e. the names of all the ancestors and the
+    #: item itself joined by slashes, this is maintained automatically
+    #: whenever an item is added, renamed or moved to another parent
+    #:
+    #: use :attr:`path` to access the path, since this may be outdated for
+    #: items which haven't been flushed yet
+    materialized_path: Mapped[str | None]
+
     #: the order of the items - items are added at the end by default
     # FIXME: This should probably have been nullable=False
     order: Mapped[Decimal] = mapped_column(
@@ -162,6 +171,12 @@ class AdjacencyList(Base):
                 prefix + '_order',
                 nullsfirst('parent_id'),  # type:ignore[arg-type]
                 nullsfirst('"order"')  # type:ignore[arg-type]
+            ),
+
+            # lookups by path and prefix (for descendants)
+            Index(
+                prefix + '_materialized_path', 'materialized_path',
+                postgresql_ops={'materialized_path': 'text_pattern_ops'}
             )
         )
 
@@ -242,17 +257,51 @@ class AdjacencyList(Base):
     @property
     def root(self) -> AdjacencyList:
         """ The root of this item. """
-        if self.parent is None:
+        if self.parent_id is None and self.parent is None:
             return self
-        else:
+
+        if not self.has_stored_path:
+            assert self.parent is not None
             return self.parent.root
 
+        session = object_session(self)
+        assert session is not None
+        cls = self.base_class
+        root_path = self.path.split('/', 1)[0]
+        return session.query(cls).filter(
+            cls.materialized_path == root_path).one()
+
     @property
     def ancestors(self) -> Iterator[AdjacencyList]:
-        """ All ancestors of this item. """
-        if self.parent:
+        """ All ancestors of this item, starting with the root. """
+        if self.parent_id is None and self.parent is None:
+            return
+
+        if not self.has_stored_path:
+            assert self.parent is not None
             yield from self.parent.ancestors
             yield self.parent
+            return
+
+        session = object_session(self)
+        assert session is not None
+        cls = self.base_class
+        names = self.path.split('/')[:-1]
+        paths = ['/'.join(names[:ix]) for ix in range(1, len(names) + 1)]
+        yield from session.query(cls).filter(
+            cls.materialized_path.in_(paths)
+        ).order_by(func.length(cls.materialized_path))
+
+    @property
+    def descendants(self) -> Query[Self]:
+        """ A query including all the descendants of this item. """
+        session = object_session(self)
+        assert session is not None
+
+        cls = self.base_class
+        return session.query(cls).filter(  # type: ignore[return-value]
+            cls.materialized_path.startswith(f'{self.path}/', autoescape=True)
+        )
 
     @property
     def siblings(self) -> Query[Self]:
@@ -273,15 +322,78 @@ class AdjacencyList(Base):
 
         return query
 
+    @property
+    def base_class(self) -> type[AdjacencyList]:
+        """ The polymorphic base class of this item. """
+        return inspect(self.__class__).base_mapper.class_
+
+    @property
+    def has_stored_path(self) -> bool:
+        """ True if the :attr:`materialized_path` reflects the current
+        name and parent of this item and of all its ancestors.
+
+        """
+        if not self.has_own_stored_path:
+            return False
+
+        session = object_session(self)
+        if session is None:
+            return True
+
+        # an ancestor which has been renamed or moved, but not flushed yet,
+        # still has our old path as its materialized path
+        cls = self.base_class
+        path = self.materialized_path
+        assert path is not None
+        return not any(
+            isinstance(obj, cls)
+            and obj.materialized_path is not None
+            and path.startswith(f'{obj.materialized_path}/')
+            and not obj.has_own_stored_path
+            for obj in session.dirty
+        )
+
+    @property
+    def has_own_stored_path(self) -> bool:
+        """ True if the :attr:`materialized_path` reflects the current
+        name and parent of this item, ignoring changes to its ancestors.
+
+        """
+        if self.materialized_path is None:
+            return False
+
+        state = inspect(self)
+        if state.transient or state.pending:
+            return False
+
+        return not any(
+            state.attrs[key].history.has_changes()
+            for key in ('name', 'parent', 'parent_id')
+        )
+
     @property
     def path(self) -> str:
         """ The path of this item. """
-        return '/'.join(
-            chain(
-                (a.name for a in self.ancestors),
-                (self.name, )
-            )
-        )
+        if self.has_stored_path:
+            assert self.materialized_path is not None
+            return self.materialized_path
+
+        parent = self.parent
+        state = inspect(self)
+        if (
+            state.attrs.parent_id.history.has_changes()
+            and not state.attrs.parent.history.has_changes()
+        ):
+            # only the parent_id has been changed, so the parent
+            # relationship is outdated until the item is flushed
+            session = object_session(self)
+            assert session is not None
+            parent = session.get(self.base_class, self.parent_id) if (
+                self.parent_id is not None) else None
+
+        if parent is None:
+            return self.name
+        return f'{parent.path}/{self.name}'
 
     @hybrid_property
     def absorb(self) -> str:
@@ -303,6 +415,63 @@ class AdjacencyList(Base):
         )
 
 
+@event.listens_for(Session, 'before_flush')
+def update_materialized_paths(
+    session: Session,
+    context: UOWTransaction,
+    instances: Sequence[Any]
+) -> None:
+    """ Keeps the :attr:`AdjacencyList.materialized_path` up to date.
+
+    If an item is renamed or moved to another parent, the paths of all its
+    descendants are updated as well using a single statement.
+
+    """
+    for obj in chain(session.new, session.dirty):
+        if not isinstance(obj, AdjacencyList) or obj.has_own_stored_path:
+            continue
+
+        old_path = obj.materialized_path
+        new_path = obj.path
+        if old_path == new_path:
+            continue
+
+        obj.materialized_path = new_path
+
+        if old_path is None or inspect(obj).pending:
+            continue
+
+        cls = obj.base_class
+        old_prefix = f'{old_path}/'
+        new_prefix = f'{new_path}/'
+        session.execute(
+            update(cls.__table__)
+            .where(cls.__table__.c.materialized_path.startswith(
+                old_prefix, autoescape=True))
+            .values(materialized_path=func.concat(
+                new_prefix,
+                func.substr(
+                    cls.__table__.c.materialized_path,
+                    len(old_prefix) + 1
+                )
+            ))
+        )
+
+        # update the descendants which have already been loaded, expired
+        # descendants will load the updated path from the database
+        for item in session.identity_map.values():
+            if not isinstance(item, cls):
+                continue
+
+            path = item.__dict__.get('materialized_path')
+            if path is not None and path.startswith(old_prefix):
+                set_committed_value(
+                    item,
+                    'materialized_path',
+                    new_prefix + path[len(old_prefix):]
+                )
+
+
 def calculuate_midpoint_order[L: AdjacencyList](
     siblings: list[L],
     new_item: L,
@@ -426,37 +595,15 @@ class AdjacencyListCollection[L: AdjacencyList]:
             paths.by_path('/documents/license/')
             paths.by_path('documents/license/')
 
-        Lookups by path are currently quite wasteful. To get the root of
-        a page nested deeply one has to walk the ascendants of the page one by
-        one, triggering a number of queries.
-
-        Should this actually become a bottleneck (it might be fine), we should
-        probably implement a materialized view that is updated whenever a page
-        changes.
-
-        See:
-
-        `<https://schinckel.net/2014/11/22/\
-        postgres-tree-shootout-part-1%3A-introduction./>`
-
-        `<https://schinckel.net/2014/11/27/\
-        postgres-tree-shootout-part-2%3A-adjacency-list-using-ctes/>`
+        The lookup uses the :attr:`AdjacencyList.materialized_path`, so it
+        only needs a single query, regardless of the depth of the item.
 
         """
 
-        fragments = path.strip('/').split('/')
-
         item = self.query(ordered=False).filter(
-            self.__listclass__.name == fragments.pop(0),
-            self.__listclass__.parent_id == None
+            self.__listclass__.materialized_path == path.strip('/')
         ).first()
 
-        while item and fragments:
-            item = self.query(ordered=False).filter(
-                self.__listclass__.name == fragments.pop(0),
-                self.__listclass__.parent_id == item.id
-            ).first()
-
         if ensure_type is None or item is None or item.type == ensure_type:
             return item
         return None
@@ -19,6 +19,19 @@ Properties defined in this way are accessible through the instance::
 If there are any changes to the users table, the cache is removed. Since the
 cache is usually a shared redis instance, this works for multiple processes.
 
+If only some columns are relevant for the cached value, the policy can be
+limited to updates of these columns (inserts and deletes still evict the
+cache)::
+
+        @orm_cached(policy='on-column-change:tickets:state')
+        def ticket_count(self):
+            # ... count tickets by state
+
+Each process keeps an in-memory copy of the cached values, which is
+validated against a timestamp stored alongside the value in redis. The
+timestamps of all cached values known to the process are fetched at once
+the first time a cached value is accessed during a request.
+
 """
 from __future__ import annotations
 
@@ -27,13 +40,14 @@ import inspect
 from functools import wraps
 from libres.db.models import ORMBase
 from onegov.core.orm.utils import maybe_merge
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.orm.query import Query
 from time import time
 
 
 from typing import cast, overload, Any, TYPE_CHECKING
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator
+    from collections.abc import Callable, Iterable, Iterator
     from morepath.request import Request
     from onegov.core.framework import Framework
     from sqlalchemy.orm import Session
@@ -84,6 +98,22 @@ if TYPE_CHECKING:
 unset = object()
 
 
+def has_column_changes(obj: Base, columns: Iterable[str]) -> bool:
+    """ Returns True if any of the given columns of the given object have
+    changed during the current flush.
+
+    Objects that weren't modified through the unit of work (e.g. objects
+    returned from bulk updates) are always considered changed, since we
+    can't tell which columns have been affected.
+
+    """
+    state = sa_inspect(obj)
+    if not state.modified:
+        return True
+
+    return any(state.attrs[column].history.has_changes() for column in columns)
+
+
 class OrmCacheApp:
     """ Integrates the orm cache handling into the application
     (i.e. :class:`onegov.core.framework.Framework`).
@@ -105,6 +135,10 @@ class OrmCacheApp:
         request_class: type[Request]
         schema_cache: dict[str, Any]
 
+    #: the timestamps fetched during the current request, these are reset
+    #: alongside the request cache
+    orm_cache_timestamps: dict[str, Any] | None = None
+
     def configure_orm_cache(self, **cfg: Any) -> None:
         self.is_orm_cache_setup = getattr(self, 'is_orm_cache_setup', False)
 
@@ -113,12 +147,16 @@ class OrmCacheApp:
 
         assert not self.is_orm_cache_setup
 
-        for descriptor in self.orm_cache_descriptors:
+        self._orm_cache_descriptors = tuple(self.orm_cache_descriptors)
+        for descriptor in self._orm_cache_descriptors:
             self.session_manager.on_insert.connect(
                 self.descriptor_bound_orm_change_handler(descriptor),
                 weak=False)
             self.session_manager.on_update.connect(
-                self.descriptor_bound_orm_change_handler(descriptor),
+                self.descriptor_bound_orm_change_handler(
+                    descriptor,
+                    is_update=True
+                ),
                 weak=False)
             self.session_manager.on_delete.connect(
                 self.descriptor_bound_orm_change_handler(descriptor),
@@ -126,9 +164,49 @@ class OrmCacheApp:
 
         self.is_orm_cache_setup = True
 
+    @property
+    def orm_cache_timestamp_keys(self) -> list[str]:
+        """ The redis keys of the timestamps of all the cached values which
+        have been accessed by this process.
+
+        """
+        descriptors = getattr(self, '_orm_cache_descriptors', None)
+        if descriptors is None:
+            descriptors = self._orm_cache_descriptors = tuple(
+                self.orm_cache_descriptors)
+
+        return sorted({
+            f'{cache_key}_ts'
+            for descriptor in descriptors
+            for cache_key in descriptor.used_cache_keys
+        })
+
+    def orm_cache_timestamp(self, cache_key: str) -> Any:
+        """ Returns the timestamp of when the given cache key was populated.
+
+        The first time this is called during a request, the timestamps of
+        all the known cache keys are fetched with a single redis command, so
+        subsequent calls don't need another round trip.
+
+        """
+        timestamps = self.orm_cache_timestamps
+        if timestamps is None:
+            keys = self.orm_cache_timestamp_keys
+            timestamps = self.orm_cache_timestamps = dict(zip(
+                keys,
+                self.cache.get_multi(keys) if keys else (),
+                strict=True
+            ))
+
+        ts_key = f'{cache_key}_ts'
+        if ts_key not in timestamps:
+            timestamps[ts_key] = self.cache.get(key=ts_key)
+        return timestamps[ts_key]
+
     def descriptor_bound_orm_change_handler(
         self,
-        descriptor: OrmCacheDescriptor[Any]
+        descriptor: OrmCacheDescriptor[Any],
+        is_update: bool = False
     ) -> Callable[[str, Base], None]:
         """ Listens to changes to the database and evicts the cache if the
         policy demands it. Available policies:
@@ -136,6 +214,10 @@ class OrmCacheApp:
         * policy='on-table-change:table': clears the cache if there's a change
           on the given table
 
+        * policy='on-column-change:table:column,column': clears the cache if
+          a row is inserted or deleted on the given table or if one of the
+          given columns is updated
+
         * policy=lambda obj: ...: clears the cache if the given policy function
           returns true (it receives the object which has changed)
 
@@ -156,6 +238,13 @@ class OrmCacheApp:
                 tablename = descriptor.cache_policy.split(':')[-1]
                 dirty = obj.__class__.__tablename__ == tablename
 
+            elif descriptor.cache_policy.startswith('on-column-change'):
+                _, tablename, columns = descriptor.cache_policy.split(':')
+                dirty = obj.__class__.__tablename__ == tablename and (
+                    not is_update
+                    or has_column_changes(obj, columns.split(','))
+                )
+
             else:
                 raise NotImplementedError()
 
@@ -179,6 +268,9 @@ class OrmCacheApp:
                         del self.schema_cache[cache_key]
                     if cache_key in self.request_cache:
                         del self.request_cache[cache_key]
+                    timestamps = self.orm_cache_timestamps
+                    if timestamps is not None:
+                        timestamps.pop(f'{cache_key}_ts', None)
 
         return handle_orm_change
 
@@ -325,7 +417,7 @@ class OrmCacheDescriptor[T]:
 
         # we use a secondary in-memory cache for more lookup speed
         ts, obj = app.schema_cache.get(cache_key, (float('-Inf'), unset))
-        if obj is unset or ts != app.cache.get(key=ts_key):
+        if obj is unset or ts != app.orm_cache_timestamp(cache_key):
             # NOTE: Ideally we would create these values as a pair
             #       but then we would have to start circumventing
             #       most of dogpile's API, at which point we may
@@ -349,6 +441,9 @@ class OrmCacheDescriptor[T]:
                 creator=time
             )
             app.schema_cache[cache_key] = (ts, obj)
+            timestamps = app.orm_cache_timestamps
+            if timestamps is not None:
+                timestamps[ts_key] = ts
 
         app.request_cache[cache_key] = obj
 
@@ -0,0 +1,211 @@
+""" Rate limits shared by all processes, using a token bucket per client
+stored in Redis.
+
+Each bucket holds up to ``requests`` tokens and is refilled continuously at
+a rate of ``requests`` per ``seconds``. Every request takes a token, requests
+finding an empty bucket are blocked. This allows short bursts, while
+limiting the sustained rate of a client.
+
+The bucket is updated by a single Lua script, so concurrent requests of the
+same client are counted correctly and each check costs one round trip.
+
+Rate limits may be applied to paths of an application by registering rules
+with the ``rate_limits`` setting::
+
+    @App.setting(section='rate_limits', name='rules')
+    def get_rate_limit_rules() -> tuple[RateLimitRule, ...]:
+        return (
+            RateLimitRule('search', '/search.*', RateLimit(60, 60)),
+        )
+
+Or checked explicitly through :attr:`onegov.core.Framework.rate_limiter`.
+
+"""
+from __future__ import annotations
+
+import re
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+from math import ceil, floor
+from onegov.core.cache import get_pool
+from redis import Redis
+from sedate import utcnow
+
+
+from typing import NamedTuple, TYPE_CHECKING
+if TYPE_CHECKING:
+    from onegov.core.request import CoreRequest
+    from redis.commands.core import Script
+
+
+#: Takes a token from the bucket, refilling it first. Blocked requests are
+#: counted per rule.
+#:
+#: KEYS: bucket, blocked counters
+#: ARGV: capacity, refill rate per second, now, rule name
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'timestamp')
+local tokens = tonumber(bucket[1])
+local timestamp = tonumber(bucket[2])
+
+if tokens == nil or timestamp == nil then
+    tokens = capacity
+else
+    tokens = math.min(capacity, tokens + math.max(0, now - timestamp) * rate)
+end
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    redis.call('HINCRBY', KEYS[2], ARGV[4], 1)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'timestamp', ARGV[3])
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+
+return {allowed, tostring(tokens)}
+"""
+
+HTTP_DATE = '%a, %d %b %Y %H:%M:%S GMT'
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """ Allows ``requests`` per ``seconds``, in bursts of up to ``requests``.
+
+    """
+
+    requests: int
+    seconds: float
+
+    @property
+    def rate(self) -> float:
+        """ The number of tokens added to the bucket per second. """
+        return self.requests / self.seconds
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """ Applies a rate limit to all paths matching the given regular
+    expression (matched against the whole path of the application).
+
+    Each client has its own bucket per rule, the name identifies the rule
+    in the blocked requests counters.
+
+    """
+
+    name: str
+    path: str
+    limit: RateLimit
+    pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'pattern', re.compile(rf'^({self.path})$'))
+
+    def matches(self, path: str) -> bool:
+        return self.pattern.match(path) is not None
+
+
+class RateLimitResult(NamedTuple):
+    """ The outcome of a rate limit check. """
+
+    allowed: bool
+    limit: RateLimit
+    #: the tokens left in the bucket
+    tokens: float
+    now: datetime
+
+    @property
+    def remaining(self) -> int:
+        return max(floor(self.tokens), 0)
+
+    def refilled(self, tokens: float) -> datetime:
+        """ When the bucket will hold the given number of tokens again. """
+        missing = max(tokens - self.tokens, 0)
+        seconds = missing * self.limit.seconds / self.limit.requests
+        return self.now + timedelta(seconds=ceil(seconds))
+
+    @property
+    def retry_after(self) -> datetime:
+        """ When the next request will be allowed. """
+        return self.refilled(1)
+
+    @property
+    def reset(self) -> datetime:
+        """ When the bucket will be full again. """
+        return self.refilled(self.limit.requests)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {
+            'X-RateLimit-Limit': str(self.limit.requests),
+            'X-RateLimit-Remaining': str(self.remaining),
+            'X-RateLimit-Reset': self.reset.strftime(HTTP_DATE)
+        }
+        if not self.allowed:
+            headers['Retry-After'] = self.retry_after.strftime(HTTP_DATE)
+        return headers
+
+
+class RateLimiter:
+    """ Checks the rate limits of the clients of one application. """
+
+    def __init__(self, namespace: str, redis_url: str):
+        self.namespace = namespace
+        self.redis = Redis(connection_pool=get_pool(redis_url))
+
+    @cached_property
+    def script(self) -> Script:
+        return self.redis.register_script(TOKEN_BUCKET_SCRIPT)
+
+    @property
+    def blocked_key(self) -> str:
+        return f'{self.namespace}:blocked'
+
+    def hit(
+        self,
+        name: str,
+        client: str,
+        limit: RateLimit
+    ) -> RateLimitResult:
+        """ Takes a token from the bucket of the given client and rule. """
+
+        now = utcnow()
+        allowed, tokens = self.script(
+            keys=(f'{self.namespace}:{name}:{client}', self.blocked_key),
+            args=(limit.requests, limit.rate, repr(now.timestamp()), name)
+        )
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=limit,
+            tokens=float(tokens),
+            now=now
+        )
+
+    def blocked(self) -> dict[str, int]:
+        """ Returns the number of blocked requests by rule. """
+        return {
+            name.decode('utf-8'): int(count)
+            for name, count in self.redis.hgetall(self.blocked_key).items()
+        }
+
+    def reset_blocked(self) -> None:
+        self.redis.delete(self.blocked_key)
+
+
+def client_address(request: CoreRequest) -> str:
+    """ The key of the client used for rate limits by address. """
+    return f'ip:{request.client_addr or "unknown"}'
+
+
+@lru_cache(maxsize=1024)
+def get(namespace: str, redis_url: str) -> RateLimiter:
+    return RateLimiter(namespace=namespace, redis_url=redis_url)
@@ -3,11 +3,12 @@ from __future__ import annotations
 import morepath
 import ua_parser
 
-from datetime import timedelta
+from datetime import date, timedelta
+from decimal import Decimal
 from functools import cached_property
 from onegov.core.cache import instance_lru_cache
 from onegov.core.custom import msgpack
-from onegov.core.utils import append_query_param
+from onegov.core.utils import append_query_params
 from itsdangerous import (
     BadSignature,
     SignatureExpired,
@@ -22,6 +23,9 @@ from morepath.error import LinkError
 from morepath.request import SAME_APP
 from onegov.core import utils
 from onegov.core.crypto import random_token
+from sqlalchemy import false, inspect, or_
+from sqlalchemy.ext.hybrid import hybrid_property
+from uuid import UUID
 from webob.exc import HTTPForbidden
 from wtforms.csrf.session import SessionCSRF
 
@@ -39,14 +43,13 @@ if TYPE_CHECKING:
     from onegov.core.i18n.translation_string import TranslationMarkup
     from onegov.core.security.permissions import Intent
     from onegov.core.types import MessageType
-    from sqlalchemy.orm import Mapped, Session
+    from sqlalchemy.orm import Mapped, Query, Session
     from translationstring import _ChameleonTranslate
     from typing import Literal, Protocol, TypeGuard
     from webob import Response
     from webob.multidict import MultiDict
     from webob.request import _FieldStorageWithFile
     from wtforms import Form
-    from uuid import UUID
 
     from .analytics import AnalyticsProvider
     from .templates import TemplateLoader
@@ -158,6 +161,29 @@ def is_logged_in(identity: Identity | NoIdentity) -> TypeGuard[Identity]:
     return identity is not NO_IDENTITY
 
 
+#: the types of path variables which may be used as part of a link cache key
+LINK_CACHE_TYPES = (str, int, float, Decimal, UUID, date, type(None))
+
+
+def link_cache_key(
+    variables: dict[str, Any]
+) -> tuple[tuple[str, type[Any], Any], ...] | None:
+    """ Returns a hashable key for the given path variables, or None if
+    the variables may not be cached (e.g. because they are mutable).
+
+    The type is part of the key, since equal values of different types
+    (e.g. 1 and True) may be converted differently.
+
+    """
+    if not all(isinstance(v, LINK_CACHE_TYPES) for v in variables.values()):
+        return None
+
+    return tuple(sorted(
+        (key, type(value), value)
+        for key, value in variables.items()
+    ))
+
+
 class CoreRequest(IncludeRequest, ContentSecurityRequest, ReturnToMixin):
     """ Extends the default Morepath request with virtual host support and
     other useful methods.
@@ -297,16 +323,22 @@ class CoreRequest(IncludeRequest, ContentSecurityRequest, ReturnToMixin):
         query_params: SupportsIterableStrItems | None = None,
         fragment: str | None = None,
     ) -> str | T | None:
-        """ Extends the default link generating function of Morepath. """
-        query_params = query_params or {}
+        """ Extends the default link generating function of Morepath.
+
+        Links to models with simple path variables are cached per app,
+        see :meth:`onegov.core.framework.Framework.class_path_url`.
+
+        """
         if hasattr(obj, '__link_alias__'):
             result = obj.__link_alias__()
+        elif (url := self.cached_link(obj, name, app)) is not None:
+            result = self.transform(url)
         else:
             result = self.transform(
                 super().link(obj, name=name, default=default, app=app)
             )
-        for key, value in query_params.items():
-            result = append_query_param(result, key, value)
+        if query_params:
+            result = append_query_params(result, query_params.items())
         if fragment:
             result += f'#{fragment}'
         return result
@@ -320,20 +352,79 @@ class CoreRequest(IncludeRequest, ContentSecurityRequest, ReturnToMixin):
         query_params: SupportsIterableStrItems | None = None,
         fragment: str | None = None,
     ) -> str:
-        """ Extends the default class link generating function of Morepath. """
-        query_params = query_params or {}
-        result = self.transform(super().class_link(
-            model,
-            variables=variables,
-            name=name,
-            app=app
-        ))
-        for key, value in query_params.items():
-            result = append_query_param(result, key, value)
+        """ Extends the default class link generating function of Morepath.
+
+        Like :meth:`link`, the links are cached per app if possible.
+
+        """
+        url = self.cached_class_link(
+            model, variables or {}, name, app, self.link_prefix())
+        if url is None:
+            url = super().class_link(
+                model,
+                variables=variables,
+                name=name,
+                app=app
+            )
+        result = self.transform(url)
+        if query_params:
+            result = append_query_params(result, query_params.items())
         if fragment:
             result += f'#{fragment}'
         return result
 
+    def cached_link(
+        self,
+        obj: object,
+        name: str,
+        app: Framework | Sentinel
+    ) -> str | None:
+        """ Returns the cached url (without host) to the given object, or
+        None if the url may not be cached.
+
+        """
+        if obj is None or app is None:
+            return None
+
+        if app is SAME_APP:
+            app = self.app
+
+        variables = app._path_variables(obj)  # type:ignore[union-attr]
+        if variables is None:
+            return None
+
+        return self.cached_class_link(
+            obj.__class__, variables, name, app, self.link_prefix(app))
+
+    def cached_class_link(
+        self,
+        model: type[Any],
+        variables: dict[str, Any],
+        name: str,
+        app: Framework | Sentinel,
+        prefix: str
+    ) -> str | None:
+        """ Returns the cached url (without host) to the given model class,
+        or None if the url may not be cached.
+
+        """
+        if app is None:
+            return None
+
+        if app is SAME_APP:
+            app = self.app
+
+        # mounted and deferred apps are left to Morepath
+        if app.parent is not None:  # type:ignore[union-attr]
+            return None
+
+        key = link_cache_key(variables)
+        if key is None:
+            return None
+
+        return app.class_path_url(  # type:ignore[union-attr]
+            model, key, name, prefix)
+
     def filestorage_link(self, path: str) -> str | None:
         """ Takes the given filestorage path and returns an url if the path
         exists. The url might point to the local server or it might point to
@@ -361,7 +452,8 @@ class CoreRequest(IncludeRequest, ContentSecurityRequest, ReturnToMixin):
         """ The link to the current theme. Computed once per request.
 
         The theme is automatically compiled and stored if it doesn't exist yet,
-        or if it is outdated.
+        or if it is outdated. While another process is compiling it, the
+        previous theme of the application is used.
 
         """
         theme = self.app.settings.core.theme
@@ -374,7 +466,9 @@ class CoreRequest(IncludeRequest, ContentSecurityRequest, ReturnToMixin):
 
         filename = self.app.modules.theme.compile(
             self.app.themestorage, theme, self.app.theme_options,
-            force=force
+            force=force,
+            cache=self.app.theme_cache,
+            application_id=self.app.application_id
         )
 
         return self.link(self.app.modules.theme.ThemeFile(filename))
@@ -710,9 +804,123 @@ class CoreRequest(IncludeRequest, ContentSecurityRequest, ReturnToMixin):
         permission = self.app.permission_by_view(obj, view_name)
         return self.has_permission(obj, permission)
 
+    @cached_property
+    def generic_visibility_cache(self) -> dict[type[object], bool]:
+        return {}
+
+    def has_generic_visibility(self, model_class: type[object]) -> bool:
+        """ Returns True if the visibility of the given model class is
+        decided by the generic permission rules, which only depend on the
+        role of the current user and the access and publication state of
+        the model.
+
+        See :func:`onegov.core.security.rules.generic_permission_rule`.
+
+        """
+        cache = self.generic_visibility_cache
+        if model_class not in cache:
+            security = self.app.modules.security
+            cache[model_class] = all(
+                getattr(
+                    self.app._permits.by_predicates(
+                        identity=type(self.identity),
+                        obj=model_class,
+                        permission=permission
+                    ).component,
+                    'is_generic_permission_rule',
+                    False
+                )
+                for permission in (security.Public, security.Private)
+            )
+        return cache[model_class]
+
     def exclude_invisible[T](self, models: Iterable[T]) -> list[T]:
-        """ Excludes models invisble to the current user from the list. """
-        return [m for m in models if self.is_visible(m)]
+        """ Excludes models invisble to the current user from the list.
+
+        Models with generic visibility are only checked once per class,
+        access and publication state, instead of once per model.
+
+        """
+        visibility: dict[tuple[type[object], Any, Any], bool] = {}
+        result = []
+
+        for model in models:
+            model_class = type(model)
+            if not self.has_generic_visibility(model_class):
+                if self.is_visible(model):
+                    result.append(model)
+                continue
+
+            key = (
+                model_class,
+                getattr(model, 'access', None),
+                getattr(model, 'published', None)
+            )
+            try:
+                visible = visibility[key]
+            except KeyError:
+                visible = visibility[key] = self.is_visible(model)
+            except TypeError:
+                # unhashable access or publication state
+                visible = self.is_visible(model)
+
+            if visible:
+                result.append(model)
+
+        return result
+
+    def filter_visible[T](
+        self,
+        query: Query[T],
+        model_class: type[T] | None = None
+    ) -> Query[T]:
+        """ Excludes models invisible to the current user from the query,
+        so they are not loaded in the first place.
+
+        This is only possible for models with generic visibility (including
+        all their subclasses) and only for their ``access`` and
+        ``published`` hybrid properties, other queries are returned as is.
+        The result should therefore still be passed through
+        :meth:`exclude_invisible`.
+
+        """
+        from onegov.core.security.rules import ACCESS_LEVELS
+
+        if model_class is None:
+            model_class = query.column_descriptions[0]['entity']
+            assert model_class is not None
+
+        mapper = inspect(model_class)
+        model_classes = [m.class_ for m in mapper.self_and_descendants]
+        model_classes.append(utils.Bunch)
+        if not all(map(self.has_generic_visibility, model_classes)):
+            return query
+
+        # the generic rules are evaluated on stand-ins, once per access level
+        def is_visible(access: str | None, published: bool | None) -> bool:
+            return self.is_visible(
+                utils.Bunch(access=access, published=published))
+
+        if not is_visible(None, None):
+            return query.filter(false())
+
+        descriptors = mapper.all_orm_descriptors
+        if isinstance(descriptors.get('access'), hybrid_property):
+            hidden = [a for a in ACCESS_LEVELS if not is_visible(a, None)]
+            if hidden:
+                access = model_class.access  # type:ignore[attr-defined]
+                query = query.filter(or_(
+                    access.is_(None),
+                    access.not_in(hidden)
+                ))
+
+        if isinstance(descriptors.get('published'), hybrid_property):
+            if not is_visible(None, False):
+                query = query.filter(
+                    model_class.published.is_not(False)  # type:ignore[attr-defined]
+                )
+
+        return query
 
     def is_visible(self, model: object) -> bool:
         """ Returns True if the given model is visible to the current user.
@@ -8,10 +8,32 @@ from webob.exc import HTTPException
 
 from typing import Any, Literal, TYPE_CHECKING
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from onegov.core.types import HasRole
 
 
+#: The access levels distinguished by the generic permission rules and
+#: :meth:`onegov.core.request.CoreRequest.is_visible`.
+ACCESS_LEVELS = (
+    'public', 'secret', 'private', 'member', 'mtan', 'secret_mtan'
+)
+
+
+def generic_permission_rule[F: Callable[..., bool]](rule: F) -> F:
+    """ Marks a permission rule as generic. Generic rules only depend on
+    the role of the identity and the ``access`` and ``published`` attributes
+    of the model. So all models of a class which share the same access and
+    publication state are either visible or invisible together.
+
+    See :meth:`onegov.core.request.CoreRequest.exclude_invisible`.
+
+    """
+    rule.is_generic_permission_rule = True  # type:ignore[attr-defined]
+    return rule
+
+
 @Framework.permission_rule(model=object, permission=object, identity=None)
+@generic_permission_rule
 def has_permission_not_logged_in(
     app: Framework,
     identity: None,
@@ -39,6 +61,7 @@ def has_permission_not_logged_in(
 
 
 @Framework.permission_rule(model=object, permission=object)
+@generic_permission_rule
 def has_permission_logged_in(
     app: Framework,
     identity: HasRole,
@@ -39,24 +39,43 @@ template::
 
 Note that for the theme to work you need to define a filestorage. See
 :meth:`onegov.core.framework.Framework.configure_application`.
+
+Themes are compiled on the first request which needs them. Only one process
+compiles a theme at a time, the others keep serving the previous theme of
+their application in the meantime. To avoid this after a deploy, themes can
+be compiled ahead of time::
+
+    onegov-core --select '/onegov_org/*' --jobs 4 compile-themes
+
 """
 from __future__ import annotations
 
 import subprocess
 
+from contextlib import suppress
 from onegov.core import __version__
 from onegov.core.framework import Framework
 from onegov.core import log
 from onegov.core import utils
 from onegov.core.filestorage import FilestorageFile
+from redis.exceptions import LockError
 
 
 from typing import Any, TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from onegov.core.cache import RedisCacheRegion
     from onegov.core.filestorage import Filestorage
 
 
+#: the number of seconds after which the lock of a crashed compilation expires
+COMPILE_LOCK_TIMEOUT = 300
+
+#: the number of seconds to wait for another process compiling the same theme
+#: before compiling it regardless, if there's no previous theme to serve
+COMPILE_WAIT_TIMEOUT = 5
+
+
 class Theme:
     """ Describres a onegov.core theme.
 
@@ -135,7 +154,9 @@ def compile(
     storage: Filestorage,
     theme: Theme,
     options: dict[str, Any] | None = None,
-    force: bool = False
+    force: bool = False,
+    cache: RedisCacheRegion | None = None,
+    application_id: str | None = None
 ) -> str:
     """ Generates a theme and stores it in the filestorage, returning the
     path to the theme.
@@ -155,6 +176,16 @@ def compile(
     :force:
         If true, the compilation is done in any case.
 
+    :cache:
+        A cache shared by all processes. If given, only one process compiles
+        a theme at a time, the others wait a few seconds for it to finish,
+        before compiling the theme themselves.
+
+    :application_id:
+        The application the theme is compiled for. If given together with
+        the cache, the other processes don't wait, but return the theme
+        last compiled for the application instead, if there is one.
+
     """
 
     filename = get_filename(theme, options)
@@ -162,12 +193,54 @@ def compile(
     if not force and storage.exists(filename):
         return filename
 
-    log.info(f'Compiling theme {theme.name}, {theme.version}')
-    storage.writebytes(filename, theme.compile(options).encode('utf-8'))
+    if cache is None:
+        write_theme(storage, theme, options, filename)
+        return filename
+
+    lock = cache.lock(f'compile:{filename}', timeout=COMPILE_LOCK_TIMEOUT)
+
+    if lock.acquire(blocking=False):
+        try:
+            # another process might have finished in the meantime
+            if force or not storage.exists(filename):
+                write_theme(storage, theme, options, filename)
+        finally:
+            with suppress(LockError):
+                lock.release()
+
+    else:
+        previous = application_id and cache.get(application_id)
+        if previous and storage.exists(previous):
+            return previous
+
+        # there's nothing we could serve in the meantime, but we don't
+        # want to hold up the request for the whole compilation either
+        acquired = lock.acquire(blocking_timeout=COMPILE_WAIT_TIMEOUT)
+        try:
+            if not storage.exists(filename):
+                write_theme(storage, theme, options, filename)
+        finally:
+            if acquired:
+                with suppress(LockError):
+                    lock.release()
+
+    if application_id:
+        cache.set(application_id, filename)
 
     return filename
 
 
+def write_theme(
+    storage: Filestorage,
+    theme: Theme,
+    options: dict[str, Any] | None,
+    filename: str
+) -> None:
+
+    log.info(f'Compiling theme {theme.name}, {theme.version}')
+    storage.writebytes(filename, theme.compile(options).encode('utf-8'))
+
+
 @Framework.setting(section='core', name='theme')
 def get_theme() -> Theme | None:
     """ Defines the default theme, which is no theme. """
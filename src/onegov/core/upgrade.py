@@ -12,7 +12,6 @@ from onegov.core import LEVELS
 from onegov.core.orm import Base, find_models
 from onegov.core.orm.mixins import TimestampMixin
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.orm import load_only, mapped_column, Mapped
 from sqlalchemy.pool import StaticPool
 from toposort import toposort
@@ -27,7 +26,7 @@ if TYPE_CHECKING:
     from sqlalchemy.engine import Connection
     from sqlalchemy.orm import Query, Session
     from types import CodeType, ModuleType
-    from typing import Protocol, TypeGuard
+    from typing import Protocol, Self, TypeGuard
 
     from .request import CoreRequest
 
@@ -381,10 +380,110 @@ class UpgradeTransaction:
         transaction.abort()
 
 
+class SchemaCatalog:
+    """ A snapshot of the tables, columns, constraints and types of a single
+    schema, used to answer the introspection questions of the upgrade tasks
+    without querying the database catalog each time.
+
+    """
+
+    def __init__(
+        self,
+        tables: set[str],
+        columns: dict[str, set[str]],
+        constraints: set[tuple[str, str, str]],
+        types: set[str],
+        enums: dict[str, set[str]]
+    ):
+        self.tables = tables
+        self.columns = columns
+        self.constraints = constraints
+        self.types = types
+        self.enums = enums
+
+    @classmethod
+    def load(cls, connection: Connection, schema: str) -> Self:
+        params = {'schema': schema}
+
+        tables = set()
+        columns: dict[str, set[str]] = {}
+        for relname, relkind, attname in connection.execute(text("""
+            SELECT pg_class.relname, pg_class.relkind, pg_attribute.attname
+              FROM pg_class
+              JOIN pg_namespace
+                ON pg_namespace.oid = pg_class.relnamespace
+              LEFT JOIN pg_attribute
+                ON pg_attribute.attrelid = pg_class.oid
+               AND pg_attribute.attnum > 0
+               AND NOT pg_attribute.attisdropped
+             WHERE pg_namespace.nspname = :schema
+               AND pg_class.relkind IN ('r', 'p', 'v', 'm', 'f')
+        """), params):
+            # views are not considered tables, but they have columns
+            if relkind in ('r', 'p'):
+                tables.add(relname)
+            column_names = columns.setdefault(relname, set())
+            if attname is not None:
+                column_names.add(attname)
+
+        constraints = {
+            (table_name, constraint_name, constraint_type)
+            for table_name, constraint_name, constraint_type
+            in connection.execute(text("""
+                SELECT table_name, constraint_name, constraint_type
+                  FROM information_schema.table_constraints
+                 WHERE table_schema = :schema
+            """), params)
+        }
+
+        types = set()
+        enums: dict[str, set[str]] = {}
+        for typname, typtype, enumlabel in connection.execute(text("""
+            SELECT pg_type.typname, pg_type.typtype, pg_enum.enumlabel
+              FROM pg_type
+              JOIN pg_namespace
+                ON pg_namespace.oid = pg_type.typnamespace
+              LEFT JOIN pg_enum
+                ON pg_enum.enumtypid = pg_type.oid
+             WHERE pg_namespace.nspname = :schema
+        """), params):
+            types.add(typname)
+            if typtype == 'e':
+                labels = enums.setdefault(typname, set())
+                if enumlabel is not None:
+                    labels.add(enumlabel)
+
+        return cls(tables, columns, constraints, types, enums)
+
+
+class CatalogInvalidatingOperations:
+    """ Wraps the alembic operations and discards the catalog snapshot of
+    the context as soon as they are used, since they most likely change the
+    schema.
+
+    """
+
+    def __init__(self, operations: Any, context: UpgradeContext):
+        self._operations = operations
+        self._context = context
+
+    def __getattr__(self, name: str) -> Any:
+        self._context.invalidate_catalog()
+        return getattr(self._operations, name)
+
+
 class UpgradeContext:
     """ Holdes the context of the upgrade. An instance of this is passed
     to each upgrade task.
 
+    The introspection methods (e.g. :meth:`has_column`) are answered from a
+    snapshot of the schema's catalog. The snapshot may be shared between
+    contexts by passing the same ``catalogs`` dictionary, it's discarded
+    whenever the alembic operations are used.
+
+    If an upgrade task changes the schema through the session instead of
+    the operations, it has to call :meth:`invalidate_catalog` itself.
+
     """
 
     # FIXME: alembic currently auto generates type stubs for alembic.op but
@@ -392,7 +491,11 @@ class UpgradeContext:
     #        to be auto-generated as well, so we get the available methods
     operations: Any
 
-    def __init__(self, request: CoreRequest):
+    def __init__(
+        self,
+        request: CoreRequest,
+        catalogs: dict[str, SchemaCatalog] | None = None
+    ):
 
         # alembic is a somewhat heavy import (thanks to the integrated mako)
         # -> since we really only ever need it during upgrades we lazy load
@@ -409,6 +512,7 @@ class UpgradeContext:
         self.app = request.app
         self.schema = request.app.session_manager.current_schema
         self.engine = self.session.bind
+        self.catalogs = {} if catalogs is None else catalogs
 
         # The locale of the upgrade is the default locale
         request.app.session_manager.set_locale(
@@ -426,17 +530,35 @@ class UpgradeContext:
         assert session.bind is not None
         conn = session._connection_for_bind(session.bind)
         self.operations_connection: Connection = conn
-        self.operations = Operations(
-            MigrationContext.configure(self.operations_connection))
+        self.operations = CatalogInvalidatingOperations(
+            Operations(MigrationContext.configure(self.operations_connection)),
+            self
+        )
 
     def begin(self) -> UpgradeTransaction:
         return UpgradeTransaction(self)
 
+    @property
+    def catalog(self) -> SchemaCatalog:
+        """ The snapshot of the schema's catalog, loaded on first use. """
+        catalog = self.catalogs.get(self.schema)
+        if catalog is None:
+            catalog = SchemaCatalog.load(
+                self.operations_connection,
+                self.schema
+            )
+            self.catalogs[self.schema] = catalog
+        return catalog
+
+    def invalidate_catalog(self) -> None:
+        """ Discards the snapshot of the schema's catalog, so it's loaded
+        again on the next introspection.
+
+        """
+        self.catalogs.pop(self.schema, None)
+
     def has_column(self, table: str, column: str) -> bool:
-        inspector = Inspector(self.operations_connection)
-        return column in {c['name'] for c in inspector.get_columns(
-            table, schema=self.schema
-        )}
+        return column in self.catalog.columns.get(table, ())
 
     def has_constraint(
         self, table_name: str, constraint_name: str, constraint_type: str
@@ -449,47 +571,24 @@ class UpgradeContext:
         WHERE table_name = 'table_name'
         AND constraint_name LIKE '%column_name%';
         """
-        return self.session.execute(
-            text("""
-                SELECT EXISTS (
-                    SELECT 1 FROM information_schema.table_constraints
-                    WHERE table_schema = :schema
-                      AND table_name = :table_name
-                      AND constraint_type = :constraint_type
-                      AND constraint_name = :constraint_name
-                )
-            """),
-            {
-                'schema': self.schema,
-                'table_name': table_name,
-                'constraint_name': constraint_name,
-                'constraint_type': constraint_type,
-            }
-        ).scalar_one()
+        return (
+            table_name,
+            constraint_name,
+            constraint_type
+        ) in self.catalog.constraints
 
     def has_enum(self, enum_name: str) -> bool:
-        return self.session.execute(
-            text("""
-                SELECT EXISTS (
-                    SELECT 1 FROM pg_type
-                    WHERE typname = :enum_name
-                      AND typnamespace = (
-                        SELECT oid FROM pg_namespace
-                        WHERE nspname = :schema
-                      )
-                )
-            """),
-            {
-                'schema': self.schema,
-                'enum_name': enum_name,
-            }
-        ).scalar_one()
+        return enum_name in self.catalog.types
 
     def has_table(self, table: str) -> bool:
-        inspector = Inspector(self.operations_connection)
-        return table in inspector.get_table_names(schema=self.schema)
+        return table in self.catalog.tables
 
     def get_enum_values(self, enum_name: str) -> set[str]:
+        values = self.catalog.enums.get(enum_name)
+        if values is not None:
+            return set(values)
+
+        # the enum may live outside of the schema
         result = self.operations_connection.execute(
             text("""
             SELECT pg_enum.enumlabel AS value
@@ -688,6 +787,7 @@ class UpgradeRunner:
     """ Runs the given basic tasks. """
 
     states: dict[str, UpgradeState]
+    catalogs: dict[str, SchemaCatalog]
 
     def __init__(
         self,
@@ -701,6 +801,7 @@ class UpgradeRunner:
         self.tasks = tasks
         self.commit = commit
         self.states = {}
+        self.catalogs = {}
 
         self._on_task_success = on_task_success
         self._on_task_fail = on_task_fail
@@ -732,14 +833,42 @@ class UpgradeRunner:
     def get_module_from_task_id(self, task_id: str) -> str:
         return task_id.split(':', 1)[0]
 
+    def get_pending_tasks(
+        self,
+        session: Session
+    ) -> list[tuple[str, UpgradeTask]]:
+        """ Returns the tasks which need to run, using a single query.
+
+        Modules whose tasks have all been executed (and which have no
+        always-run tasks) are skipped entirely, without setting up an
+        upgrade context for each of their tasks.
+
+        """
+        executed_tasks = {
+            module: set(state.get('executed_tasks', ()) if state else ())
+            for module, state in session.query(
+                UpgradeState.module,
+                UpgradeState.state
+            )
+        }
+
+        pending = []
+        for task_id, task in self.tasks:
+            module = self.get_module_from_task_id(task_id)
+            executed = executed_tasks.get(module, ())
+            if task.always_run or task.task_name not in executed:
+                pending.append((module, task))
+
+        return pending
+
     def run_upgrade(self, request: CoreRequest) -> int:
         self.register_modules(request)
 
-        tasks = ((self.get_module_from_task_id(i), t) for i, t in self.tasks)
+        tasks = self.get_pending_tasks(request.session)
         executed = 0
 
         for module, task in tasks:
-            context = UpgradeContext(request)
+            context = UpgradeContext(request, catalogs=self.catalogs)
             state = self.get_state(context, module)
 
             if not task.always_run and state.was_already_executed(task):
@@ -762,8 +891,13 @@ class UpgradeRunner:
                     executed += 1
                     self.on_task_success(task)
 
+                    # the task may have changed the schema without using
+                    # the alembic operations
+                    context.invalidate_catalog()
+
             except Exception:
                 upgrade.abort()
+                context.invalidate_catalog()
                 self.on_task_fail(task)
 
                 raise
@@ -14,7 +14,7 @@ from onegov.core.orm import Base, find_models
 from onegov.core.orm.abstract import Associable
 from onegov.core.orm.types import JSON
 from sqlalchemy import inspect, text
-from sqlalchemy import Numeric
+from sqlalchemy import Column, Numeric, Text
 from sqlalchemy.exc import NoInspectionAvailable
 
 
@@ -22,7 +22,6 @@ from typing import Any, TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
     from onegov.core.orm.abstract.associable import RegisteredLink
-    from sqlalchemy import Column
     from sqlalchemy.engine import Connection
 
     from .upgrade import UpgradeContext
@@ -262,3 +261,53 @@ def drop_remaining_gazette_and_notices_tables(context: UpgradeContext) -> None:
     ):
         if context.has_table(table):
             context.operations.drop_table(table)
+
+
+@upgrade_task('Add materialized path to adjacency lists')
+def add_materialized_path_to_adjacency_lists(context: UpgradeContext) -> None:
+    def is_concrete_subclass(cls: type) -> bool:
+        return (
+            issubclass(cls, AdjacencyList)
+            and cls is not AdjacencyList
+            and not isabstract(cls)
+        )
+
+    models = {
+        cls.__tablename__: inspect(cls).base_mapper.class_
+        for cls in chain(
+            find_models(Base, is_concrete_subclass),
+            find_models(ORMBase, is_concrete_subclass),
+        )
+    }
+
+    for table_name, cls in models.items():
+        if not context.has_table(table_name):
+            continue
+
+        if not context.has_column(table_name, 'materialized_path'):
+            context.operations.add_column(
+                table_name,
+                Column('materialized_path', Text, nullable=True)
+            )
+
+        context.operations.execute(text(f"""
+            WITH RECURSIVE tree AS (
+                SELECT id, name::text AS path
+                  FROM "{table_name}"
+                 WHERE parent_id IS NULL
+                 UNION ALL
+                SELECT child.id, tree.path || '/' || child.name
+                  FROM "{table_name}" child
+                  JOIN tree ON child.parent_id = tree.id
+            )
+            UPDATE "{table_name}"
+               SET materialized_path = tree.path
+              FROM tree
+             WHERE "{table_name}".id = tree.id
+        """))
+
+        index_name = f'{cls.__name__.lower()}_materialized_path'
+        context.operations.execute(text(f"""
+            CREATE INDEX IF NOT EXISTS "{index_name}"
+            ON "{table_name}" (materialized_path text_pattern_ops)
+        """))
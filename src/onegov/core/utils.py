@@ -19,6 +19,7 @@ import re
 import shutil
 import sqlalchemy
 import urllib.request
+import zipfile
 
 from collections.abc import Iterable
 from contextlib import contextmanager
@@ -45,7 +46,7 @@ from yubico_client.yubico_exceptions import (  # type:ignore[import-untyped]
     SignatureVerificationError, StatusCodeError)
 
 
-from typing import overload, Any, TYPE_CHECKING
+from typing import overload, Any, IO, TYPE_CHECKING
 if TYPE_CHECKING:
     from _typeshed import SupportsRichComparison
     from collections.abc import Callable, Collection, Iterator, Mapping
@@ -356,6 +357,81 @@ def render_file(file_path: str, request: CoreRequest) -> Response:
         static.FileApp(file_path, content_type=get_content_type(file_path)))
 
 
+class _ChunkWriter:
+    """ A write-only, unseekable file-like object which collects the written
+    data until it is popped. Used by :func:`stream_zip`.
+
+    """
+
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def pop(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def stream_zip(
+    entries: Iterable[tuple[str, bytes | IO[bytes]]],
+    chunk_size: int = 64 * 1024
+) -> Iterator[bytes]:
+    """ Generates a zip archive with the given entries chunk by chunk, so
+    it can be used as the ``app_iter`` of a response without ever holding
+    the whole archive (or a whole entry) in memory.
+
+    The entries are tuples of file names and either the content as bytes
+    or a readable binary file, which is read in chunks and closed once it
+    has been written. The entries are consumed lazily.
+
+    """
+    writer = _ChunkWriter()
+
+    with zipfile.ZipFile(writer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, content in entries:
+            if isinstance(content, bytes):
+                archive.writestr(name, content)
+            else:
+                try:
+                    with archive.open(name, 'w') as target:
+                        while chunk := content.read(chunk_size):
+                            target.write(chunk)
+
+                            if data := writer.pop():
+                                yield data
+                finally:
+                    content.close()
+
+            if data := writer.pop():
+                yield data
+
+    # the central directory
+    if data := writer.pop():
+        yield data
+
+
+def stream_file(
+    file: IO[bytes],
+    chunk_size: int = 64 * 1024
+) -> Iterator[bytes]:
+    """ Reads the given binary file chunk by chunk from the start, so it can
+    be used as the ``app_iter`` of a response. The file is closed once it
+    has been read.
+
+    """
+    with file:
+        file.seek(0)
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
 def hash_dictionary(dictionary: dict[str, Any]) -> str:
     """ Computes a sha256 hash for the given dictionary. The dictionary
     is expected to only contain values that can be serialized by json.
@@ -805,6 +881,22 @@ def append_query_param(url: str, key: str, value: str) -> str:
     return template.format(url, key, value)
 
 
+def append_query_params(
+    url: str,
+    params: Iterable[tuple[str, object]]
+) -> str:
+    """ Appends multiple query parameters to an url at once. Like
+    :func:`append_query_param` this assumes that the values are already
+    url encoded.
+
+    """
+    query = '&'.join(f'{key}={value}' for key, value in params)
+    if not query:
+        return url
+
+    return f'{url}&{query}' if '?' in url else f'{url}?{query}'
+
+
 class PostThread(Thread):
 
     """ POSTs the given data with the headers to the URL.
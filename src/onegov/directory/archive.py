@@ -8,8 +8,8 @@ from collections import OrderedDict
 from enum import Enum
 from onegov.core.csv import convert_list_of_dicts_to_csv
 from onegov.core.csv import convert_list_of_dicts_to_xlsx
-from onegov.core.csv import convert_excel_to_csv
 from onegov.core.csv import CSVFile
+from onegov.core.csv import ExcelFile
 from onegov.core.custom import json
 from onegov.core.utils import Bunch, is_subpath
 from onegov.directory.errors import MissingColumnError, MissingFileError
@@ -348,9 +348,7 @@ class DirectoryArchiveReader:
 
     def read_data_from_xlsx(self) -> tuple[dict[str, Any], ...]:
         with (self.path / 'data.xlsx').open('rb') as f:
-            return tuple(CSVFile(
-                convert_excel_to_csv(f), rowtype=dict, dialect='excel'
-            ).lines)
+            return tuple(ExcelFile(f, rowtype=dict).lines)
 
 
 class DirectoryArchiveWriter:
@@ -11,6 +11,7 @@ from onegov.core import utils
 from onegov.core.filestorage import FilestorageFile
 from onegov.core.framework import current_language_tween_factory
 from onegov.core.framework import transaction_tween_factory
+from onegov.core.rate_limit import RateLimit, RateLimitRule
 from onegov.election_day.directives import CsvFileAction
 from onegov.election_day.directives import JsonFileAction
 from onegov.election_day.directives import ManageFormAction
@@ -153,6 +154,15 @@ def get_i18n_default_locale() -> str:
     return 'de_CH'
 
 
+@ElectionDayApp.setting(section='rate_limits', name='rules')
+def get_rate_limit_rules() -> tuple[RateLimitRule, ...]:
+    return (
+        # the json results, generous enough for media polling on election
+        # days, but not for scraping the whole archive
+        RateLimitRule('json', '.*/(json|data-json)', RateLimit(300, 60)),
+    )
+
+
 @ElectionDayApp.tween_factory(under=content_security_policy_tween_factory)
 def enable_iframes_and_analytics_tween_factory(
     app: ElectionDayApp,
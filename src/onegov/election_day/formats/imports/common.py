@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from onegov.core.csv import convert_excel_to_csv
 from onegov.core.csv import CSVFile
+from onegov.core.csv import ExcelFile
 from onegov.core.errors import AmbiguousColumnsError
 from onegov.core.errors import DuplicateColumnNamesError
 from onegov.core.errors import EmptyFileError
@@ -133,60 +133,45 @@ def load_csv(
     :return: A tuple CSVFile, FileImportError.
 
     """
-    csv = None
+    csv: DefaultCSVFile | None = None
     error = None
-    csvfile = file
-    if mimetype not in ('text/plain', 'text/csv'):
-        try:
-            csvfile = convert_excel_to_csv(file, 'Resultate')
-            dialect = 'excel'
-        except KeyError:
+    try:
+        if mimetype not in ('text/plain', 'text/csv'):
             try:
-                csvfile = convert_excel_to_csv(file)
-                dialect = 'excel'
-            except OSError:
-                error = FileImportError(
-                    _('Not a valid xls/xlsx file.'),
-                    filename=filename
-                )
-            except NotImplementedError:
-                error = FileImportError(
-                    _('The xls/xlsx file contains unsupported cells.'),
-                    filename=filename
+                excel = ExcelFile(
+                    file,
+                    expected_headers=expected_headers,
+                    sheet_name='Resultate',
+                    rename_duplicate_column_names=rename_duplicate_column_names
                 )
-            except Exception:
-                error = FileImportError(
-                    _('Not a valid csv/xls/xlsx file.'),
-                    filename=filename
+            except KeyError:
+                excel = ExcelFile(
+                    file,
+                    expected_headers=expected_headers,
+                    rename_duplicate_column_names=rename_duplicate_column_names
                 )
-        except OSError:
-            error = FileImportError(
-                _('Not a valid xls/xlsx file.'),
-                filename=filename
-            )
-        except NotImplementedError:
-            error = FileImportError(
-                _('The xls/xlsx file contains unsupported cells.'),
-                filename=filename
+            csv = excel
+            # read the worksheet once, the importers use the loaded lines
+            excel.load()
+        else:
+            csv = CSVFile(
+                file,
+                expected_headers=expected_headers,
+                dialect=dialect,
+                encoding=encoding,
+                rename_duplicate_column_names=rename_duplicate_column_names
             )
-        except Exception:
-            error = FileImportError(
-                _('Not a valid csv/xls/xlsx file.'),
-                filename=filename
-            )
-
-    if error:
-        return csv, error
-
-    try:
-        csv = CSVFile(
-            csvfile,
-            expected_headers=expected_headers,
-            dialect=dialect,
-            encoding=encoding,
-            rename_duplicate_column_names=rename_duplicate_column_names
+            list(csv.lines)  # Needed to raise correct errors and pass tests
+    except OSError:
+        error = FileImportError(
+            _('Not a valid xls/xlsx file.'),
+            filename=filename
+        )
+    except NotImplementedError:
+        error = FileImportError(
+            _('The xls/xlsx file contains unsupported cells.'),
+            filename=filename
         )
-        list(csv.lines)  # Needed to raise correct errors and pass tests
     except MissingColumnsError as e:
         error = FileImportError(
             _(
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-from collections import OrderedDict
+from collections import defaultdict, Counter, OrderedDict
 from decimal import Decimal
+from functools import cached_property
 from itertools import groupby
 from onegov.activity import Activity, Attendee, Booking, Occasion
 from onegov.activity import ActivityInvoiceItem
 from onegov.activity import BookingCollection
 from onegov.activity import BookingPeriodInvoice
 from onegov.activity import BookingPeriodInvoiceCollection
-from onegov.core.orm import as_selectable, as_selectable_from_path
+from onegov.core.orm import as_selectable_from_path
 from onegov.core.utils import module_path
-from onegov.pay import InvoiceReference
+from onegov.pay import InvoiceItem, InvoiceReference
 from onegov.user import User
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
@@ -19,7 +20,7 @@ from ulid import ULID
 
 from typing import Any, Literal, NamedTuple, TYPE_CHECKING
 if TYPE_CHECKING:
-    from collections.abc import Collection, Iterator
+    from collections.abc import Collection, Iterator, Mapping
     from onegov.activity.models import BookingPeriod, BookingPeriodMeta
     from onegov.feriennet.request import FeriennetRequest
     from sqlalchemy.engine import Result
@@ -284,6 +285,14 @@ class BillingCollection:
         self,
         all_inclusive_booking_text: str | None = None
     ) -> None:
+        """ Creates the invoices of the period from the accepted bookings.
+
+        Existing invoices are only replaced if their items differ from the
+        ones the bookings yield. Regenerating the invoices repeatedly
+        therefore only touches the users whose bookings changed since the
+        last run.
+
+        """
 
         assert not self.period.finalized
 
@@ -295,24 +304,8 @@ class BillingCollection:
         period = self.period
         invoices = self.invoices
 
-        # delete all existing invoices
-        invoice_ids = invoices.query().with_entities(
-            BookingPeriodInvoice.id).scalar_subquery()
-
-        def delete_queries() -> Iterator[Query[Any]]:
-            yield session.query(InvoiceReference).filter(
-                InvoiceReference.invoice_id.in_(invoice_ids))
-
-            yield session.query(ActivityInvoiceItem).filter(
-                ActivityInvoiceItem.invoice_id.in_(invoice_ids))
-
-            yield invoices.query()
-
-        for delete_query in delete_queries():
-            delete_query.delete('fetch')
-
-        # regenerate the invoices
-        bookings = BookingCollection(session, period_id=period.id)
+        bookings = BookingCollection(
+            session, period_id=period.id, username=self.username)
 
         query = bookings.query().with_entities(
             Booking.username,
@@ -322,13 +315,108 @@ class BillingCollection:
         )
         query = query.filter(Booking.state == 'accepted')
 
-        # create the invoices/items
-        bridge = BookingInvoiceBridge(self.session, period)
+        bridge = BookingInvoiceBridge(session, period)
+
+        # the items each user should be billed for
+        expected: dict[str, list[Mapping[str, Any]]] = defaultdict(list)
+        attendee_ids: set[UUID] = set()
 
         for booking in query:
-            bridge.process(booking)
+            items = expected[booking.username]
+            attendee_ids.add(booking.attendee_id)
+
+            if item := bridge.booking_item(booking):
+                items.append(item)
+
+        if period.all_inclusive and period.booking_cost:
+            assert all_inclusive_booking_text
+            for attendee_id in attendee_ids:
+                expected[bridge.attendees[attendee_id][1]].append(
+                    bridge.all_inclusive_item(
+                        attendee_id, all_inclusive_booking_text)
+                )
+
+        # the items each user is currently billed for
+        current_ids: dict[str, list[UUID]] = defaultdict(list)
+        current: dict[UUID, list[tuple[Any, ...]]] = defaultdict(list)
+
+        for invoice_id, username in (
+            invoices.query()
+            .join(User, BookingPeriodInvoice.user_id == User.id)
+            .with_entities(BookingPeriodInvoice.id, User.username)
+        ):
+            current_ids[username].append(invoice_id)
+
+        # NOTE: We query the columns of the table to include all items,
+        #       not just the ones of the polymorphic identity
+        columns = InvoiceItem.__table__.c
+        for item in session.query(
+            columns.invoice_id,
+            *(columns[key] for key in ITEM_KEYS)
+        ).filter(columns.invoice_id.in_(
+            invoices.query().with_entities(
+                BookingPeriodInvoice.id).scalar_subquery()
+        )):
+            current[item[0]].append(tuple(item[1:]))
+
+        def unchanged(username: str) -> bool:
+            if len(current_ids[username]) != 1:
+                return False
+
+            return Counter(current[current_ids[username][0]]) == Counter(
+                item_key(item) for item in expected[username])
+
+        stale = {
+            username for username in expected.keys() | current_ids.keys()
+            if username not in expected or not unchanged(username)
+        }
+
+        # delete the invoices which no longer match the bookings
+        stale_ids = [i for u in stale for i in current_ids.get(u, ())]
+
+        if stale_ids:
+            def delete_queries() -> Iterator[Query[Any]]:
+                yield session.query(InvoiceReference).filter(
+                    InvoiceReference.invoice_id.in_(stale_ids))
 
-        bridge.complete(all_inclusive_booking_text)
+                yield session.query(InvoiceItem).filter(
+                    InvoiceItem.invoice_id.in_(stale_ids))
+
+                yield session.query(BookingPeriodInvoice).filter(
+                    BookingPeriodInvoice.id.in_(stale_ids))
+
+            for delete_query in delete_queries():
+                delete_query.delete('fetch')
+
+        # and recreate them, inserting all their items at once
+        created = {
+            username: bridge.create_invoice(username)
+            for username in stale if username in expected
+        }
+        session.flush()
+
+        session.bulk_insert_mappings(ActivityInvoiceItem, [
+            {**item, 'type': 'activity', 'invoice_id': invoice.id}
+            for username, invoice in created.items()
+            for item in expected[username]
+        ])
+
+
+#: the invoice item attributes compared to decide if an invoice changed
+ITEM_KEYS = (
+    'type', 'group', 'family', 'cost_object', 'text', 'paid', 'payment_date',
+    'tid', 'source', 'unit', 'quantity', 'vat_factor', 'attendee_id',
+    'organizer'
+)
+
+
+def item_key(item: Mapping[str, Any]) -> tuple[Any, ...]:
+    """ Returns the comparable key of an item generated from the bookings,
+    see :attr:`ITEM_KEYS`.
+
+    """
+    values = {'type': 'activity', 'paid': False, **item}
+    return tuple(values.get(key) for key in ITEM_KEYS)
 
 
 class BookingInvoiceBridge:
@@ -347,7 +435,6 @@ class BookingInvoiceBridge:
 
     attendees: dict[UUID, tuple[str, str]]
     processed_attendees: set[UUID]
-    billed_attendees: set[UUID]
 
     def __init__(
         self,
@@ -363,44 +450,20 @@ class BookingInvoiceBridge:
         self.period = period
         self.invoices = BookingPeriodInvoiceCollection(session)
 
-        # preload data
+        # preload data, limited to the period
         self.activities = {
             r.id: (
                 r.Activity.title,
                 r.Activity.user.data.get('organisation', '')
             )
-            for r in session.query(Occasion.id, Activity).join(Activity)
-        }
-
-        # holds invoices which existed already
-        self.existing = {
-            i.user.username: i for i in self.invoices.query()
-             .options(joinedload(BookingPeriodInvoice.user))
-             .filter(BookingPeriodInvoice.period_id == period.id)
+            for r in session.query(Occasion.id, Activity)
+            .join(Activity)
+            .filter(Occasion.period_id == period.id)
+            .options(joinedload(Activity.user))
         }
 
-        # holds attendee ids which already had at least one item in this period
-        stmt = as_selectable("""
-            SELECT DISTINCT
-                "group",    -- Text
-                "username", -- Text
-                attendee_id,-- UUID
-                period_id   -- UUID
-            FROM invoice_items
-
-            LEFT JOIN invoices
-                ON invoice_items.invoice_id = invoices.id
-
-            LEFT JOIN users
-                ON invoices.user_id = users.id
-
-            WHERE "group" != 'manual'
-        """)
-        self.billed_attendees = {
-            r.attendee_id for r in session.execute(
-                select(*stmt.c).where(stmt.c.period_id == period.id)
-            )
-        }
+        bookings = session.query(Booking).filter(
+            Booking.period_id == period.id)
 
         self.attendees = {
             a.id: (a.name, a.username)
@@ -408,10 +471,105 @@ class BookingInvoiceBridge:
                 Attendee.id,
                 Attendee.name,
                 Attendee.username
+            ).filter(Attendee.id.in_(
+                bookings.with_entities(Booking.attendee_id).scalar_subquery()
+            ))
+        }
+
+        self.users = dict(
+            session.query(User.username, User.id)
+            .filter(User.username.in_(
+                bookings.with_entities(Booking.username).scalar_subquery()
+            ))
+            .tuples()
+        )
+
+    @cached_property
+    def existing(self) -> dict[str, BookingPeriodInvoice]:
+        """ Holds the invoices of the period by username, including the
+        ones added through the bridge.
+
+        Only loaded when processing single bookings, the bulk creation of
+        the invoices doesn't need it.
+
+        """
+        return {
+            i.user.username: i for i in self.invoices.query()
+             .options(joinedload(BookingPeriodInvoice.user))
+             .filter(BookingPeriodInvoice.period_id == self.period.id)
+        }
+
+    @cached_property
+    def billed_attendees(self) -> set[UUID]:
+        """ Holds the attendee ids which already had at least one item in
+        this period.
+
+        """
+        columns = InvoiceItem.__table__.c
+        return set(self.session.execute(
+            select(columns.attendee_id).distinct()
+            .join(
+                BookingPeriodInvoice,
+                columns.invoice_id == BookingPeriodInvoice.id
             )
+            .where(BookingPeriodInvoice.period_id == self.period.id)
+            .where(columns.group != 'manual')
+            .where(columns.attendee_id.isnot(None))
+        ).scalars())
+
+    def create_invoice(self, username: str) -> BookingPeriodInvoice:
+        """ Adds a new invoice for the given user, without flushing. """
+
+        invoice = self.invoices.add(
+            period_id=self.period.id,
+            user_id=self.users[username],
+            flush=False,
+            optimistic=True
+        )
+        if 'existing' in vars(self):
+            self.existing[username] = invoice
+        return invoice
+
+    def booking_item(
+        self,
+        booking: HasBookingAttrs
+    ) -> dict[str, Any] | None:
+        """ Returns the values of the invoice item billed for the given
+        booking, if there's anything to bill.
+
+        """
+
+        if self.period.pay_organiser_directly or not booking.cost:
+            return None
+
+        return {
+            'group': self.attendees[booking.attendee_id][0],
+            'attendee_id': booking.attendee_id,
+            'text': self.activities[booking.occasion_id][0],
+            'organizer': self.activities[booking.occasion_id][1],
+            'unit': booking.cost,
+            'quantity': Decimal('1')
         }
 
-        self.users = dict(session.query(User.username, User.id).tuples())
+    def all_inclusive_item(
+        self,
+        attendee_id: UUID,
+        all_inclusive_booking_text: str
+    ) -> dict[str, Any]:
+        """ Returns the values of the invoice item billed once per attendee
+        for all-inclusive periods.
+
+        """
+
+        assert self.period.booking_cost
+        return {
+            'group': self.attendees[attendee_id][0],
+            'attendee_id': attendee_id,
+            'text': all_inclusive_booking_text,
+            'organizer': '',
+            'unit': self.period.booking_cost,
+            'quantity': Decimal('1')
+        }
 
     def process(self, booking: HasBookingAttrs) -> None:
         """ Processes a single booking. This may be a tuple that includes
@@ -425,27 +583,12 @@ class BookingInvoiceBridge:
         """
 
         if booking.username not in self.existing:
-            self.existing[booking.username] = self.invoices.add(
-                period_id=self.period.id,
-                user_id=self.users[booking.username],
-                flush=False,
-                optimistic=True
-            )
+            self.create_invoice(booking.username)
 
         self.processed_attendees.add(booking.attendee_id)
 
-        if self.period.pay_organiser_directly or not booking.cost:
-            return
-
-        self.existing[booking.username].add(
-            group=self.attendees[booking.attendee_id][0],
-            attendee_id=booking.attendee_id,
-            text=self.activities[booking.occasion_id][0],
-            organizer=self.activities[booking.occasion_id][1],
-            unit=booking.cost,
-            quantity=Decimal('1'),
-            flush=False
-        )
+        if item := self.booking_item(booking):
+            self.existing[booking.username].add(**item, flush=False)
 
     def complete(self, all_inclusive_booking_text: str | None) -> None:
         """ Finalises the processed bookings. """
@@ -460,10 +603,6 @@ class BookingInvoiceBridge:
                 and id not in self.billed_attendees
             ):
                 self.existing[username].add(
-                    group=attendee,
-                    attendee_id=id,
-                    text=all_inclusive_booking_text,
-                    unit=self.period.booking_cost,
-                    quantity=Decimal('1'),
+                    **self.all_inclusive_item(id, all_inclusive_booking_text),
                     flush=False
                 )
@@ -10,8 +10,12 @@ from onegov.core.orm.mixins import (
 from onegov.core.utils import normalize_for_url
 from onegov.search import SearchableContent
 from sqlalchemy import and_
+from sqlalchemy import case
 from sqlalchemy import column
+from sqlalchemy import false
+from sqlalchemy import func
 from sqlalchemy import not_
+from sqlalchemy import or_
 from sqlalchemy import select
 from sqlalchemy import Column
 from sqlalchemy import ForeignKey
@@ -19,6 +23,7 @@ from sqlalchemy import Index
 from sqlalchemy import Table
 from sqlalchemy import Text
 from sqlalchemy import UUID as UUIDType
+from sqlalchemy.dialects.postgresql import array
 from sqlalchemy.orm import mapped_column, relationship, Mapped
 from sqlalchemy.orm import object_session, validates
 from translationstring import TranslationString
@@ -26,6 +31,13 @@ from uuid import uuid4
 from uuid import UUID
 
 
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from collections.abc import Collection
+    from sqlalchemy.orm import Query
+    from sqlalchemy.sql import ColumnElement
+
+
 # Newsletters and recipients are joined in a many to many relationship
 newsletter_recipients = Table(
     'newsletter_recipients',
@@ -107,20 +119,27 @@ class Newsletter(Base, ContentMixin, TimestampMixin, SearchableContent):
 
     @property
     def open_recipients(self) -> tuple[Recipient, ...]:
+        return tuple(self.open_recipients_query())
+
+    def open_recipients_query(self) -> Query[Recipient]:
+        """ Returns a query of the confirmed recipients that did not
+        receive this newsletter yet.
+
+        """
         session = object_session(self)
         assert session is not None
 
         received = select(newsletter_recipients.c.recipient_id).where(
             newsletter_recipients.c.newsletter_id == self.name)
 
-        return tuple(session.query(Recipient).filter(
+        return session.query(Recipient).filter(
             and_(
                 not_(
                     Recipient.id.in_(received)
                 ),
                 Recipient.confirmed == True
             )
-        ))
+        )
 
     #: categories the newsletter reports on
     newsletter_categories: dict_property[list[str] | None] = content_property()
@@ -191,6 +210,39 @@ class Recipient(Base, TimestampMixin, ContentMixin):
     def subscription(self) -> Subscription:
         return Subscription(self, self.token)
 
+    @classmethod
+    def subscribed_to_any(
+        cls,
+        categories: Collection[str],
+        include_unselected: bool = True
+    ) -> ColumnElement[bool]:
+        """ Matches the recipients subscribed to any of the given
+        categories.
+
+        For legacy reasons, recipients without a selection are subscribed to
+        all categories. Whether this applies to the given categories has to
+        be decided by the caller (``include_unselected``).
+
+        """
+        selection = cls.content['subscribed_categories']
+        subscribed: ColumnElement[bool]
+        if categories:
+            subscribed = selection.has_any(array(tuple(categories)))
+        else:
+            subscribed = false()
+
+        if not include_unselected:
+            return subscribed
+
+        unselected = case(
+            (
+                func.jsonb_typeof(selection) == 'array',
+                func.jsonb_array_length(selection)
+            ),
+            else_=0
+        ) == 0
+        return or_(subscribed, unselected)
+
     @property
     def is_inactive(self) -> bool:
         """
@@ -219,6 +271,14 @@ class Recipient(Base, TimestampMixin, ContentMixin):
         self.meta['inactive'] = False
 
 
+# speeds up the selection of the recipients of a newsletter by category
+Index(
+    'recipient_subscribed_categories',
+    Recipient.content['subscribed_categories'],
+    postgresql_using='gin'
+)
+
+
 class Subscription:
     """ Adds subscription management to a recipient. """
 
@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from onegov.core.upgrade import upgrade_task
 from onegov.core.orm.types import UTCDateTime, JSON
-from sqlalchemy import Boolean, Column
+from sqlalchemy import text, Boolean, Column
 
 
 from typing import TYPE_CHECKING
@@ -37,3 +37,15 @@ def add_daily_newsletter_column(context: UpgradeContext) -> None:
             'recipients', Column('daily_newsletter', Boolean, nullable=True,
                                   default=False)
         )
+
+
+@upgrade_task('Add subscribed categories index')
+def add_subscribed_categories_index(context: UpgradeContext) -> None:
+    if context.has_table('recipients'):
+        context.operations.create_index(
+            'recipient_subscribed_categories',
+            'recipients',
+            [text("(content -> 'subscribed_categories')")],
+            postgresql_using='gin',
+            if_not_exists=True
+        )
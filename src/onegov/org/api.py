@@ -6,9 +6,11 @@ from datetime import date
 from functools import cached_property
 from onegov.api.models import ApiEndpoint, ApiEndpointItem
 from onegov.api.models import ApiInvalidParamException
+from onegov.api.models import keyset_batch, query_fingerprint
 from onegov.core.collection import Pagination
 from onegov.core.converters import extended_date_decode
 from onegov.event.collections import OccurrenceCollection
+from onegov.event.models import Event, EventFile, Occurrence
 from onegov.form import FormCollection
 from onegov.form.models import FormDefinition
 from onegov.gis import Coordinates
@@ -25,18 +27,18 @@ from onegov.reservation.collection import ResourceCollection
 from onegov.reservation.models import Resource
 from onegov.search import SearchIndex
 from onegov.search.utils import language_from_locale
-from sqlalchemy import and_, func, or_
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.exc import SQLAlchemyError
 from uuid import UUID
 
 
 from typing import Any, Protocol, Self, TYPE_CHECKING
 if TYPE_CHECKING:
-    from collections.abc import Collection, Mapping, Sequence
+    from collections.abc import Collection, Iterator, Mapping, Sequence
+    from onegov.api.models import Fingerprint, LastChange
     from onegov.core.collection import PKType
     from onegov.core.orm.mixins import ContentMixin
     from onegov.core.orm.mixins import TimestampMixin
-    from onegov.event.models import Occurrence
     from onegov.org.app import OrgApp
     from onegov.org.request import OrgRequest
     from sqlalchemy.orm import DeclarativeBase, Query
@@ -200,17 +202,36 @@ class PaginatedSumCollection[T: DeclarativeBase, IdT: PKType](Pagination[T]):
             'PaginatedSumCollection does not expose a single cached subset'
         )
 
-    @cached_property
-    def counts(self) -> tuple[int, ...]:
-        return tuple(
-            apply_visibility_filters(
+    def queries(self) -> Iterator[Query[T]]:
+        for collection, model_class in self.collections:
+            yield apply_visibility_filters(
                 self.request,
-                collection.query().order_by(None),
+                collection.query(),
                 model_class,
-            ).count()
-            for collection, model_class in self.collections
+            )
+
+    @cached_property
+    def fingerprints(self) -> tuple[Fingerprint, ...]:
+        return tuple(
+            query_fingerprint(query) or (query.order_by(None).count(), None)
+            for query in self.queries()
+        )
+
+    @cached_property
+    def fingerprint(self) -> Fingerprint | None:
+        if any(last_change is None for __, last_change in self.fingerprints):
+            return None
+
+        return self.subset_count, max(
+            last_change for __, last_change in self.fingerprints
         )
 
+    @cached_property
+    def counts(self) -> tuple[int, ...]:
+        # NOTE: We get the counts together with the last changes, so the
+        #       endpoint can tell if anything changed without querying again
+        return tuple(count for count, __ in self.fingerprints)
+
     @cached_property
     def subset_count(self) -> int:
         return sum(self.counts)
@@ -221,28 +242,57 @@ class PaginatedSumCollection[T: DeclarativeBase, IdT: PKType](Pagination[T]):
         remaining = self.batch_size
         items: list[T] = []
 
-        for (
-            collection,
-            model_class,
-        ), count in zip(self.collections, self.counts):
+        for query, count in zip(self.queries(), self.counts):
             if remaining <= 0:
                 break
             if offset >= count:
                 offset -= count
                 continue
 
-            query = apply_visibility_filters(
-                self.request,
-                collection.query(),
-                model_class,
-            ).offset(offset).limit(remaining)
-            batch = tuple(query)
+            batch = tuple(query.offset(offset).limit(remaining))
             items.extend(batch)
             remaining -= len(batch)
             offset = 0
 
         return tuple(items)
 
+    def keyset_batch(
+        self,
+        cursor: str | None
+    ) -> tuple[tuple[T, ...], str | None]:
+        """ Walks the collections one after the other, the cursor consists
+        of the index of the collection and the cursor within it.
+
+        """
+
+        index, __, key = (cursor or '').partition('.')
+        try:
+            start = int(index) if index else 0
+        except ValueError:
+            raise ApiInvalidParamException(
+                f'Invalid cursor {cursor!r}'
+            ) from None
+
+        items: list[T] = []
+        for ix, query in enumerate(self.queries()):
+            if ix < start:
+                continue
+
+            remaining = self.batch_size - len(items)
+            if remaining <= 0:
+                return tuple(items), f'{ix}.'
+
+            batch, next_key = keyset_batch(
+                query,
+                key if ix == start else None,
+                remaining
+            )
+            items.extend(batch)
+            if next_key is not None:
+                return tuple(items), f'{ix}.{next_key}'
+
+        return tuple(items), None
+
     def page_by_index(self, index: int) -> Self:
         return self.__class__(
             self.request,
@@ -403,6 +453,16 @@ class EventApiEndpoint(ApiEndpoint['Occurrence', UUID]):
         result.batch_size = self.batch_size
         return result
 
+    @property
+    def last_changes(self) -> tuple[LastChange, ...]:
+        # most of the data comes from the event, which may change without
+        # changing its occurrences, the same goes for its image and pdf
+        return (
+            Occurrence.last_change,
+            Event.last_change,
+            select(func.max(EventFile.last_change)).scalar_subquery()
+        )
+
     def item_data(self, item: Occurrence) -> dict[str, Any]:
         source = item.event.source
         if source:
@@ -622,8 +682,9 @@ class DirectoryEntryApiEndpoint(ApiEndpoint[ExtendedDirectoryEntry, UUID]):
         name: str,
         extra_parameters: dict[str, list[str]] | None = None,
         page: int | None = None,
+        cursor: str | None = None,
     ):
-        super().__init__(request, extra_parameters, page)
+        super().__init__(request, extra_parameters, page, cursor)
         self.endpoint = name
 
     @property
@@ -668,6 +729,15 @@ class DirectoryEntryApiEndpoint(ApiEndpoint[ExtendedDirectoryEntry, UUID]):
         return self.__class__(self.request, self.endpoint,
                               self.extra_parameters, page)
 
+    def for_cursor(self, cursor: str) -> Self:
+        """ Return a new endpoint instance with the given cursor while keeping
+        the current filters.
+
+        """
+
+        return self.__class__(self.request, self.endpoint,
+                              self.extra_parameters, cursor=cursor)
+
     def for_filter(self, **filters: Any) -> Self:
         """ Return a new endpoint instance with the given filters while
         discarding the current filters and page.
@@ -18,6 +18,7 @@ from onegov.core import Framework, utils
 from onegov.core.framework import default_content_security_policy
 from onegov.core.i18n import default_locale_negotiator
 from onegov.core.orm.cache import orm_cached, request_cached
+from onegov.core.rate_limit import RateLimit, RateLimitRule
 from onegov.core.templates import PageTemplate, render_template
 from onegov.core.widgets import transform_structure
 from onegov.file import DepotApp
@@ -229,7 +230,7 @@ class OrgApp(Framework, LibresIntegration, SearchApp, MapboxApp, DepotApp,
     def homepage_template(self) -> PageTemplate:
         return PageTemplate(self._homepage_template_str)
 
-    @orm_cached(policy='on-table-change:tickets')
+    @orm_cached(policy='on-column-change:tickets:state')
     def ticket_count(self) -> TicketCount:
         return TicketCollection(self.session()).get_count()
 
@@ -590,6 +591,17 @@ def get_template_directory() -> str:
     return 'templates'
 
 
+@OrgApp.setting(section='rate_limits', name='rules')
+def get_rate_limit_rules() -> tuple[RateLimitRule, ...]:
+    return (
+        # the search (and its suggestions) is expensive and a popular
+        # target of scrapers
+        RateLimitRule('search', '/search(/.*)?', RateLimit(120, 60)),
+        # the occupancy of resources
+        RateLimitRule('slots', '/resource/[^/]+/slots', RateLimit(120, 60)),
+    )
+
+
 @OrgApp.setting(section='core', name='theme')
 def get_theme() -> OrgTheme:
     return OrgTheme()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import niquests
 import pytz
 import logging
+import transaction
 
 from babel.dates import get_month_names
 from collections import OrderedDict
@@ -65,6 +66,7 @@ from sqlalchemy import and_, or_, func, text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.inspection import inspect
 from sqlalchemy.orm import undefer, joinedload
+from time import perf_counter
 from urllib3.util import Retry
 from uuid import UUID
 
@@ -124,7 +126,8 @@ def send_scheduled_newsletter(request: OrgRequest) -> None:
     ))
 
     for newsletter in newsletters:
-        send_newsletter(request, newsletter, newsletter.open_recipients)
+        send_newsletter(
+            request, newsletter, newsletter.open_recipients_query())
         newsletter.scheduled = None
 
 
@@ -185,7 +188,7 @@ def send_daily_newsletter(request: OrgRequest) -> None:
                 newsletter.content['news'] = [news_id for news_id, in news]
 
                 send_newsletter(request=request, newsletter=newsletter,
-                                recipients=recipients.all(), daily=True)
+                                recipients=recipients, daily=True)
 
 
 def publish_files(request: OrgRequest) -> None:
@@ -328,8 +331,40 @@ def cancel_stale_open_saferpay_transactions(request: OrgRequest) -> None:
 def process_resource_rules(request: OrgRequest) -> None:
     resources = ResourceCollection(request.app.libres_context)
 
-    for resource in resources.query():
-        handle_rules_cronjob(resources.bind(resource), request)
+    # only load the resources which actually have rules
+    query = resources.query().options(undefer(Resource.content)).filter(
+        func.jsonb_array_length(Resource.content['rules']) > 0
+    )
+
+    total = 0
+    started = perf_counter()
+    for resource in query:
+        start = perf_counter()
+
+        # NOTE: A broken rule on one resource should not prevent the
+        #       rules of all the other resources from being processed
+        request.session.flush()
+        savepoint = transaction.savepoint()
+        try:
+            count = handle_rules_cronjob(resources.bind(resource), request)
+            request.session.flush()
+        except Exception:
+            savepoint.rollback()
+            log.exception(
+                f'Cron: Failed to process rules of resource {resource.id}'
+            )
+            continue
+
+        total += count
+        log.info(
+            f'Cron: Processed rules of resource {resource.id}, created '
+            f'{count} allocations in {perf_counter() - start:.3f}s'
+        )
+
+    log.info(
+        f'Cron: Created {total} allocations from rules '
+        f'in {perf_counter() - started:.3f}s'
+    )
 
 
 def ticket_statistics_common_template_args(
@@ -875,6 +910,15 @@ def archive_old_tickets(request: OrgRequest) -> None:
         ticket.archive_ticket()
 
 
+@OrgApp.cronjob(hour=3, minute=15, timezone='Europe/Zurich')
+def reconcile_ticket_counts(request: OrgRequest) -> None:
+    """ The ticket counters are maintained incrementally, this recounts them
+    once a day to fix any drift caused by bulk changes.
+
+    """
+    TicketCollection(request.session).reconcile_count()
+
+
 @OrgApp.cronjob(hour=5, minute=30, timezone='Europe/Zurich')
 def delete_old_tickets(request: OrgRequest) -> None:
     delete_timespan = request.app.org.auto_delete_timespan
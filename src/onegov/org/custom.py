@@ -439,8 +439,8 @@ def get_api_endpoints(request: OrgRequest) -> Iterator[ApiEndpoint[Any, Any]]:
     yield PersonApiEndpoint(request)
     yield ResourceApiEndpoint(request)
     yield TopicApiEndpoint(request)
-    directories = request.exclude_invisible(
-        request.session.query(ExtendedDirectory))
+    directories = request.exclude_invisible(request.filter_visible(
+        request.session.query(ExtendedDirectory)))
     for directory in directories:
         yield DirectoryEntryApiEndpoint(
             request=request,
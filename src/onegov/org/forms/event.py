@@ -10,8 +10,7 @@ from dateutil.parser import parse
 from dateutil.rrule import rrulestr
 from itertools import chain
 
-from onegov.core.csv import convert_excel_to_csv
-from onegov.core.csv import CSVFile
+from onegov.core.csv import ExcelFile
 from onegov.event.collections import EventCollection, OccurrenceCollection
 from onegov.event.models import EventFile
 from onegov.form import Form
@@ -636,9 +635,11 @@ class EventImportForm(Form):
                 session.delete(event)
 
         assert self.file.file is not None
-        csvfile = convert_excel_to_csv(self.file.file)
         try:
-            csv = CSVFile(csvfile, expected_headers=expected_headers.values())
+            csv = ExcelFile(
+                self.file.file,
+                expected_headers=expected_headers.values()
+            )
         except Exception:
             error_string = self.request.translate(
                 _('Expected header line with the following columns:')
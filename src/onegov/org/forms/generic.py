@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from dicttoxml import dicttoxml  # type:ignore[import-untyped]
 from morepath.request import Response
-from onegov.core.csv import convert_list_of_dicts_to_csv
-from onegov.core.csv import convert_list_of_dicts_to_xlsx
-from onegov.core.utils import normalize_for_url
+from onegov.core.csv import convert_list_of_dicts_to_csv_file
+from onegov.core.csv import convert_list_of_dicts_to_xlsx_file
+from onegov.core.utils import normalize_for_url, stream_file
 from onegov.form import Form
 from onegov.form.filters import as_float
 from onegov.org import _
@@ -21,7 +21,7 @@ from wtforms.validators import ValidationError
 
 from typing import Any, TYPE_CHECKING
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable
     from onegov.core.orm.abstract import AdjacencyList
     from onegov.org.request import OrgRequest
 
@@ -75,19 +75,27 @@ class ExportForm(Form):
 
     def as_export_response(
         self,
-        results: Sequence[dict[str, Any]],
+        results: Iterable[dict[str, Any]],
         title: str = 'export',
         **kwargs: Any
     ) -> Response:
-        """ Turns the given results (list of dicts) into a webob response
+        """ Turns the given results (iterable of dicts) into a webob response
         with the currently selected file format.
 
         The additional keyword arguments are directly passed into the
-        convert_list_of_dicts_to_* functions.
+        convert_list_of_dicts_to_*_file functions.
+
+        Csv and xlsx files consume the results only once and are written to
+        a temporary file, which is then streamed to the client. So the
+        results may be a generator, which keeps large exports from being
+        held in memory.
 
         For json and xml, these additional arguments are ignored.
 
         """
+        if self.format in ('json', 'xml'):
+            results = list(results)
+
         if self.format == 'json':
             return Response(
                 json_body=results,
@@ -99,13 +107,16 @@ class ExportForm(Form):
 
         if self.format == 'csv':
             return Response(
-                convert_list_of_dicts_to_csv(results, **kwargs),
-                content_type='text/plain'
+                app_iter=stream_file(
+                    convert_list_of_dicts_to_csv_file(results, **kwargs)),
+                content_type='text/plain',
+                charset='utf-8'
             )
 
         if self.format == 'xlsx':
             return Response(
-                convert_list_of_dicts_to_xlsx(results, **kwargs),
+                app_iter=stream_file(
+                    convert_list_of_dicts_to_xlsx_file(results, **kwargs)),
                 content_type=(
                     'application/vnd.openxmlformats'
                     '-officedocument.spreadsheetml.sheet'
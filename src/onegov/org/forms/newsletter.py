@@ -4,7 +4,7 @@ from collections import OrderedDict
 from datetime import timedelta
 import transaction
 from wtforms.validators import DataRequired
-from onegov.core.csv import convert_excel_to_csv, CSVFile
+from onegov.core.csv import ExcelFile
 from onegov.form.fields import UploadField
 from onegov.org.forms.fields import HtmlField
 from onegov.form.validators import FileSizeLimit, MIME_TYPES_EXCEL
@@ -396,16 +396,13 @@ class NewsletterSubscriberImportExportForm(Form):
         recipients = RecipientCollection(session)
         try:
             assert self.file.file is not None
-            csvfile = convert_excel_to_csv(self.file.file)
-        except Exception:
+            csv = ExcelFile(self.file.file)
+            lines = list(csv.lines)
+        except (OSError, KeyError, NotImplementedError):
             return 0, ['Error converting file']
-        try:
-            # dialect needs to be set, else error
-            csv = CSVFile(csvfile, dialect='excel')
         except Exception:
             return 0, ['Error reading CSV file']
 
-        lines = list(csv.lines)
         columns = {
             key: csv.as_valid_identifier(value)
             for key, value in headers.items()
@@ -150,7 +150,8 @@ class DirectoriesWidget:
                     {'directory_name': d.name}
                 ),
                 subtitle=d.lead
-            ) for d in layout.request.exclude_invisible(directories.query())
+            ) for d in layout.request.exclude_invisible(
+                layout.request.filter_visible(directories.query()))
         ]
 
         links.append(
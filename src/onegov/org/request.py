@@ -6,18 +6,18 @@ from onegov.core.custom import msgpack
 from onegov.core.orm import orm_cached
 from onegov.core.request import CoreRequest, is_logged_in
 from onegov.core.security import Private
-from onegov.core.utils import normalize_for_url
+from onegov.core.utils import normalize_for_url, Bunch
 from onegov.org.models import News, TANAccessCollection, Topic
 from onegov.page import Page, PageCollection
 from onegov.user import User
 from sedate import utcnow
-from sqlalchemy import inspect
-from sqlalchemy.orm import noload
+from sqlalchemy import func, inspect
 
 
 from typing import Any, NamedTuple, TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Generator, Iterable
+    from datetime import datetime
     from onegov.core.analytics import AnalyticsProvider
     from onegov.core.layout import Layout
     from onegov.org.app import OrgApp
@@ -53,6 +53,31 @@ class PageMeta(NamedTuple):
         )
 
 
+@msgpack.make_serializable(tag=21)
+class PageRow(NamedTuple):
+    """ The role-independent data of a single page, which is needed to
+    build the :attr:`OrgRequest.pages_tree`.
+
+    """
+    id: int
+    parent_id: int | None
+    type: str
+    title: str
+    name: str
+    access: str
+    publication_start: datetime | None
+    publication_end: datetime | None
+    is_visible_on_homepage: bool | None
+
+    def published_as_of(self, moment: datetime) -> bool:
+        return (
+            (self.publication_start is None
+             or self.publication_start <= moment)
+            and (self.publication_end is None
+                 or self.publication_end >= moment)
+        )
+
+
 class OrgRequest(CoreRequest):
 
     if TYPE_CHECKING:
@@ -215,32 +240,68 @@ class OrgRequest(CoreRequest):
             return self.has_role(*roles)
         return ticket.handler_code in (self.app.org.ticket_auto_accepts or ())
 
-    @orm_cached(policy='on-table-change:pages', by_role=True)
-    def pages_tree(self) -> tuple[PageMeta, ...]:
+    @orm_cached(policy=(
+        'on-column-change:pages:parent_id,type,title,name,order,meta,'
+        'publication_start,publication_end'
+    ))
+    def page_rows(self) -> tuple[PageRow, ...]:
         """
-        This is the entire pages tree preloaded into the individual
-        parent/children attributes. We optimize this as much as possible
-        by performing the recursive join in Python, rather than SQL.
+        The data of all the pages needed to build the pages tree, ordered
+        by their position among their siblings.
+
+        This is independent of the current role, so it only needs to be
+        rebuilt once after a page changes. It is loaded using a single
+        query, which only selects the necessary columns.
 
         """
         query = PageCollection(self.session).query(ordered=False)
-        query = query.options(
-            # we populate these relationship ourselves
-            noload(Page.parent),
-            noload(Page.children),
+        query = query.with_entities(
+            Page.id,
+            Page.parent_id,
+            Page.type,
+            Page.title,
+            Page.name,
+            func.coalesce(Page.meta['access'].astext, 'public'),
+            Page.publication_start,
+            Page.publication_end,
+            Page.meta['is_visible_on_homepage'].as_boolean(),
         )
         query = query.order_by(Page.order)
 
-        # first we build a map from parent_ids to their children
-        parent_to_child: dict[int | None, list[Page]] = {}
-        for page in query:
-            parent_to_child.setdefault(page.parent_id, []).append(page)
+        return tuple(PageRow(*row) for row in query.tuples())
+
+    @cached_property
+    def pages_tree(self) -> tuple[PageMeta, ...]:
+        """
+        This is the entire pages tree, containing only the pages visible
+        to the current user. We optimize this as much as possible by
+        performing the recursive join in Python, rather than SQL.
 
-        def extend_path(page: Page, path: str | None) -> str:
-            if page.type == 'news' and path is None:
+        """
+
+        # first we build a map from parent_ids to their children
+        parent_to_child: dict[int | None, list[PageRow]] = {}
+        for row in self.page_rows:
+            parent_to_child.setdefault(row.parent_id, []).append(row)
+
+        # the visibility only depends on the access and publication, so
+        # we only need to check each combination once
+        now = utcnow()
+        visibility: dict[tuple[str, bool], bool] = {}
+
+        def is_visible(access: str, published: bool) -> bool:
+            key = (access, published)
+            if key not in visibility:
+                visibility[key] = self.is_visible(
+                    Bunch(access=access, published=published)
+                ) and (published or self.is_manager)
+            return visibility[key]
+
+        def extend_path(row: PageRow, path: str | None) -> str:
+            if row.type == 'news' and path is None:
                 # the root news page is not part of the path
                 return ''
-            return f'{path}/{page.name}' if path else page.name
+            return f'{path}/{row.name}' if path else row.name
 
         def generate_subtree(
             parent_id: int | None,
@@ -248,26 +309,27 @@ class OrgRequest(CoreRequest):
         ) -> tuple[PageMeta, ...]:
             return tuple(
                 PageMeta(
-                    id=page.id,
-                    type=page.type,
-                    title=page.title,
-                    access=page.meta.get('access', 'public'),
+                    id=row.id,
+                    type=row.type,
+                    title=row.title,
+                    access=row.access,
                     published=published,
-                    path=(subpath := extend_path(page, path)),
-                    is_visible_on_homepage=page.meta.get('is_visible_on_homepage'),
-                    children=tuple(generate_subtree(page.id, subpath))
+                    path=(subpath := extend_path(row, path)),
+                    is_visible_on_homepage=row.is_visible_on_homepage,
+                    children=tuple(generate_subtree(row.id, subpath))
+                )
+                for row in parent_to_child.get(parent_id, ())
+                if is_visible(
+                    row.access,
+                    published := row.published_as_of(now)
                 )
-                for page in parent_to_child.get(parent_id, ())
-                if self.is_visible(page)
-                if (published := getattr(page, 'published', True))
-                or self.is_manager
             )
 
         # we return the root pages which should contain references to all
         # the child pages
         return generate_subtree(None, None)
 
-    @orm_cached(policy='on-table-change:pages', by_role=True)
+    @cached_property
     def root_pages(self) -> tuple[PageMeta, ...]:
 
         def include(page: PageMeta) -> bool:
@@ -278,7 +340,7 @@ class OrgRequest(CoreRequest):
 
         return tuple(p for p in self.pages_tree if include(p))
 
-    @orm_cached(policy='on-table-change:pages', by_role=True)
+    @cached_property
     def homepage_pages(self) -> dict[int, list[PageMeta]]:
 
         def visit_topics(
@@ -27,6 +27,7 @@ from onegov.file import FileCollection
 from onegov.org import _
 from onegov.org.elements import DeleteLink, Link
 from onegov.org.models.search import Search
+from onegov.org.models.swiss_holidays import SwissHolidays
 from onegov.pay import InvoiceItemMeta, Price
 from onegov.reservation import Resource
 from onegov.ticket import Ticket, TicketCollection, TicketPermission
@@ -697,6 +698,37 @@ class AllocationEventInfo:
         }
 
 
+@lru_cache(maxsize=128)
+def holidays_in_range(
+    cantons: tuple[str, ...],
+    other: tuple[tuple[Any, ...], ...],
+    school: tuple[tuple[int, ...], ...],
+    start: date,
+    end: date
+) -> tuple[tuple[date, date | None, str], ...]:
+    """ Returns the school holidays and public holidays between start and
+    end as tuples of start, end (``None`` for single days) and the
+    untranslated title.
+
+    The holiday settings of the organisation are passed in as hashable
+    tuples, so the result can be cached per settings and date range.
+
+    """
+    result: list[tuple[date, date | None, str]] = []
+
+    for y1, m1, d1, y2, m2, d2 in school:
+        holiday_start = date(y1, m1, d1)
+        holiday_end = date(y2, m2, d2)
+        if sedate.overlaps(holiday_start, holiday_end, start, end):
+            result.append((holiday_start, holiday_end, _('School holidays')))
+
+    holidays = SwissHolidays(cantons=cantons, other=other)
+    for holiday_date, descriptions in holidays.between(start, end):
+        result.append((holiday_date, None, '\n'.join(descriptions)))
+
+    return tuple(result)
+
+
 class HolidayEventInfo:
 
     __slots__ = (
@@ -727,28 +759,15 @@ class HolidayEventInfo:
         end: date
     ) -> Iterator[Self]:
 
-        for holiday_start, holiday_end in request.app.org.school_holidays:
-            if sedate.overlaps(
-                holiday_start, holiday_end,
-                start, end
-            ):
-                yield cls(
-                    holiday_start,
-                    holiday_end,
-                    _('School holidays'),
-                    request
-                )
-
-        for holiday_date, descriptions in request.app.org.holidays.between(
+        settings = request.app.org.holiday_settings
+        for holiday_start, holiday_end, title in holidays_in_range(
+            tuple(settings.get('cantons', ())),
+            tuple(tuple(entry) for entry in settings.get('other', ())),
+            tuple(tuple(entry) for entry in settings.get('school', ())),
             start,
             end
         ):
-            yield cls(
-                holiday_date,
-                None,
-                '\n'.join(descriptions),
-                request
-            )
+            yield cls(holiday_start, holiday_end, title, request)
 
     @property
     def event_start(self) -> str:
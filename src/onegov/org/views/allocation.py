@@ -631,13 +631,16 @@ def rule_id_from_request(request: OrgRequest) -> str:
     return rule_id
 
 
-def handle_rules_cronjob(resource: Resource, request: OrgRequest) -> None:
+def handle_rules_cronjob(resource: Resource, request: OrgRequest) -> int:
     """ Handles all cronjob duties of the rules stored on the given
     resource.
 
+    Returns the number of allocations which were created. Allocations which
+    already exist are skipped, so running this more than once is harmless.
+
     """
     if not resource.content.get('rules'):
-        return
+        return 0
 
     targets = []
 
@@ -684,12 +687,18 @@ def handle_rules_cronjob(resource: Resource, request: OrgRequest) -> None:
         prepare_rule(r) for r
         in resource.content.get('rules', ())]
 
+    if not targets:
+        return 0
+
     form_class = get_allocation_rule_form_class(resource, request)
 
+    count = 0
     for rule in targets:
         form = request.get_form(form_class, csrf_support=False, model=resource)
         form.rule = rule
-        form.apply(resource)
+        count += form.apply(resource)
+
+    return count
 
 
 def delete_rule(resource: Resource, rule_id: str) -> None:
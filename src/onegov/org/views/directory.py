@@ -163,7 +163,8 @@ def view_directories(
     return {
         'title': _('Directories'),
         'layout': layout or DirectoryCollectionLayout(self, request),
-        'directories': request.exclude_invisible(self.query()),
+        'directories': request.exclude_invisible(
+            request.filter_visible(self.query())),
         'link': lambda directory: request.link(
             ExtendedDirectoryEntryCollection(
                 directory,
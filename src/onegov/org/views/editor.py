@@ -310,10 +310,8 @@ def handle_change_page_url(
             #        a change in the pages tables, which in turn
             #        will clear these caches. But I suppose it doesn't
             #        hurt to clear them twice...
-            for prop_name in ('root_pages', 'pages_tree', 'homepage_pages'):
-                prop = getattr(request.__class__, prop_name)
-                for cache_key in prop.used_cache_keys:
-                    request.app.cache.delete(cache_key)
+            for cache_key in request.__class__.page_rows.used_cache_keys:
+                request.app.cache.delete(cache_key)
             request.success(_('Your changes were saved'))
 
             @request.after
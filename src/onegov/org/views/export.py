@@ -55,7 +55,7 @@ def view_export(
     if form.submitted(request):
         f = layout.export_formatter(form.format)  # type:ignore[attr-defined]
 
-        rows = tuple(
+        rows = (
             OrderedDict((f(k), f(v)) for k, v in row)
             for row in self.run(form, request.session)
         )
@@ -9,6 +9,7 @@ from itertools import groupby
 from markupsafe import Markup
 from onegov.core.elements import Link
 from onegov.core.html import html_to_text
+from onegov.core.mail import format_address
 from onegov.core.security import Public, Private
 from onegov.core.templates import render_template
 from onegov.event import Occurrence, OccurrenceCollection
@@ -19,6 +20,8 @@ from onegov.newsletter import Newsletter
 from onegov.newsletter import NewsletterCollection
 from onegov.newsletter import Recipient
 from onegov.newsletter import RecipientCollection
+from onegov.newsletter import Subscription
+from onegov.newsletter.models import newsletter_recipients
 from onegov.newsletter.errors import AlreadyExistsError
 from onegov.org import _, OrgApp
 from onegov.org.forms import NewsletterForm, ExportForm
@@ -37,18 +40,17 @@ from onegov.org.utils import extract_categories_and_subcategories
 from onegov.org.utils import ORDERED_ACCESS
 from onegov.org.views.utils import show_tags, show_filters
 from sedate import utcnow
-from sqlalchemy.orm import undefer
-from string import Template
-from uuid import UUID
+from sqlalchemy import insert, select
+from sqlalchemy.orm import undefer, Query
+from uuid import uuid4, UUID
 from webob.exc import HTTPNotFound
 
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    from collections.abc import Callable, Iterable, Iterator
     from onegov.core.types import EmailJsonDict, RenderData
     from onegov.org.request import OrgRequest
-    from sqlalchemy.orm import Query
     from webob import Response
 
 
@@ -597,14 +599,47 @@ def delete_newsletter(self: Newsletter, request: OrgRequest) -> None:
     request.success(_('The newsletter was deleted'))
 
 
+def unsubscribe_link_factory(
+    request: OrgRequest
+) -> Callable[[UUID, str], str]:
+    """ Returns a function generating the unsubscribe link of a recipient
+    from its id and token.
+
+    The link is only generated once with placeholders, which are then
+    replaced for each recipient.
+
+    """
+    id_placeholder = uuid4()
+    token_placeholder = uuid4().hex
+    link = request.class_link(
+        Subscription,
+        {'recipient_id': id_placeholder, 'token': token_placeholder},
+        name='unsubscribe'
+    )
+    prefix, rest = link.split(id_placeholder.hex, 1)
+    infix, suffix = rest.split(token_placeholder, 1)
+
+    def unsubscribe_link(recipient_id: UUID, token: str) -> str:
+        return f'{prefix}{recipient_id.hex}{infix}{token}{suffix}'
+
+    return unsubscribe_link
+
+
 def send_newsletter(
     request: OrgRequest,
     newsletter: Newsletter,
-    recipients: Iterable[Recipient],
+    recipients: Iterable[Recipient] | Query[Recipient],
     is_test: bool = False,
     daily: bool = False,
     layout: DefaultMailLayout | None = None
 ) -> int:
+    """ Sends the newsletter to the given recipients, as far as they are
+    subscribed to the categories of the newsletter.
+
+    Pass a query to have the recipients selected by the database, which is
+    a lot faster for large lists of recipients.
+
+    """
     layout = layout or DefaultMailLayout(newsletter, request)
     if request.app.org.secret_content_allowed:
         news = newsletter_news_by_access(newsletter, request, access='secret')
@@ -638,58 +673,116 @@ def send_newsletter(
             'daily_link_text': daily_link_text,
         }
     )
-    html = Template(_html)
-    plaintext = Template(html_to_text(_html))
+    plaintext = html_to_text(_html)
+
+    # no categories defined or automated daily newsletter, send to all
+    # recipients
+    if request.app.org.newsletter_categories and not daily:
+        newsletter_categories = newsletter.newsletter_categories or []
+
+        # legacy: no selection means all topics are subscribed to
+        extracted = extract_categories_and_subcategories(
+            request.app.org.newsletter_categories, flattened=True)
+        all_categories = extracted if isinstance(extracted, list) else []
+        include_unselected = any(
+            item in newsletter_categories for item in all_categories)
+
+        if isinstance(recipients, Query):
+            recipients = recipients.filter(Recipient.subscribed_to_any(
+                newsletter_categories, include_unselected))
+        else:
+            selected = set(newsletter_categories)
+            recipients = [
+                recipient for recipient in recipients
+                if (
+                    not selected.isdisjoint(recipient.subscribed_categories)
+                    if recipient.subscribed_categories
+                    else include_unselected
+                )
+            ]
+
+    if isinstance(recipients, Query):
+        rows: Iterable[tuple[UUID, str, str]] = recipients.with_entities(
+            Recipient.id, Recipient.address, Recipient.token
+        ).yield_per(1000)
+    else:
+        rows = (
+            (recipient.id, recipient.address, recipient.token)
+            for recipient in recipients
+        )
+
+    # the email is prepared once with a placeholder, for each recipient we
+    # only fill in the address and the unsubscribe link
+    prepared = request.app.prepare_email(
+        subject=title,
+        content=_html,
+        plaintext=plaintext,
+        headers={
+            'List-Unsubscribe': '<$unsubscribe>',
+            'List-Unsubscribe-Post': 'List-Unsubscribe=One-Click'
+        },
+    )
+    html_parts = _html.split('$unsubscribe')
+    text_parts = plaintext.split('$unsubscribe')
+    headers = [
+        header for header in prepared.get('Headers', ())
+        if header['Name'] != 'List-Unsubscribe'
+    ]
+    unsubscribe_link = unsubscribe_link_factory(request)
 
-    count = 0
+    sent: list[UUID] = []
 
     # We use a generator function to submit the email batch since that is
     # significantly more memory efficient for large batches.
     def email_iter() -> Iterator[EmailJsonDict]:
-        nonlocal count
-        for recipient in recipients:
-            if not request.app.org.newsletter_categories or daily:
-                # no categories defined or automated daily newsletter, send to
-                # all recipients
-                pass
-            else:
-                recipient_categories = recipient.subscribed_categories or []
-                if not recipient_categories:
-                    # legacy: no selection means all topics are subscribed to
-                    extracted = extract_categories_and_subcategories(
-                        request.app.org.newsletter_categories, flattened=True)
-                    recipient_categories = (
-                        extracted) if isinstance(extracted, list) else []
-
-                newsletter_categories = newsletter.newsletter_categories or []
-                if not any(item in newsletter_categories for
-                           item in recipient_categories):
-                    continue
-
-            unsubscribe = request.link(recipient.subscription, 'unsubscribe')
-
-            count += 1
-            yield request.app.prepare_email(
-                subject=title,
-                receivers=(recipient.address,),
-                content=html.substitute(unsubscribe=unsubscribe),
-                plaintext=plaintext.substitute(unsubscribe=unsubscribe),
-                headers={
-                    'List-Unsubscribe': f'<{unsubscribe}>',
-                    'List-Unsubscribe-Post': 'List-Unsubscribe=One-Click'
-                },
-            )
+        for recipient_id, address, token in rows:
+            unsubscribe = unsubscribe_link(recipient_id, token)
 
-            if not is_test and recipient not in newsletter.recipients:
+            email = prepared.copy()
+            email['To'] = format_address(address)
+            email['HtmlBody'] = unsubscribe.join(html_parts)
+            email['TextBody'] = unsubscribe.join(text_parts)
+            email['Headers'] = [
+                {'Name': 'List-Unsubscribe', 'Value': f'<{unsubscribe}>'},
+                *headers
+            ]
 
-                newsletter.recipients.append(recipient)
+            sent.append(recipient_id)
+            yield email
 
     request.app.send_marketing_email_batch(email_iter())
 
     if not is_test:
+        record_newsletter_recipients(request, newsletter, sent)
         newsletter.sent = newsletter.sent or utcnow()
 
-    return count
+    return len(sent)
+
+
+def record_newsletter_recipients(
+    request: OrgRequest,
+    newsletter: Newsletter,
+    recipient_ids: Iterable[UUID]
+) -> None:
+    """ Adds the given recipients to the recipients of the newsletter, in
+    bulk and without loading the existing ones.
+
+    """
+    session = request.session
+    session.flush()
+
+    received = set(session.scalars(
+        select(newsletter_recipients.c.recipient_id).where(
+            newsletter_recipients.c.newsletter_id == newsletter.name)
+    ))
+    values = [
+        {'newsletter_id': newsletter.name, 'recipient_id': recipient_id}
+        for recipient_id in dict.fromkeys(recipient_ids)
+        if recipient_id not in received
+    ]
+    if values:
+        session.execute(insert(newsletter_recipients), values)
+        session.expire(newsletter, ['recipients'])
 
 
 @OrgApp.form(model=Newsletter, template='send_newsletter.pt', name='send',
@@ -702,8 +795,6 @@ def handle_send_newsletter(
 ) -> RenderData | Response:
     layout = layout or NewsletterLayout(self, request)
 
-    open_recipients = self.open_recipients
-
     if form.submitted(request):
         if form.categories and form.categories.data == []:
             # for backward compatibility select all categories if none has
@@ -718,7 +809,8 @@ def handle_send_newsletter(
                 form.categories.data) if form.categories else []
 
         if form.send.data == 'now':
-            sent = send_newsletter(request, self, open_recipients)
+            sent = send_newsletter(
+                request, self, self.open_recipients_query())
 
             request.success(_('Sent "${title}" to ${n} recipients', mapping={
                 'title': self.title,
@@ -747,7 +839,7 @@ def handle_send_newsletter(
         'title': self.title,
         'newsletter': self,
         'previous_recipients': self.recipients,
-        'open_recipients': open_recipients,
+        'open_recipients': self.open_recipients,
         'main_categories': categories or [],
         'sub_categories': subcategories or [],
         'selected_categories': categories or [],
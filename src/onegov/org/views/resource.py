@@ -48,6 +48,7 @@ from sedate import utcnow, standardize_date
 from sqlalchemy import and_, cast as sa_cast, func, or_, select
 from sqlalchemy import Boolean, UUID as UUIDType
 from sqlalchemy.orm import undefer, joinedload, Session
+from uuid import UUID
 from webob import exc
 
 
@@ -62,7 +63,6 @@ if TYPE_CHECKING:
     from sedate.types import DateLike
     from sqlalchemy.orm import Query
     from typing import TypedDict
-    from uuid import UUID
     from webob import Response as BaseResponse
 
     type RoomSlots = dict[UUID, list[utils.FindYourSpotEventInfo]]
@@ -1459,6 +1459,214 @@ def view_occupancy_json(self: Resource, request: OrgRequest) -> JSON_ro:
     )
 
 
+def as_columns(entries: Iterable[dict[str, Any]]) -> JSON_ro:
+    """ Turns a list of dictionaries into a compact table consisting of
+    the column names and a list of rows with the values in column order.
+
+    """
+    columns: dict[str, int] = {}
+    rows = []
+    for entry in entries:
+        for key in entry:
+            columns.setdefault(key, len(columns))
+        rows.append(entry)
+
+    return {
+        'columns': list(columns),
+        'rows': [[row.get(key) for key in columns] for row in rows]
+    }
+
+
+@OrgApp.json(
+    model=ResourceCollection,
+    name='occupancy-json',
+    permission=Personal,
+    open_data=False
+)
+def view_resources_occupancy_json(
+    self: ResourceCollection,
+    request: OrgRequest
+) -> JSON_ro:
+    """ Returns the occupancy of multiple resources at once.
+
+    The resources are selected by passing one or more ``resource`` ids
+    or alternatively a ``group``. The data for all selected resources is
+    loaded using a fixed number of queries, regardless of the number of
+    resources.
+
+    The result contains a table per kind of entry (holidays, reservations,
+    blockers and availabilities). Each table consists of the ``columns``
+    and the ``rows``, the columns correspond to the keys of the entries
+    returned by the ``occupancy-json`` view of a single resource.
+
+    """
+    start, end = utils.parse_fullcalendar_request(request, 'Europe/Zurich')
+
+    if not (start and end):
+        return {}
+
+    query = self.query()
+    if resource_ids := request.params.getall('resource'):
+        try:
+            query = query.filter(Resource.id.in_([
+                UUID(resource_id) for resource_id in resource_ids
+            ]))
+        except ValueError:
+            raise exc.HTTPBadRequest() from None
+    elif group := request.params.get('group'):
+        query = query.filter(Resource.group == group)
+    else:
+        raise exc.HTTPBadRequest()
+
+    is_member = request.has_role('member')
+    resources = [
+        self.bind(resource)
+        for resource in query.order_by(Resource.title)
+        # NOTE: Exclude resources where members are not allowed to see
+        #       the occupancy
+        if not is_member
+        or getattr(resource, 'occupancy_is_visible_to_members', False)
+    ]
+
+    # the resources that are blocked by a given resource
+    blocked_by: dict[UUID, list[Resource]] = {}
+    for resource in resources:
+        blocked_by.setdefault(resource.id, []).append(resource)
+        for blocking_id in resource.blocking_resource_ids():
+            blocked_by.setdefault(blocking_id, []).append(resource)
+
+    by_id = {resource.id: resource for resource in resources}
+    if missing_ids := blocked_by.keys() - by_id.keys():
+        by_id.update(
+            (resource.id, self.bind(resource))
+            for resource in self.query().filter(Resource.id.in_(missing_ids))
+        )
+
+    blocking_resources = {
+        resource.id: {
+            blocking_id: by_id[blocking_id]
+            for blocking_id in resource.blocking_resource_ids()
+            if blocking_id in by_id
+        }
+        for resource in resources
+    }
+
+    session = request.session
+    visible_ids = list(blocked_by)
+
+    # get all reservations and tickets
+    fields = list(dict.fromkeys(
+        field
+        for resource in resources
+        for field in resource.occupancy_fields
+    ))
+    field_index = {field: index for index, field in enumerate(fields, 2)}
+    reservations = (
+        session.query(Reservation, Ticket)
+        .join(
+            Ticket,
+            Reservation.token == sa_cast(Ticket.handler_id, UUIDType)
+        )
+        .filter(Reservation.resource.in_(visible_ids))
+        .filter(start <= Reservation.start)
+        .filter(Reservation.end <= end)
+        .filter(Reservation.status == 'approved')
+        .options(undefer(Reservation.data))
+        .order_by(Reservation.start, Ticket.subtitle)
+    )
+    if fields:
+        reservations = reservations.outerjoin(
+            FormSubmission,
+            FormSubmission.id == Reservation.token
+        ).add_columns(*(
+            FormSubmission.data[as_internal_id(field)].astext.label(field)
+            for field in fields
+        ))
+
+    reservations_by_resource: dict[UUID, list[Any]] = {
+        resource.id: [] for resource in resources
+    }
+    for row in reservations:
+        for resource in blocked_by.get(row[0].resource, ()):
+            reservations_by_resource[resource.id].append((
+                row[0],
+                row[1],
+                *(row[field_index[field]]
+                  for field in resource.occupancy_fields)
+            ))
+
+    # get all blockers
+    blockers_by_resource: dict[UUID, list[ReservationBlocker]] = {
+        resource.id: [] for resource in resources
+    }
+    for blocker in (
+        session.query(ReservationBlocker)
+        .filter(ReservationBlocker.resource.in_(visible_ids))
+        .filter(start <= ReservationBlocker.start)
+        .filter(ReservationBlocker.end <= end)
+    ):
+        for resource in blocked_by.get(blocker.resource, ()):
+            blockers_by_resource[resource.id].append(blocker)
+
+    # get all master allocations
+    utc_start = standardize_date(start, 'UTC')
+    utc_end = standardize_date(end, 'UTC')
+    allocations = (
+        session.query(Allocation)
+        .filter(Allocation.mirror_of.in_(
+            [resource.id for resource in resources]
+        ))
+        .filter(Allocation.resource == Allocation.mirror_of)
+        .filter(or_(
+            and_(
+                Allocation._start <= utc_start,
+                utc_start <= Allocation._end
+            ),
+            and_(
+                utc_start <= Allocation._start,
+                Allocation._start <= utc_end
+            )
+        ))
+    )
+
+    return {
+        'resources': [str(resource.id) for resource in resources],
+        'holidays': as_columns(
+            holiday.as_dict()
+            for holiday in utils.HolidayEventInfo.from_request(
+                request, start.date(), end.date()
+            )
+        ),
+        'reservations': as_columns(
+            res.as_dict()
+            for resource in resources
+            for res in utils.ReservationEventInfo.from_reservations(
+                request,
+                resource,
+                reservations_by_resource[resource.id],
+                blocking_resources[resource.id]
+            )
+        ),
+        'blockers': as_columns(
+            blk.as_dict()
+            for resource in resources
+            for blk in utils.BlockerEventInfo.from_blockers(
+                request,
+                resource,
+                blockers_by_resource[resource.id],
+                blocking_resources[resource.id]
+            )
+        ),
+        'availabilities': as_columns(
+            av.as_dict()
+            for av in utils.AvailabilityEventInfo.from_allocations(
+                request,
+                allocations  # type: ignore[arg-type]
+            )
+        ),
+    }
+
+
 @OrgApp.json(
     model=Resource,
     name='occupancy-stats',
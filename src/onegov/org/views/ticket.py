@@ -2,11 +2,9 @@ from __future__ import annotations
 
 import morepath
 import os
-import zipfile
 
 from datetime import date
 from email_validator import validate_email, EmailNotValidError
-from io import BytesIO
 from markupsafe import Markup
 from morepath import Response
 from onegov.chat import Message, MessageCollection, TextModuleCollection
@@ -17,9 +15,11 @@ from onegov.core.mail import Attachment
 from onegov.core.orm import as_selectable
 from onegov.core.security import Public, Personal, Private, Secret
 from onegov.core.templates import render_template
-from onegov.core.utils import normalize_for_url
-from onegov.form import Form
-from onegov.org import _, OrgApp
+from onegov.core.utils import batched, is_uuid, normalize_for_url
+from onegov.core.utils import stream_zip
+from onegov.file import File
+from onegov.form import Form, FormSubmission
+from onegov.org import _, log, OrgApp
 from onegov.org.constants import TICKET_STATES
 from onegov.org.forms import ExtendedInternalTicketChatMessageForm
 from onegov.org.forms import ManualInvoiceItemForm
@@ -58,9 +58,10 @@ from operator import itemgetter
 from sqlalchemy import select
 from webob import exc
 from urllib.parse import urlsplit
+from uuid import UUID
 
 
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 if TYPE_CHECKING:
     from _typeshed import StrPath
     from collections.abc import Iterable, Iterator, Mapping
@@ -1186,28 +1187,38 @@ def view_related_tickets_pdf(self: Ticket, request: OrgRequest) -> Response:
 
 @OrgApp.view(model=Ticket, name='files', permission=Private)
 def view_ticket_files(self: Ticket, request: OrgRequest) -> BaseResponse:
-    """ Download the files associated with the ticket as zip. """
+    """ Download the files associated with the ticket as zip.
+
+    The archive is streamed to the client, the files are read from the
+    storage in chunks while the archive is being sent.
+
+    """
 
     form_submission = getattr(self.handler, 'submission', None)
 
     if form_submission is None:
         return request.redirect(request.link(self))
 
-    buffer = BytesIO()
+    # NOTE: We check whether the files exist up front so we can tell the
+    #       user which ones are missing, they are opened while streaming
+    references = []
     not_existing = []
-    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for f in form_submission.files:
-            file = None
-            try:
-                file = f.reference.file
-                zipf.writestr(f.name, file.read())
-            except OSError:
-                not_existing.append(f.name)
+    for f in form_submission.files:
+        if f.reference.depot.exists(f.reference.file_id):
+            references.append((f.name, f.reference))
+        else:
+            not_existing.append(f.name)
+
+    pdf = TicketPdf.from_ticket(request, self)
+    pdf_filename = '{}_{}.pdf'.format(normalize_for_url(self.number),
+                                      date.today().strftime('%Y%m%d'))
+
+    def entries() -> Iterator[tuple[str, bytes | IO[bytes]]]:
+        for name, reference in references:
+            with reference.file as fp:
+                yield name, fp
 
-        pdf = TicketPdf.from_ticket(request, self)
-        pdf_filename = '{}_{}.pdf'.format(normalize_for_url(self.number),
-                                          date.today().strftime('%Y%m%d'))
-        zipf.writestr(pdf_filename, pdf.read())
+        yield pdf_filename, pdf.getvalue()
 
     if not_existing:
         count = len(not_existing)
@@ -1218,10 +1229,8 @@ def view_ticket_files(self: Ticket, request: OrgRequest) -> BaseResponse:
     else:
         request.info(_('Zip archive created successfully'))
 
-    buffer.seek(0)
-
     return Response(
-        buffer.read(),
+        app_iter=stream_zip(entries()),
         content_type='application/zip',
         content_disposition='inline; filename=ticket-{}_{}.zip'.format(
             normalize_for_url(self.number),
@@ -1230,6 +1239,65 @@ def view_ticket_files(self: Ticket, request: OrgRequest) -> BaseResponse:
     )
 
 
+@OrgApp.view(model=TicketCollection, name='files', permission=Private)
+def view_tickets_files(
+    self: TicketCollection,
+    request: OrgRequest
+) -> BaseResponse:
+    """ Download the files of all the tickets in the current (filtered)
+    ticket list as a single zip, with one folder per ticket.
+
+    The archive is streamed to the client, the files are only opened once
+    they are written to the archive. Unlike the archive of a single
+    ticket this does not include the ticket PDFs.
+
+    """
+
+    # NOTE: Tickets of restricted handlers may be listed, even though the
+    #       current user may not access them, we must not include their files
+    tickets = self.subset().order_by(None).order_by(Ticket.number)
+    numbers = {
+        UUID(ticket.handler_id): ticket.number
+        for ticket in tickets.yield_per(1000)
+        if is_uuid(ticket.handler_id)
+        and request.has_permission(ticket, Private)
+    }
+
+    files = []
+    for batch in batched(numbers, 1000):
+        files.extend(
+            request.session.query(
+                FormSubmission.id,
+                File.name,
+                File.reference
+            )
+            .join(FormSubmission.files)
+            .filter(FormSubmission.id.in_(batch))
+        )
+
+    files.sort(key=lambda row: (numbers[row[0]], row[1]))
+
+    def entries() -> Iterator[tuple[str, IO[bytes]]]:
+        for submission_id, name, reference in files:
+            number = normalize_for_url(numbers[submission_id])
+            try:
+                file = reference.file
+            except OSError:
+                log.warning(f'File {name} of ticket {number} not found')
+                continue
+
+            with file as fp:
+                yield f'{number}/{name}', fp
+
+    return Response(
+        app_iter=stream_zip(entries()),
+        content_type='application/zip',
+        content_disposition='inline; filename=tickets_{}.zip'.format(
+            date.today().strftime('%Y%m%d')
+        )
+    )
+
+
 @OrgApp.html(
     model=Ticket,
     name='invoice',
@@ -213,9 +213,9 @@ def test_abschluss_mail(recipient: str) -> Processor:
 @click.option('--update-custom/--no-update-custom', default=True,
               help='Update parliamentarians with custom field data '
                    'after import (default: enabled)')
-@click.option('--max-workers', default=3, type=int,
+@click.option('--max-workers', default=8, type=int,
               help='Maximum number of concurrent workers for '
-                   'custom data update (default: 3)')
+                   'custom data update (default: 8)')
 def import_kub_data(
     token: str,
     base_url: str,
@@ -457,9 +457,9 @@ def _compare_with_clex(
 @click.option('--cert-dir', required=True,
               type=click.Path(exists=True, file_okay=False),
               help='Directory containing .crt and .key files')
-@click.option('--max-workers', default=3, type=int,
-              help='Maximum number of concurrent workers '
-                   '(default: 3)')
+@click.option('--max-workers', default=8, type=int,
+              help='Maximum number of concurrent workers, the actual '
+                   'number adapts to the API (default: 8)')
 def update_custom_data(
     token: str,
     base_url: str,
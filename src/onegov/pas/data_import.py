@@ -4,7 +4,7 @@ import csv
 import openpyxl
 from dataclasses import dataclass
 from datetime import datetime, date
-from onegov.core.csv import CSVFile, convert_excel_to_csv, detect_encoding
+from onegov.core.csv import CSVFile, ExcelFile, detect_encoding
 from onegov.pas.models import (
     PASCommission,
     PASCommissionMembership,
@@ -117,14 +117,8 @@ class ImportFile:
 
     def _parse_excel(self) -> None:
         """Parse the file contents for excel files."""
-        csv_file_like = convert_excel_to_csv(self.file)
-        encoding = detect_encoding(csv_file_like)
-        csv_file_like.seek(0)
-        csv_file = CSVFile(
-            csv_file_like,
-            encoding=encoding,
-        )
-        self.rows = list(csv_file.lines)
+        excel_file = ExcelFile(self.file)
+        self.rows = list(excel_file.lines)
 
     def __enter__(self: Self) ->  Self:
         return self
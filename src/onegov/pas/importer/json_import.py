@@ -10,8 +10,10 @@ The importers cannot work independently due to tight coupling between entities.
 from __future__ import annotations
 
 from datetime import date, datetime
-from uuid import UUID
+from time import perf_counter
+from uuid import uuid4, UUID
 
+from onegov.core.orm.mixins import TimestampMixin
 from onegov.pas.log import log
 from onegov.pas.models import (
     PASCommission,
@@ -21,6 +23,8 @@ from onegov.pas.models import (
     PASParliamentaryGroup,
     Party,
 )
+from sqlalchemy import delete, inspect
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import selectinload
 
 from onegov.pas.importer.types import (  # noqa: TC002
@@ -54,6 +58,34 @@ if TYPE_CHECKING:
     type Match = Literal['kub', 'adopt', 'duplicate', 'create']
 
 
+#: The columns we write when inserting new commission memberships
+MEMBERSHIP_COLUMNS = (
+    'id',
+    'external_kub_id',
+    'parliamentarian_id',
+    'commission_id',
+    'role',
+    'start',
+    'end',
+)
+
+#: The columns we write when inserting new parliamentarian roles
+ROLE_COLUMNS = (
+    'id',
+    'external_kub_id',
+    'parliamentarian_id',
+    'role',
+    'party_id',
+    'party_role',
+    'parliamentary_group_id',
+    'parliamentary_group_role',
+    'additional_information',
+    'start',
+    'end',
+    'meta',
+)
+
+
 def periods_overlap(
     start_a: date | None,
     end_a: date | None,
@@ -586,6 +618,11 @@ class MembershipImporter(DataImporter):
     organization and start date, and adopt the id of the membership they were
     imported from. Rows that keep an empty id were entered by hand and are
     left alone.
+
+    The import runs in phases: all existing rows are loaded into in-memory
+    indexes once, the changes are computed against those indexes and then
+    written with a single upsert per table and a single delete per table.
+    The time spent in each phase is logged at the end (see ``timings``).
     """
 
     def __init__(
@@ -616,6 +653,9 @@ class MembershipImporter(DataImporter):
             RoleBucket, list[PASParliamentarianRole]
         ] = {}
 
+        # the seconds spent in each phase of the last import
+        self.timings: dict[str, float] = {}
+
     def init(
         self,
         session: Session,
@@ -906,6 +946,8 @@ class MembershipImporter(DataImporter):
             'skipped': 0,  # Count memberships we couldn't process
             'deleted': 0,  # Rows which vanished from KUB
         }
+        self.timings = {}
+        clock = perf_counter()
 
         # Process parliamentarians found only in memberships first
         parl_details = (
@@ -920,10 +962,17 @@ class MembershipImporter(DataImporter):
             'updated'
         ]
 
+        # The memberships and roles are built with the ids of their
+        # parliamentarians, commissions, parties and groups, new ones
+        # only get their ids once they are flushed
+        self.session.flush()
+        clock = self._record_timing('parliamentarians', clock)
+
         parliamentarian_ids = [
             p.id for p in self.parliamentarian_map.values() if p.id
         ]
         self._prefetch(parliamentarian_ids, memberships_data)
+        clock = self._record_timing('prefetch', clock)
 
         for membership in memberships_data:
             person_id = None
@@ -1101,23 +1150,27 @@ class MembershipImporter(DataImporter):
                 if not processed_membership_type:
                     processed_counts['skipped'] += 1
 
-        # Save newly created memberships and roles
-        if commission_memberships_to_create:
-            self._bulk_save(
-                commission_memberships_to_create, 'new commission memberships'
-            )
-        if parliamentarian_roles_to_create:
-            self._bulk_save(
-                parliamentarian_roles_to_create, 'new parliamentarian roles'
-            )
+        clock = self._record_timing('compute', clock)
+
+        # Write the updates of existing rows, then insert the new ones
+        self.session.flush()
+        self._upsert(
+            PASCommissionMembership,
+            commission_memberships_to_create,
+            MEMBERSHIP_COLUMNS,
+        )
+        self._upsert(
+            PASParliamentarianRole,
+            parliamentarian_roles_to_create,
+            ROLE_COLUMNS,
+        )
+        clock = self._record_timing('write', clock)
 
         if memberships_data:
-            processed_counts['deleted'] = self._delete_vanished(
-                parliamentarian_ids
-            )
+            processed_counts['deleted'] = self._delete_vanished()
+        self._expire_collections()
+        clock = self._record_timing('delete', clock)
 
-        # Flush is removed, commit at the end of import_zug_kub_data
-        # IDs will be assigned after the final commit.
         try:
             # Populate details based on object existence, not internal ID yet
             details['commission_memberships']['created'] = list(
@@ -1169,8 +1222,22 @@ class MembershipImporter(DataImporter):
             f'Deleted: {processed_counts["deleted"]}, '
             f'Skipped: {processed_counts["skipped"]}'
         )
+        self.logger.info(
+            'Membership/Role import timings: '
+            + ', '.join(
+                f'{phase}: {seconds:.3f}s'
+                for phase, seconds in self.timings.items()
+            )
+        )
         return details, processed_counts
 
+    def _record_timing(self, phase: str, started: float) -> float:
+        """Records the seconds spent in the given phase and returns the
+        start of the next one."""
+        now = perf_counter()
+        self.timings[phase] = now - started
+        return now
+
     def _parse_kub_id(self, membership_data: MembershipData) -> UUID | None:
         """The id of the membership in KUB, if it is a valid UUID."""
         raw_id = membership_data.get('id')
@@ -1378,12 +1445,16 @@ class MembershipImporter(DataImporter):
             if existing.end != end:
                 existing.end = end
                 changed = True
+            if inspect(existing).transient:
+                # created earlier in this import, it is inserted as a whole
+                return None, False
             return (existing, False) if changed else (None, False)
 
+        # new rows are not added to the session, they are inserted in bulk
+        # once all the changes are known
         membership = PASCommissionMembership(
-            parliamentarian=parliamentarian,
+            id=uuid4(),
             parliamentarian_id=parliamentarian.id,
-            commission=commission,
             commission_id=commission.id,
             external_kub_id=kub_id,
             role=role,
@@ -1460,16 +1531,23 @@ class MembershipImporter(DataImporter):
                 existing.external_kub_id = kub_id
                 self._register_role(existing, bucket)
                 changed = True
+            if inspect(existing).transient:
+                # created earlier in this import, it is inserted as a whole
+                return None, False
             return (existing, False) if changed else (None, False)
 
+        # new rows are not added to the session, they are inserted in bulk
+        # once all the changes are known
         role_obj = PASParliamentarianRole(
-            parliamentarian=parliamentarian,
+            id=uuid4(),
             parliamentarian_id=parliamentarian.id,
             external_kub_id=kub_id,
             role=role,
-            parliamentary_group=parliamentary_group,
+            parliamentary_group_id=(
+                parliamentary_group.id if parliamentary_group else None
+            ),
             parliamentary_group_role=parliamentary_group_role or 'none',
-            party=party,
+            party_id=party.id if party else None,
             party_role=party_role or 'none',
             additional_information=additional_information,
             start=start,
@@ -1498,6 +1576,10 @@ class MembershipImporter(DataImporter):
         """
         Updates an existing ParliamentarianRole object.
         Returns True if changed.
+
+        Related objects are changed through their ids, so the collections
+        on the other side are left alone (they are expired at the end of
+        the import).
         """
         changed = False
 
@@ -1508,16 +1590,20 @@ class MembershipImporter(DataImporter):
         # Update related objects if provided
         if (
             parliamentary_group is not None
-            and role_obj.parliamentary_group != parliamentary_group
+            and role_obj.parliamentary_group_id != parliamentary_group.id
         ):
-            role_obj.parliamentary_group = parliamentary_group
+            role_obj.parliamentary_group_id = parliamentary_group.id
+            if not inspect(role_obj).transient:
+                self.session.expire(role_obj, ['parliamentary_group'])
             changed = True
         new_group_role = parliamentary_group_role or 'none'
         if role_obj.parliamentary_group_role != new_group_role:
             role_obj.parliamentary_group_role = new_group_role
             changed = True
-        if party is not None and role_obj.party != party:
-            role_obj.party = party
+        if party is not None and role_obj.party_id != party.id:
+            role_obj.party_id = party.id
+            if not inspect(role_obj).transient:
+                self.session.expire(role_obj, ['party'])
             changed = True
         new_party_role = party_role or 'none'
         if role_obj.party_role != new_party_role:
@@ -1541,61 +1627,104 @@ class MembershipImporter(DataImporter):
 
         return changed
 
-    def _delete_vanished(self, parliamentarian_ids: list[UUID]) -> int:
+    def _upsert(
+        self,
+        model: type[PASCommissionMembership | PASParliamentarianRole],
+        rows: Sequence[PASCommissionMembership | PASParliamentarianRole],
+        columns: tuple[str, ...],
+    ) -> None:
+        """Inserts the given new rows with a single statement.
+
+        Should a row with the same ``external_kub_id`` exist after all
+        (e.g. one belonging to a parliamentarian we did not prefetch), it is
+        updated instead.
+        """
+        if not rows:
+            return
+
+        stmt = insert(model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model.external_kub_id],
+            set_={
+                **{
+                    column: stmt.excluded[column]
+                    for column in columns
+                    if column not in ('id', 'external_kub_id')
+                },
+                'modified': TimestampMixin.timestamp(),
+            },
+        )
+        identity = model.__mapper__.polymorphic_identity
+        self.session.execute(stmt, [
+            {
+                'type': identity,
+                **{column: getattr(row, column) for column in columns},
+            }
+            for row in rows
+        ])
+        self.logger.info(f'Saved {len(rows)} new {model.__tablename__}')
+
+    def _delete_vanished(self) -> int:
         """Deletes the roles and memberships whose KUB membership is gone.
 
         Rows without an ``external_kub_id`` were entered by hand and are
-        never touched.
+        never touched. The candidates come from the prefetched indexes, so
+        this only issues a single delete per table.
         """
-        if not parliamentarian_ids:
-            return 0
-
         deleted = 0
-        memberships = (
-            self.session.query(PASCommissionMembership)
-            .filter(
-                PASCommissionMembership.parliamentarian_id.in_(
-                    parliamentarian_ids
-                ),
-                PASCommissionMembership.external_kub_id.isnot(None),
-                PASCommissionMembership.external_kub_id.notin_(
-                    self.seen_membership_ids
-                ),
-            )
-            .all()
-        )
-        for membership in memberships:
-            self.logger.info(
-                f'Deleting commission membership {membership.external_kub_id} '
-                f'of {membership.parliamentarian_id}, it no longer exists '
-                f'in KUB'
-            )
-            self.session.delete(membership)
-            deleted += 1
+        for model, buckets, seen in (
+            (
+                PASCommissionMembership,
+                self.memberships_by_bucket,
+                self.seen_membership_ids,
+            ),
+            (
+                PASParliamentarianRole,
+                self.roles_by_bucket,
+                self.seen_role_ids,
+            ),
+        ):
+            vanished = {
+                row.id: row
+                for rows in buckets.values()
+                for row in rows
+                if row.external_kub_id
+                and row.external_kub_id not in seen
+                and inspect(row).persistent
+            }
+            if not vanished:
+                continue
 
-        roles = (
-            self.session.query(PASParliamentarianRole)
-            .filter(
-                PASParliamentarianRole.parliamentarian_id.in_(
-                    parliamentarian_ids
-                ),
-                PASParliamentarianRole.external_kub_id.isnot(None),
-                PASParliamentarianRole.external_kub_id.notin_(
-                    self.seen_role_ids
-                ),
-            )
-            .all()
-        )
-        for role_obj in roles:
-            self.logger.info(
-                f'Deleting role {role_obj.external_kub_id} of '
-                f'{role_obj.parliamentarian_id}, it no longer exists in KUB'
+            for row in vanished.values():
+                self.logger.info(
+                    f'Deleting {model.__tablename__} {row.external_kub_id} '
+                    f'of {row.parliamentarian_id}, it no longer exists '
+                    f'in KUB'
+                )
+            self.session.execute(
+                delete(model).where(model.id.in_(vanished)),
+                execution_options={'synchronize_session': 'fetch'},
             )
-            self.session.delete(role_obj)
-            deleted += 1
+            deleted += len(vanished)
 
         return deleted
 
+    def _expire_collections(self) -> None:
+        """The bulk statements bypass the relationships, so the collections
+        of the affected objects are reloaded on next access."""
+        for objects, attributes in (
+            (
+                self.parliamentarian_map.values(),
+                ['roles', 'commission_memberships'],
+            ),
+            (self.commission_map.values(), ['memberships']),
+            (self.parliamentary_group_map.values(), ['roles']),
+            (self.party_map.values(), ['roles']),
+        ):
+            for obj in objects:
+                if inspect(obj).persistent:
+                    self.session.expire(obj, attributes)
+
     def _map_to_commission_role(
         self, role_text: str
     ) -> Literal['president', 'extended_member', 'guest', 'member']:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import queue
 import niquests
 import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from urllib.parse import urlparse, urlunparse
 
@@ -19,6 +21,7 @@ from sqlalchemy.orm.attributes import flag_modified
 
 from typing import TYPE_CHECKING, Any, Self
 if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
     from types import TracebackType
     from onegov.core.types import LaxFileDict
     from onegov.pas.app import PasApp
@@ -41,15 +44,90 @@ class UpdateResult:
     addresses: list[dict[str, Any]]
     sex: int | None
     error: str | None = None
+    etag: str | None = None
+    not_modified: bool = False
+
+    @property
+    def digest(self) -> str:
+        """ A hash of the fetched data, used to skip unchanged people. """
+        return hashlib.sha256(json.dumps(
+            [self.custom_values, self.addresses, self.sex],
+            sort_keys=True
+        ).encode('utf-8')).hexdigest()
+
+
+class AdaptiveLimit:
+    """ Limits the number of concurrent requests to the KUB API.
+
+    The limit grows by one after as many successful requests as the
+    current limit and is halved whenever the API signals that it is
+    overloaded (429, 5xx or a timeout). This way we fetch as fast as the
+    API allows without hammering it.
+
+    """
+
+    def __init__(self, maximum: int, initial: int = 2):
+        self.maximum = max(1, maximum)
+        self.limit = min(initial, self.maximum)
+        self.active = 0
+        self.successes = 0
+        self.condition = threading.Condition()
+
+    def __enter__(self) -> Self:
+        with self.condition:
+            while self.active >= self.limit:
+                self.condition.wait()
+            self.active += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None
+    ) -> None:
+        with self.condition:
+            self.active -= 1
+            self.condition.notify()
+
+    def success(self) -> None:
+        with self.condition:
+            self.successes += 1
+            if self.successes >= self.limit and self.limit < self.maximum:
+                self.limit += 1
+                self.successes = 0
+                self.condition.notify()
+
+    def overload(self) -> None:
+        with self.condition:
+            self.limit = max(1, self.limit // 2)
+            self.successes = 0
+
+
+def is_overload(error: Exception) -> bool:
+    if isinstance(error, niquests.exceptions.Timeout):
+        return True
+
+    response = getattr(error, 'response', None)
+    return response is not None and (
+        response.status_code == 429 or response.status_code >= 500
+    )
 
 
 def _fetch_custom_data_worker(
     parliamentarian_queue: queue.Queue[Any],
     result_queue: queue.Queue[UpdateResult],
     session: niquests.Session,
-    base_url: str
+    base_url: str,
+    limit: AdaptiveLimit,
+    etags: dict[str, str],
 ) -> None:
-    """Worker thread that fetches API data for parliamentarians."""
+    """Worker thread that fetches API data for parliamentarians.
+
+    Sends the ETag of the last synchronisation along, so the API may
+    answer with 304 Not Modified for people that did not change.
+
+    """
     while True:
         try:
             parliamentarian = parliamentarian_queue.get_nowait()
@@ -60,8 +138,28 @@ def _fetch_custom_data_worker(
             person_id = parliamentarian.external_kub_id
             url = f'{base_url}/people/{person_id}'
 
-            response = session.get(url, timeout=60)
+            headers = {}
+            if etag := etags.get(str(person_id)):
+                headers['If-None-Match'] = etag
+
+            with limit:
+                response = session.get(url, headers=headers, timeout=60)
+
+            if response.status_code == 304:
+                limit.success()
+                result_queue.put(UpdateResult(
+                    parliamentarian_id=parliamentarian.id,
+                    title=parliamentarian.title,
+                    custom_values={},
+                    addresses=[],
+                    sex=None,
+                    etag=etag,
+                    not_modified=True
+                ))
+                continue
+
             response.raise_for_status()
+            limit.success()
 
             person_data = response.json()
             custom_values = person_data.get('customValues', {})
@@ -73,9 +171,13 @@ def _fetch_custom_data_worker(
                 title=parliamentarian.title,
                 custom_values=custom_values,
                 addresses=addresses,
-                sex=sex
+                sex=sex,
+                etag=response.headers.get('ETag')
             ))
         except niquests.exceptions.HTTPError as e:
+            if is_overload(e):
+                limit.overload()
+
             if e.response is not None and e.response.status_code == 404:
                 log.warning(
                     f'Person not found in API: {parliamentarian.title} '
@@ -103,6 +205,9 @@ def _fetch_custom_data_worker(
                     )
                 )
         except Exception as e:
+            if is_overload(e):
+                limit.overload()
+
             result_queue.put(
                 UpdateResult(
                     parliamentarian_id=parliamentarian.id,
@@ -117,6 +222,13 @@ def _fetch_custom_data_worker(
             parliamentarian_queue.task_done()
 
 
+def source_digest(records: list[dict[str, Any]]) -> str:
+    """ A hash of the records fetched from an endpoint. """
+    return hashlib.sha256(
+        json.dumps(records, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
+
 def create_mock_file_data(
     data: list[dict[str, Any]], filename: str
 ) -> LaxFileDict:
@@ -337,12 +449,34 @@ class KubImporter:
 
         return all_results
 
+    def _last_import_detail(
+        self,
+        session: Session,
+        key: str,
+        status: str | None = None
+    ) -> Any:
+        """ Returns the given detail of the most recent import that
+        recorded it, if any.
+
+        """
+        query = session.query(ImportLog.details).order_by(
+            ImportLog.created.desc()
+        )
+        if status is not None:
+            query = query.filter(ImportLog.status == status)
+
+        for details, in query.limit(10):
+            if details and key in details:
+                return details[key]
+        return None
+
     def update_custom_data(
         self,
         request: PasRequest,
         app: PasApp,
-        max_workers: int = 3,
-        import_log_id: uuid.UUID | None = None
+        max_workers: int = 8,
+        import_log_id: uuid.UUID | None = None,
+        incremental: bool = False
     ) -> tuple[int, int, list[dict[str, Any]]]:
         """
         Multi-threaded function that updates parliamentarians with custom
@@ -350,7 +484,13 @@ class KubImporter:
 
         Uses a queue-based approach where worker threads fetch API data
         concurrently while the main thread handles all database updates to
-        maintain thread safety.
+        maintain thread safety. The number of concurrent requests adapts to
+        the API, up to ``max_workers``.
+
+        The ETag and a hash of the data of every person is checkpointed in
+        the ImportLog. If ``incremental`` is set, people whose data did not
+        change since the last checkpoint are skipped. Since the checkpoint
+        is taken per person, an interrupted run resumes where it left off.
 
         Returns:
             Tuple of (updated_count, error_count, output_messages)
@@ -366,13 +506,10 @@ class KubImporter:
             'brief_anrede': 'salutation_for_letter'
         }
 
-        all_parliamentarians = request.session.query(Parliamentarian).all()
-        parliamentarians_with_id = [
-            p for p in all_parliamentarians if p.external_kub_id is not None
-        ]
-        parliamentarians_without_id = [
-            p for p in all_parliamentarians if p.external_kub_id is None
-        ]
+        session = request.session
+        parliamentarians_without_id = session.query(Parliamentarian).filter(
+            Parliamentarian.external_kub_id.is_(None)
+        ).all()
 
         # Log warning if parliamentarians without external_kub_id exist
         if parliamentarians_without_id:
@@ -390,19 +527,35 @@ class KubImporter:
                 f'These will not be synchronized.'
             )
 
-        if not parliamentarians_with_id:
+        parliamentarians = session.query(Parliamentarian).filter(
+            Parliamentarian.external_kub_id.isnot(None)
+        ).all()
+
+        if not parliamentarians:
             if self.output:
                 self.output.info(
                     'No parliamentarians with external_kub_id found'
                 )
             return 0, 0, []
 
-        parliamentarians = parliamentarians_with_id
+        parliamentarians_by_id = {str(p.id): p for p in parliamentarians}
+
+        previous: dict[str, dict[str, Any]] = {}
+        if incremental:
+            previous = self._last_import_detail(
+                session, 'custom_data_checkpoint'
+            ) or {}
+        checkpoint = dict(previous)
+        etags = {
+            person_id: entry['etag']
+            for person_id, entry in previous.items()
+            if entry.get('etag')
+        }
 
         if self.output:
             self.output.info(
                 f'Found {len(parliamentarians)} parliamentarians to update '
-                f'with custom data using {max_workers} workers'
+                f'with custom data using up to {max_workers} workers'
             )
 
         parliamentarian_queue: queue.Queue[Any] = queue.Queue()
@@ -411,14 +564,16 @@ class KubImporter:
         for p in parliamentarians:
             parliamentarian_queue.put(p)
 
-        # Start worker threads (API fetching only)
+        # Start worker threads (API fetching only), the adaptive limit
+        # decides how many of them may send requests at the same time
+        limit = AdaptiveLimit(max_workers)
         threads = []
-        for i in range(max_workers):
+        for i in range(limit.maximum):
             t = threading.Thread(
                 target=_fetch_custom_data_worker,
                 args=(
                     parliamentarian_queue, result_queue,
-                    self.session, self.base_url
+                    self.session, self.base_url, limit, etags
                 )
             )
             t.start()
@@ -426,6 +581,7 @@ class KubImporter:
 
         # Main thread handles all DB updates (single session, thread-safe)
         updated_count = 0
+        skipped_count = 0
         error_count = 0
         processed = 0
 
@@ -436,6 +592,14 @@ class KubImporter:
                 result = result_queue.get(timeout=120)  # 2 min timeout
                 processed += 1
 
+                parliamentarian = parliamentarians_by_id.get(
+                    str(result.parliamentarian_id)
+                )
+                person_id = (
+                    str(parliamentarian.external_kub_id)
+                    if parliamentarian else ''
+                )
+
                 if result.error:
                     error_count += 1
                     if self.output:
@@ -448,50 +612,60 @@ class KubImporter:
                                 f'✗ Failed to fetch {result.title}: '
                                 f'{result.error}'
                             )
-                else:
-                    # Update parliamentarian in main thread's session
-                    parliamentarian = request.session.query(
-                        Parliamentarian).filter(
-                        Parliamentarian.id == result.parliamentarian_id
-                    ).first()
-
-                    if parliamentarian:
-                        updated_fields = []
-                        for custom_key, attr_name in field_mappings.items():
-                            if custom_key in result.custom_values:
-                                setattr(
-                                    parliamentarian, attr_name,
-                                    result.custom_values[custom_key]
-                                )
-                                updated_fields.append(attr_name)
-
-                        # Process address data
-                        if result.addresses:
-                            address_updated = self._update_address_fields(
-                                parliamentarian, result.addresses
-                            )
-                            updated_fields.extend(address_updated)
+                elif result.not_modified or (
+                    incremental
+                    and previous.get(person_id, {}).get('hash')
+                    == result.digest
+                ):
+                    skipped_count += 1
+                    if result.etag:
+                        checkpoint[person_id] = {
+                            **checkpoint.get(person_id, {}),
+                            'etag': result.etag
+                        }
+                elif parliamentarian:
+                    updated_fields = []
+                    for custom_key, attr_name in field_mappings.items():
+                        if custom_key not in result.custom_values:
+                            continue
+
+                        value = result.custom_values[custom_key]
+                        if getattr(parliamentarian, attr_name) != value:
+                            setattr(parliamentarian, attr_name, value)
+                            updated_fields.append(attr_name)
+
+                    # Process address data
+                    if result.addresses:
+                        address_updated = self._update_address_fields(
+                            parliamentarian, result.addresses
+                        )
+                        updated_fields.extend(address_updated)
 
-                        # Process gender from sex field
-                        if result.sex is not None:
-                            gender_updated = self._update_gender_field(
-                                parliamentarian, result.sex
+                    # Process gender from sex field
+                    if result.sex is not None:
+                        gender_updated = self._update_gender_field(
+                            parliamentarian, result.sex
+                        )
+                        if gender_updated:
+                            updated_fields.append('gender')
+
+                    checkpoint[person_id] = {
+                        'hash': result.digest,
+                        'etag': result.etag
+                    }
+
+                    if updated_fields:
+                        updated_count += 1
+                        if self.output:
+                            self.output.success(
+                                f'✓ Updated {result.title}: '
+                                f'{", ".join(updated_fields)}'
+                            )
+                    else:
+                        if self.output:
+                            self.output.info(
+                                f'No changes found for {result.title}'
                             )
-                            if gender_updated:
-                                updated_fields.append('gender')
-
-                        if updated_fields:
-                            updated_count += 1
-                            if self.output:
-                                self.output.success(
-                                    f'✓ Updated {result.title}: '
-                                    f'{", ".join(updated_fields)}'
-                                )
-                        else:
-                            if self.output:
-                                self.output.info(
-                                    f'No custom data found for {result.title}'
-                                )
 
                 result_queue.task_done()
 
@@ -501,6 +675,11 @@ class KubImporter:
                 error_count += (len(parliamentarians) - processed)
                 break
 
+        if skipped_count and self.output:
+            self.output.info(
+                f'Skipped {skipped_count} unchanged parliamentarians'
+            )
+
         # Wait for all worker threads to complete
         timed_out = False
         for t in threads:
@@ -517,7 +696,7 @@ class KubImporter:
         # Update ImportLog if provided
         output_messages = []
         if import_log_id:
-            import_log = request.session.query(ImportLog).filter(
+            import_log = session.query(ImportLog).filter(
                 ImportLog.id == import_log_id
             ).first()
 
@@ -531,6 +710,7 @@ class KubImporter:
 
                 import_log.details['custom_data_update'] = {
                     'updated': updated_count,
+                    'skipped': skipped_count,
                     'errors': error_count,
                     'processed': len(parliamentarians)
                 }
@@ -543,16 +723,27 @@ class KubImporter:
                 if timed_out:
                     import_log.status = 'timeout'
 
-                request.session.flush()
+            if import_log:
+                import_log.details['custom_data_checkpoint'] = checkpoint
+                flag_modified(import_log, 'details')
+
+            session.flush()
 
         return updated_count, error_count, output_messages
 
     def import_data(
-        self, request: PasRequest, app: PasApp, import_type: str = 'automatic'
+        self,
+        request: PasRequest,
+        app: PasApp,
+        import_type: str = 'automatic',
+        incremental: bool = False
     ) -> tuple[dict[str, Any], list[Any], list[Any], list[Any], uuid.UUID]:
         """
         Performs KUB data import using the shared session.
 
+        If ``incremental`` is set, the import is skipped if the fetched
+        data is the same as the one of the last completed import.
+
         Returns:
             Tuple of (import_results, people_data, organization_data,
                       membership_data, import_log_id)
@@ -596,9 +787,20 @@ class KubImporter:
                     import_log_id,
                 )
 
+            # the endpoints are paginated independently of each other, so
+            # we fetch them at the same time
             if self.output:
-                self.output.info('Fetching people data...')
-            people_raw = self._fetch_api_data_with_pagination('people')
+                self.output.info(
+                    'Fetching people, organizations and memberships data...'
+                )
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                people_raw, organizations_raw, memberships_raw = (
+                    executor.map(
+                        self._fetch_api_data_with_pagination,
+                        ('people', 'organizations', 'memberships')
+                    )
+                )
+
             if not people_raw:
                 error_msg = 'Fetched 0 people records — aborting import'
                 log.warning(error_msg)
@@ -621,27 +823,44 @@ class KubImporter:
                 self.output.success(
                     f'Fetched {len(people_raw)} people records'
                 )
-
-            if self.output:
-                self.output.info('Fetching organizations data...')
-            organizations_raw = self._fetch_api_data_with_pagination(
-                'organizations'
-            )
-            if self.output:
                 self.output.success(
                     f'Fetched {len(organizations_raw)} organization records'
                 )
-
-            if self.output:
-                self.output.info('Fetching memberships data...')
-            memberships_raw = self._fetch_api_data_with_pagination(
-                'memberships'
-            )
-            if self.output:
                 self.output.success(
                     f'Fetched {len(memberships_raw)} membership records'
                 )
 
+            source_hashes = {
+                'people': source_digest(people_raw),
+                'organizations': source_digest(organizations_raw),
+                'memberships': source_digest(memberships_raw),
+            }
+            import_log.details['source_hashes'] = source_hashes
+            flag_modified(import_log, 'details')
+
+            # the automatic import runs regularly, most of the time
+            # nothing changed since the last import
+            if incremental and source_hashes == self._last_import_detail(
+                request.session, 'source_hashes', status='completed'
+            ):
+                import_log.details.update({
+                    'import_results': {},
+                    'unchanged': True,
+                    'status': 'completed'
+                })
+                import_log.status = 'completed'
+                if self.output:
+                    self.output.success(
+                        'KUB data unchanged since the last import, skipping'
+                    )
+                return (
+                    import_results,
+                    people_data,
+                    organization_data,
+                    membership_data,
+                    import_log_id,
+                )
+
             # Process raw data through load_and_concatenate_json
             # We wrap API responses to use the same method as form upload
             if self.output:
@@ -780,18 +999,26 @@ class KubImporter:
         app: PasApp,
         import_type: str,
         update_custom: bool = True,
-        max_workers: int = 3,
+        max_workers: int = 8,
     ) -> tuple[dict[str, Any], uuid.UUID]:
         """
         This is the main entry point for cronjobs and automated imports.
         Complete KUB synchronization including import and custom data update.
 
+        Automatic imports are incremental, unchanged data is skipped.
+
         Returns:
             Tuple of (combined_results, import_log_id)
         """
         # Perform main import
+        incremental = import_type == 'automatic'
         import_results, _people_data, _org_data, _membership_data, log_id = (
-            self.import_data(request, app, import_type=import_type)
+            self.import_data(
+                request,
+                app,
+                import_type=import_type,
+                incremental=incremental
+            )
         )
 
         combined_results = {
@@ -807,7 +1034,8 @@ class KubImporter:
             try:
                 updated_count, error_count, _output_messages = (
                     self.update_custom_data(
-                        request, app, max_workers, log_id
+                        request, app, max_workers, log_id,
+                        incremental=incremental
                     )
                 )
                 combined_results['custom_data'] = {
@@ -141,36 +141,47 @@ class Attendence(Base, TimestampMixin):
             >>> calculate_value(attendence)
             '2.5'
         """
-        if self.duration < 0:
-            raise ValueError('Duration cannot be negative')
+        return attendance_value(self.type, self.duration)
 
-        if self.type == 'plenary':
-            return (self.duration / Decimal('60')).quantize(
+    def __repr__(self) -> str:
+        return f'<Attendence {self.date} {self.type}>'
+
+
+def attendance_value(
+    attendance_type: AttendenceType,
+    duration: Decimal | int,
+) -> Decimal:
+    """ The value (in hours) of an attendance with the given type and
+    duration in minutes, see :meth:`Attendence.calculate_value`.
+
+    """
+    if duration < 0:
+        raise ValueError('Duration cannot be negative')
+
+    if attendance_type == 'plenary':
+        return (duration / Decimal('60')).quantize(
+            Decimal('0.01'), rounding=ROUND_HALF_UP
+        )
+
+    if attendance_type in ('commission', 'study', 'shortest'):
+        # Convert minutes to hours with Decimal for precise calculation
+        duration_hours = duration / Decimal('60')
+
+        if duration_hours <= Decimal('2'):
+            # Round to 2 decimal places
+            return duration_hours.quantize(
+                Decimal('0.01'), rounding=ROUND_HALF_UP
+            )
+        else:
+            base_hours = Decimal('2')
+            additional_hours = (duration_hours - base_hours)
+            # Round additional time to nearest 0.5
+            additional_hours = (additional_hours * 2).quantize(
+                Decimal('1'), rounding=ROUND_HALF_UP
+            ) / 2
+            total_hours = base_hours + additional_hours
+            return total_hours.quantize(
                 Decimal('0.01'), rounding=ROUND_HALF_UP
             )
 
-        if self.type in ('commission', 'study', 'shortest'):
-            # Convert minutes to hours with Decimal for precise calculation
-            duration_hours = self.duration / Decimal('60')
-
-            if duration_hours <= Decimal('2'):
-                # Round to 2 decimal places
-                return duration_hours.quantize(
-                    Decimal('0.01'), rounding=ROUND_HALF_UP
-                )
-            else:
-                base_hours = Decimal('2')
-                additional_hours = (duration_hours - base_hours)
-                # Round additional time to nearest 0.5
-                additional_hours = (additional_hours * 2).quantize(
-                    Decimal('1'), rounding=ROUND_HALF_UP
-                ) / 2
-                total_hours = base_hours + additional_hours
-                return total_hours.quantize(
-                    Decimal('0.01'), rounding=ROUND_HALF_UP
-                )
-
-        raise ValueError(f'Unknown attendance type: {self.type}')
-
-    def __repr__(self) -> str:
-        return f'<Attendence {self.date} {self.type}>'
+    raise ValueError(f'Unknown attendance type: {attendance_type}')
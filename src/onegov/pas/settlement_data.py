@@ -1,37 +1,44 @@
 from __future__ import annotations
 
+import hashlib
+
 from dataclasses import dataclass
 from decimal import Decimal
 
+from sqlalchemy import func
 from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
 from onegov.pas.calculate_pay import Compensation
 from onegov.pas.calculate_pay import calculate_attendance_compensation
 from onegov.pas.calculate_pay import calculate_compensation
-from onegov.pas.collections import AttendenceCollection
-from onegov.pas.collections.presidential_allowance import (
-    PresidentialAllowanceCollection,
-)
 from onegov.pas.custom import get_current_rate_set
+from onegov.pas.models.attendence import Attendence
+from onegov.pas.models.attendence import attendance_value
 from onegov.pas.models.attendence import TYPES
+from onegov.pas.models.commission import PASCommission
+from onegov.pas.models.commission_membership import PASCommissionMembership
+from onegov.pas.models.parliamentarian import PASParliamentarian
 from onegov.pas.models.parliamentarian_role import PASParliamentarianRole
 from onegov.pas.models.party import Party
 from onegov.pas.models.presidential_allowance import (
     LOHNART_ALLOWANCE_TEXT,
 )
-from onegov.pas.utils import is_president_for_attendance
+from onegov.pas.models.presidential_allowance import PresidentialAllowance
+from onegov.pas.models.rate_set import RateSet
+from onegov.pas.utils import is_president_on
 
 
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from datetime import date
     from uuid import UUID
 
     from sqlalchemy.orm import Session
+    from sqlalchemy.sql import ColumnElement
 
-    from onegov.pas.models import PASCommission
-    from onegov.pas.models import PASParliamentarian
     from onegov.pas.models.attendence import AttendenceType
     from onegov.pas.models.settlement_run import SettlementRun
     from onegov.town6.request import TownRequest
@@ -61,6 +68,24 @@ class SettlementAllowanceEntry:
 
 type SettlementEntry = SettlementAttendanceEntry | SettlementAllowanceEntry
 
+#: date, parliamentarian id, type, commission id, duration, value,
+#: base and adjusted compensation of an attendance
+type AttendanceRow = tuple[
+    date, UUID, AttendenceType, UUID | None,
+    Decimal, Decimal, Decimal, Decimal
+]
+
+#: parliamentarian id, base and adjusted compensation of an allowance
+type AllowanceRow = tuple[UUID, Decimal, Decimal]
+
+#: the attendance rows, the allowance rows and the party id of each
+#: parliamentarian, as they are cached per settlement run
+type SettlementRows = tuple[
+    tuple[AttendanceRow, ...],
+    tuple[AllowanceRow, ...],
+    tuple[tuple[UUID, UUID | None], ...],
+]
+
 
 @dataclass(frozen=True)
 class SettlementData:
@@ -69,16 +94,19 @@ class SettlementData:
     party_lookup: dict[UUID, Party | None]
 
 
-def get_party_lookup(
+def get_party_id_lookup(
     session: Session,
     parliamentarian_ids: set[UUID],
     start_date: date,
     end_date: date,
-) -> dict[UUID, Party | None]:
-    roles = (
-        session.query(PASParliamentarianRole)
+) -> dict[UUID, UUID | None]:
+    roles = session.execute(
+        select(
+            PASParliamentarianRole.parliamentarian_id,
+            PASParliamentarianRole.party_id,
+        )
         .join(Party)
-        .filter(
+        .where(
             PASParliamentarianRole.parliamentarian_id.in_(parliamentarian_ids),
             PASParliamentarianRole.party_id.isnot(None),
             or_(
@@ -88,102 +116,309 @@ def get_party_lookup(
             PASParliamentarianRole.start <= end_date,
         )
         .order_by(PASParliamentarianRole.start.desc())
-        .all()
+    ).tuples()
+
+    party_ids: dict[UUID, UUID | None] = dict.fromkeys(parliamentarian_ids)
+    for parliamentarian_id, party_id in roles:
+        if party_ids[parliamentarian_id] is None:
+            party_ids[parliamentarian_id] = party_id
+    return party_ids
+
+
+def get_party_lookup(
+    session: Session,
+    parliamentarian_ids: set[UUID],
+    start_date: date,
+    end_date: date,
+) -> dict[UUID, Party | None]:
+    return load_parties(session, get_party_id_lookup(
+        session,
+        parliamentarian_ids,
+        start_date,
+        end_date,
+    ))
+
+
+def load_parties(
+    session: Session,
+    party_ids: dict[UUID, UUID | None],
+) -> dict[UUID, Party | None]:
+    ids = {party_id for party_id in party_ids.values() if party_id}
+    parties = {
+        party.id: party
+        for party in session.query(Party).filter(Party.id.in_(ids))
+    } if ids else {}
+
+    return {
+        parliamentarian_id: parties.get(party_id) if party_id else None
+        for parliamentarian_id, party_id in party_ids.items()
+    }
+
+
+def settlement_fingerprint(
+    session: Session,
+    settlement_run: SettlementRun,
+) -> str:
+    """ Returns a fingerprint of everything the settlement of the given run
+    depends on. Whenever an attendance, allowance, rate set, role,
+    commission or commission membership is added, changed or removed the
+    fingerprint changes as well.
+
+    """
+    sources: tuple[tuple[Any, tuple[ColumnElement[bool], ...]], ...] = (
+        (Attendence, (
+            Attendence.date >= settlement_run.start,
+            Attendence.date <= settlement_run.end,
+        )),
+        (PresidentialAllowance, (
+            PresidentialAllowance.settlement_run_id == settlement_run.id,
+        )),
+        (RateSet, (RateSet.year == settlement_run.start.year, )),
+        (PASParliamentarianRole, ()),
+        (PASCommission, ()),
+        (PASCommissionMembership, ()),
     )
 
-    party_lookup = dict.fromkeys(parliamentarian_ids)
-    for role in roles:
-        if party_lookup[role.parliamentarian_id] is None:
-            party_lookup[role.parliamentarian_id] = role.party
-    return party_lookup
+    columns = []
+    for model, criteria in sources:
+        columns.append(
+            select(func.count())
+            .select_from(model)
+            .where(*criteria)
+            .scalar_subquery()
+        )
+        columns.append(
+            select(func.max(model.last_change))
+            .where(*criteria)
+            .scalar_subquery()
+        )
+
+    state = session.execute(select(*columns)).one()
+    return hashlib.sha256(repr((
+        settlement_run.start,
+        settlement_run.end,
+        *state
+    )).encode('utf-8')).hexdigest()
 
 
-def get_settlement_data(
+def compute_settlement_rows(
+    session: Session,
     settlement_run: SettlementRun,
-    request: TownRequest,
-) -> SettlementData:
-    session = request.session
+) -> SettlementRows:
+    """ Computes the compensations of all attendances and allowances of the
+    given run as compact rows.
+
+    The roles and commission memberships needed to tell whether the
+    president rate applies are loaded once for all parliamentarians and
+    each distinct compensation is only calculated once.
+
+    """
     rate_set = get_current_rate_set(session, settlement_run)
     if not rate_set:
-        return SettlementData([], [], {})
+        return (), (), ()
 
-    attendances = (
-        AttendenceCollection(
-            session,
-            date_from=settlement_run.start,
-            date_to=settlement_run.end,
+    attendances = session.execute(
+        select(
+            Attendence.date,
+            Attendence.parliamentarian_id,
+            Attendence.type,
+            Attendence.commission_id,
+            Attendence.duration,
         )
-        .query()
-        .all()
-    )
-    allowances = (
-        PresidentialAllowanceCollection(
-            session,
-            settlement_run_id=settlement_run.id,
+        .where(
+            Attendence.date >= settlement_run.start,
+            Attendence.date <= settlement_run.end,
         )
-        .query()
-        .all()
-    )
-    parliamentarian_ids = {
-        attendance.parliamentarian_id for attendance in attendances
-    } | {allowance.parliamentarian_id for allowance in allowances}
-    party_lookup = get_party_lookup(
+        .order_by(Attendence.date.desc())
+    ).tuples().all()
+    allowances = session.execute(
+        select(
+            PresidentialAllowance.parliamentarian_id,
+            PresidentialAllowance.amount,
+        )
+        .where(PresidentialAllowance.settlement_run_id == settlement_run.id)
+        .order_by(PresidentialAllowance.role, PresidentialAllowance.created)
+    ).tuples().all()
+
+    attending_ids = {attendance[1] for attendance in attendances}
+    parliamentarians = {
+        parliamentarian.id: parliamentarian
+        for parliamentarian in session.query(PASParliamentarian)
+        .filter(PASParliamentarian.id.in_(attending_ids))
+        .options(
+            selectinload(PASParliamentarian.roles),
+            selectinload(PASParliamentarian.commission_memberships),
+        )
+    } if attending_ids else {}
+
+    commission_ids = {
+        attendance[3] for attendance in attendances if attendance[3]
+    }
+    commission_types = dict(session.execute(
+        select(PASCommission.id, PASCommission.type)
+        .where(PASCommission.id.in_(commission_ids))
+    ).tuples()) if commission_ids else {}
+
+    compensations: dict[tuple[Any, ...], Compensation] = {}
+    attendance_rows: list[AttendanceRow] = []
+    for (
+        on_date,
+        parliamentarian_id,
+        attendance_type,
+        commission_id,
+        duration,
+    ) in attendances:
+        is_president = is_president_on(
+            parliamentarians[parliamentarian_id],
+            attendance_type,
+            on_date,
+            commission_id,
+        )
+        commission_type = (
+            commission_types.get(commission_id) if commission_id else None
+        )
+        key = (attendance_type, duration, is_president, commission_type)
+        if key not in compensations:
+            compensations[key] = calculate_attendance_compensation(
+                rate_set=rate_set,
+                attendence_type=attendance_type,
+                duration_minutes=duration,
+                is_president=is_president,
+                commission_type=commission_type,
+            )
+        compensation = compensations[key]
+        attendance_rows.append((
+            on_date,
+            parliamentarian_id,
+            attendance_type,
+            commission_id,
+            duration,
+            attendance_value(attendance_type, duration),
+            compensation.base,
+            compensation.adjusted,
+        ))
+
+    allowance_rows: list[AllowanceRow] = []
+    for parliamentarian_id, amount in allowances:
+        compensation = calculate_compensation(
+            amount,
+            rate_set.cost_of_living_adjustment,
+        )
+        allowance_rows.append((
+            parliamentarian_id,
+            compensation.base,
+            compensation.adjusted,
+        ))
+
+    party_ids = get_party_id_lookup(
         session,
-        parliamentarian_ids,
+        attending_ids | {allowance[0] for allowance in allowances},
         settlement_run.start,
         settlement_run.end,
     )
 
+    return (
+        tuple(attendance_rows),
+        tuple(allowance_rows),
+        tuple(party_ids.items()),
+    )
+
+
+def get_settlement_rows(
+    settlement_run: SettlementRun,
+    request: TownRequest,
+) -> SettlementRows:
+    """ Returns the compact settlement rows of the given run, computing
+    them only if they changed since they were last cached.
+
+    """
+    session = request.session
+    key = 'settlement-rows-{}-{}'.format(
+        settlement_run.id.hex,
+        settlement_fingerprint(session, settlement_run)
+    )
+    return request.app.cache.get_or_create(
+        key,
+        lambda: compute_settlement_rows(session, settlement_run)
+    )
+
+
+def get_settlement_data(
+    settlement_run: SettlementRun,
+    request: TownRequest,
+) -> SettlementData:
+    """ Returns the settlement of the given run, shared by all exports. """
+
+    session = request.session
+    attendance_rows, allowance_rows, party_rows = get_settlement_rows(
+        settlement_run,
+        request,
+    )
+
+    parliamentarian_ids = {row[1] for row in attendance_rows} | {
+        row[0] for row in allowance_rows
+    }
+    parliamentarians = {
+        parliamentarian.id: parliamentarian
+        for parliamentarian in session.query(PASParliamentarian)
+        .filter(PASParliamentarian.id.in_(parliamentarian_ids))
+    } if parliamentarian_ids else {}
+
+    commission_ids = {row[3] for row in attendance_rows if row[3]}
+    commissions = {
+        commission.id: commission
+        for commission in session.query(PASCommission)
+        .filter(PASCommission.id.in_(commission_ids))
+    } if commission_ids else {}
+
+    type_labels = {
+        attendance_type: request.translate(label)
+        for attendance_type, label in TYPES.items()
+    }
+
     attendance_entries = []
-    for attendance in attendances:
-        compensation = calculate_attendance_compensation(
-            rate_set=rate_set,
-            attendence_type=attendance.type,
-            duration_minutes=attendance.duration,
-            is_president=is_president_for_attendance(
-                attendance.parliamentarian,
-                attendance,
-            ),
-            commission_type=(
-                attendance.commission.type if attendance.commission else None
-            ),
-        )
-        type_label = request.translate(TYPES[attendance.type])
+    for (
+        on_date,
+        parliamentarian_id,
+        attendance_type,
+        commission_id,
+        duration,
+        value,
+        base,
+        adjusted,
+    ) in attendance_rows:
+        commission = commissions.get(commission_id) if commission_id else None
+        type_label = type_labels[attendance_type]
         type_description = type_label
-        if attendance.commission:
-            type_description = (
-                f'{type_description} - {attendance.commission.name}'
-            )
+        if commission:
+            type_description = f'{type_description} - {commission.name}'
         attendance_entries.append(
             SettlementAttendanceEntry(
-                date=attendance.date,
-                parliamentarian=attendance.parliamentarian,
-                attendance_type=attendance.type,
-                commission=attendance.commission,
+                date=on_date,
+                parliamentarian=parliamentarians[parliamentarian_id],
+                attendance_type=attendance_type,
+                commission=commission,
                 type_label=type_label,
                 type_description=type_description,
-                duration_minutes=attendance.duration,
-                value=attendance.calculate_value(),
-                compensation=compensation,
+                duration_minutes=duration,
+                value=value,
+                compensation=Compensation(base=base, adjusted=adjusted),
             )
         )
 
     allowance_entries = [
         SettlementAllowanceEntry(
             date=settlement_run.end,
-            parliamentarian=allowance.parliamentarian,
+            parliamentarian=parliamentarians[parliamentarian_id],
             type_description=LOHNART_ALLOWANCE_TEXT,
             value=Decimal('0'),
-            compensation=calculate_compensation(
-                allowance.amount,
-                rate_set.cost_of_living_adjustment,
-            ),
+            compensation=Compensation(base=base, adjusted=adjusted),
         )
-        for allowance in allowances
+        for parliamentarian_id, base, adjusted in allowance_rows
     ]
 
     return SettlementData(
         attendances=attendance_entries,
         allowances=allowance_entries,
-        party_lookup=party_lookup,
+        party_lookup=load_parties(session, dict(party_rows)),
     )
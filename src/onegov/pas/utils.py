@@ -153,15 +153,33 @@ def is_president_for_attendance(
     commission, there the Kantonsratspräsidium decides.
 
     """
-    if attendance.type == 'plenary':
-        return is_kantonsrat_president(parliamentarian, attendance.date)
+    return is_president_on(
+        parliamentarian,
+        attendance.type,
+        attendance.date,
+        attendance.commission_id,
+    )
+
+
+def is_president_on(
+    parliamentarian: PASParliamentarian,
+    attendance_type: str,
+    on_date: date,
+    commission_id: UUID | None,
+) -> bool:
+    """Same as :func:`is_president_for_attendance`, but for the bare
+    values of an attendance.
+
+    """
+    if attendance_type == 'plenary':
+        return is_kantonsrat_president(parliamentarian, on_date)
 
-    if attendance.commission_id is None:
+    if commission_id is None:
         return False
 
     return parliamentarian.has_commission_presidency(
-        on_date=attendance.date,
-        commission_id=attendance.commission_id,
+        on_date=on_date,
+        commission_id=commission_id,
     )
 
 
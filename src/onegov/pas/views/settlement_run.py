@@ -16,13 +16,9 @@ from onegov.core.utils import normalize_for_filename
 from onegov.pas import _
 from onegov.pas import PasApp
 from onegov.pas.calculate_pay import Compensation
-from onegov.pas.calculate_pay import calculate_attendance_compensation
-from onegov.pas.calculate_pay import calculate_compensation
 from onegov.pas.collections import (
-    AttendenceCollection,
     SettlementRunCollection,
 )
-from onegov.pas.custom import get_current_rate_set
 from onegov.pas.export_single_parliamentarian import (
     generate_parliamentarian_settlement_pdf
 )
@@ -37,14 +33,13 @@ from onegov.pas.models import (
     Party,
     SettlementRun,
 )
-from onegov.pas.models.attendence import TYPES
 from onegov.pas.path import SettlementRunExport, SettlementRunAllExport
+from onegov.pas.settlement_data import get_settlement_data
 from onegov.pas.utils import (
     format_swiss_number,
     get_commissions_with_memberships,
     get_parliamentarians_with_settlements,
     get_parties_with_settlements,
-    is_president_for_attendance,
 )
 from onegov.pas.views.abschlussliste import (
     generate_abschlussliste_xlsx,
@@ -52,9 +47,6 @@ from onegov.pas.views.abschlussliste import (
 )
 from onegov.pas.views.pas_excel_export_nr_3_lohnart_fibu import (
         generate_fibu_export_rows)
-from onegov.pas.collections.presidential_allowance import (
-    PresidentialAllowanceCollection,
-)
 from onegov.pas.models.presidential_allowance import (
     LOHNART_ALLOWANCE_TEXT,
 )
@@ -65,7 +57,9 @@ if TYPE_CHECKING:
     from sqlalchemy.orm import Session
     from datetime import date
     from onegov.core.types import RenderData
+    from onegov.pas.settlement_data import SettlementData
     from onegov.town6.request import TownRequest
+    from uuid import UUID
 
     type SettlementDataRow = tuple[
         date, PASParliamentarian, str, Decimal, Decimal, Decimal
@@ -84,20 +78,14 @@ def _settlement_totals(
     settlement_data: list[SettlementDataRow],
     group_by: Literal['party', 'person'],
     total_label: str,
-    session: Session,
-    start: date,
-    end: date,
+    party_lookup: dict[UUID, Party | None],
 ) -> list[TotalRow]:
     meeting_compensations: dict[str, Compensation] = {}
     total_compensations: dict[str, Compensation] = {}
     for row in settlement_data:
         parliamentarian = row[1]
         if group_by == 'party':
-            party = parliamentarian.get_party_during_period(
-                start,
-                end,
-                session,
-            )
+            party = party_lookup.get(parliamentarian.id)
             if party is None:
                 continue
             name = party.name
@@ -519,66 +507,34 @@ def generate_settlement_pdf(
     group_by: Literal['party', 'person']
     total_label: str
 
+    data = get_settlement_data(settlement_run, request)
+
     if entity_type == 'commission' and isinstance(entity, PASCommission):
-        settlement_data = _get_commission_settlement_data(
-            settlement_run, request, entity
-        )
+        settlement_data = _get_commission_settlement_data(data, entity)
         subtitle = f'Einträge Sitzungen: «{entity.name}»'
         group_by = 'party'
         total_label = f'Total {entity.name}'
 
     elif entity_type == 'party' and isinstance(entity, Party):
-        settlement_data = _get_party_settlement_data(
-            settlement_run, request, entity
-        )
+        settlement_data = _get_party_settlement_data(data, entity)
         group_by = 'person'
         total_label = f'Total {entity.name}'
 
     elif entity_type == 'all':
-        settlement_data = _get_data_export_all(settlement_run, request)
+        # the Amtliche Mission belongs to the person, it shall only be
+        # listed on the parliamentarian export and on the overview across
+        # all parties
+        settlement_data = _get_data_export_all(data)
         group_by = 'party'
         total_label = 'Total Parteien'
     else:
         raise ValueError(f'Unsupported entity type: {entity_type}')
 
-    # the Amtliche Mission belongs to the person, it shall only be listed
-    # on the parliamentarian export and on the overview across all parties
-    allowances = (
-        PresidentialAllowanceCollection(
-            request.session,
-            settlement_run_id=settlement_run.id,
-        )
-        .query()
-        .all()
-        if entity_type == 'all'
-        else []
-    )
-
-    if allowances:
-        rate_set = get_current_rate_set(request.session, settlement_run)
-        for a in allowances:
-            compensation = calculate_compensation(
-                a.amount,
-                rate_set.cost_of_living_adjustment,
-            )
-            settlement_data.append(
-                (
-                    settlement_run.end,
-                    a.parliamentarian,
-                    LOHNART_ALLOWANCE_TEXT,
-                    Decimal('0'),
-                    compensation.base,
-                    compensation.adjusted,
-                )
-            )
-
     totals = _settlement_totals(
         settlement_data,
         group_by,
         total_label,
-        request.session,
-        settlement_run.start,
-        settlement_run.end,
+        data.party_lookup,
     )
 
     html = _generate_settlement_html(
@@ -593,50 +549,23 @@ def generate_settlement_pdf(
 
 
 def _get_commission_settlement_data(
-    settlement_run: SettlementRun,
-    request: TownRequest,
+    settlement_data: SettlementData,
     commission: PASCommission
 ) -> list[SettlementDataRow]:
     """Get settlement data for a specific commission."""
-    session = request.session
-    rate_set = get_current_rate_set(request.session, settlement_run)
-
-    if not rate_set:
-        return []
-
-    attendences = AttendenceCollection(
-        session,
-        date_from=settlement_run.start,
-        date_to=settlement_run.end
-    ).query().filter(
-        Attendence.commission_id == commission.id
-    )
-    result = []
-    for attendence in attendences:
-        is_president = is_president_for_attendance(
-            attendence.parliamentarian,
-            attendence,
-        )
-
-        compensation = calculate_attendance_compensation(
-            rate_set=rate_set,
-            attendence_type=attendence.type,
-            duration_minutes=attendence.duration,
-            is_president=is_president,
-            commission_type=commission.type
-        )
-
-        result.append(
-            (
-                attendence.date,
-                attendence.parliamentarian,
-                request.translate(TYPES[attendence.type]),
-                attendence.calculate_value(),
-                compensation.base,
-                compensation.adjusted,
-            )
-        )
-
+    result = [
+        (
+            entry.date,
+            entry.parliamentarian,
+            entry.type_label,
+            entry.value,
+            entry.compensation.base,
+            entry.compensation.adjusted,
+        )
+        for entry in settlement_data.attendances
+        if entry.commission is not None
+        and entry.commission.id == commission.id
+    ]
     return sorted(result, key=itemgetter(0))
 
 
@@ -746,132 +675,69 @@ def _generate_settlement_html(
 
 
 def _get_data_export_all(
-    self: SettlementRun, request: TownRequest
+    settlement_data: SettlementData
 ) -> list[SettlementDataRow]:
 
-    session = request.session
-    rate_set = get_current_rate_set(session, self)
-
-    if not rate_set:
-        return []
-
-    # Use collection to get all attendences in period
-    attendences = AttendenceCollection(
-        session,
-        date_from=self.start,
-        date_to=self.end
-    )
-
-    settlement_data: list[SettlementDataRow] = []
-
-    for attendence in attendences.query():
-        is_president = is_president_for_attendance(
-            attendence.parliamentarian,
-            attendence,
-        )
-
-        compensation = calculate_attendance_compensation(
-            rate_set=rate_set,
-            attendence_type=attendence.type,
-            duration_minutes=attendence.duration,
-            is_president=is_president,
-            commission_type=(
-                attendence.commission.type if attendence.commission else None
-            ),
-        )
-
+    result: list[SettlementDataRow] = []
+    for entry in settlement_data.attendances:
         # Build description of the session/meeting
-        translated_type = request.translate(TYPES[attendence.type])
-
-        if attendence.type == 'plenary':
-            type_desc = translated_type
-        elif attendence.type == 'commission' or attendence.type == 'study':
+        if entry.attendance_type in ('commission', 'study'):
             commission_name = (
-                attendence.commission.name if attendence.commission else ''
+                entry.commission.name if entry.commission else ''
             )
-            type_desc = f'{translated_type} - {commission_name}'
-        else:  # shortest
-            type_desc = translated_type
+            type_desc = f'{entry.type_label} - {commission_name}'
+        else:  # plenary and shortest
+            type_desc = entry.type_label
 
-        # Add row for this attendence
-        settlement_data.append(
+        result.append(
             (
-                attendence.date,
-                attendence.parliamentarian,
+                entry.date,
+                entry.parliamentarian,
                 type_desc,
-                attendence.calculate_value(),
-                compensation.base,
-                compensation.adjusted,
+                entry.value,
+                entry.compensation.base,
+                entry.compensation.adjusted,
             )
         )
 
+    result.extend(
+        (
+            allowance.date,
+            allowance.parliamentarian,
+            allowance.type_description,
+            allowance.value,
+            allowance.compensation.base,
+            allowance.compensation.adjusted,
+        )
+        for allowance in settlement_data.allowances
+    )
+
     # Sort by date
-    settlement_data.sort(key=itemgetter(0))
-    return settlement_data
+    result.sort(key=itemgetter(0))
+    return result
 
 
 def _get_party_settlement_data(
-    settlement_run: SettlementRun,
-    request: TownRequest,
+    settlement_data: SettlementData,
     party: Party
 ) -> list[SettlementDataRow]:
     """Get settlement data for a specific party."""
 
-    session = request.session
-    rate_set = get_current_rate_set(session, settlement_run)
-
-    # Get all attendences in period
-    attendences = (
-        AttendenceCollection(session)
-        .by_party(
-            party_id=str(party.id),
-            start_date=settlement_run.start,
-            end_date=settlement_run.end
-        )
-        .query()
-        .all()
-    )
-
+    party_lookup = settlement_data.party_lookup
     result = []
-    for attendence in attendences:
-
-        # Fixme: this check is likely redundant
-        current_party = attendence.parliamentarian.get_party_during_period(
-            settlement_run.start,
-            settlement_run.end,
-            session
-        )
+    for entry in settlement_data.attendances:
+        current_party = party_lookup.get(entry.parliamentarian.id)
         if not current_party or current_party.id != party.id:
             continue
 
-        # found an export
-        is_president = is_president_for_attendance(
-            attendence.parliamentarian,
-            attendence,
-        )
-
-        compensation = calculate_attendance_compensation(
-            rate_set=rate_set,
-            attendence_type=attendence.type,
-            duration_minutes=attendence.duration,
-            is_president=is_president,
-            commission_type=(
-                attendence.commission.type if attendence.commission else None
-            )
-        )
-
-        type_desc = request.translate(TYPES[attendence.type])
-        if attendence.commission:
-            type_desc = f'{type_desc} - {attendence.commission.name}'
-
         result.append(
             (
-                attendence.date,
-                attendence.parliamentarian,
-                type_desc,
-                attendence.calculate_value(),
-                compensation.base,
-                compensation.adjusted,
+                entry.date,
+                entry.parliamentarian,
+                entry.type_description,
+                entry.value,
+                entry.compensation.base,
+                entry.compensation.adjusted,
             )
         )
 
@@ -64,6 +64,7 @@ import tracemalloc
 
 from functools import partial
 from importlib import import_module
+from operator import itemgetter
 from onegov.server import Config
 from onegov.server import log
 from onegov.server import Server
@@ -88,6 +89,16 @@ if TYPE_CHECKING:
 
 RESOURCE_TRACKER: ResourceTracker = None  # type:ignore[assignment]
 
+#: workers exiting within this many seconds after being started are
+#: considered to have crashed during startup
+WORKER_MIN_UPTIME = 10.0
+
+#: the number of consecutive crashes after which the server gives up
+WORKER_MAX_CRASHES = 8
+
+#: the longest delay in seconds before a crashed worker is restarted
+WORKER_MAX_BACKOFF = 60.0
+
 
 @click.command()
 @click.option(
@@ -149,6 +160,26 @@ RESOURCE_TRACKER: ResourceTracker = None  # type:ignore[assignment]
     type=click.FloatRange(min=0.0, max=1.0),
     default=0.1
 )
+@click.option(
+    '--workers',
+    help='Number of worker processes, forked once the applications are '
+         'configured (production mode only)',
+    type=click.IntRange(min=1),
+    default=1
+)
+@click.option(
+    '--chameleon-cache',
+    help='Directory in which the compiled templates are kept between '
+         'restarts, shared by all workers',
+    type=click.Path(file_okay=False),
+    default=None
+)
+@click.option(
+    '--startup-profile',
+    help='Print the time spent on each step of the startup',
+    default=False,
+    is_flag=True
+)
 @click.option(
     '--profiles-sample-rate',
     help='How often should sentry_sdk also send a profile with the trace',
@@ -166,6 +197,9 @@ def run(
     sentry_release: str | None,
     send_ppi: bool,
     traces_sample_rate: float,
+    workers: int,
+    chameleon_cache: str | None,
+    startup_profile: bool,
     profiles_sample_rate: float
 ) -> None:
 
@@ -198,8 +232,14 @@ def run(
     # cause the first run of onegov-server to be different than any subsequent
     # runs through automated reloads.
 
+    # Chameleon reads its configuration from the environment when it is
+    # first imported, so this needs to happen before anything else
+    if chameleon_cache:
+        os.makedirs(chameleon_cache, exist_ok=True)
+        os.environ['CHAMELEON_CACHE'] = os.path.abspath(chameleon_cache)
+
     if mode == 'debug':
-        return run_debug(config_file, port, pdb, tracemalloc)
+        return run_debug(config_file, port, pdb, tracemalloc, startup_profile)
 
     if sentry_dsn:
         with_sentry = True
@@ -242,22 +282,35 @@ def run(
     else:
         with_sentry = False
 
-    return run_production(config_file, port, with_sentry=with_sentry)
+    return run_production(
+        config_file,
+        port,
+        with_sentry=with_sentry,
+        workers=workers,
+        startup_profile=startup_profile
+    )
 
 
 def run_production(
     config_file: str | bytes,
     port: int,
-    with_sentry: bool
+    with_sentry: bool,
+    workers: int = 1,
+    startup_profile: bool = False
 ) -> None:
 
     # required by Bjoern
     env = {'webob.url_encoding': 'latin-1'}
 
-    app: WSGIApplication = Server(
+    server = Server(
         config=Config.from_yaml_file(config_file),
         environ_overrides=env)
 
+    if startup_profile:
+        print_startup_profile(server)
+
+    app: WSGIApplication = server
+
     if with_sentry:
         # NOTE: Most things should be caught at lower scopes with
         #       more detailed information by our integrations, but
@@ -269,22 +322,138 @@ def run_production(
         #       of this top-level application router.
         app = SentryWsgiMiddleware(app)
 
+    if workers > 1:
+        return run_prefork(app, port, workers)
+
     log.debug(f'started onegov server on http://127.0.0.1:{port}')
 
     bjoern.run(app, '127.0.0.1', port, reuse_port=True)
 
 
+def run_prefork(app: WSGIApplication, port: int, workers: int) -> None:
+    """ Forks the given number of workers, which all listen on the same
+    port. Since the applications are configured before forking, the workers
+    are ready immediately and share the memory of the configuration.
+
+    Workers which exit are replaced, the workers are stopped together with
+    this process. Workers which crash right after starting are restarted
+    with an exponential backoff, if they keep crashing the server exits
+    with an error (see :data:`WORKER_MAX_CRASHES`).
+
+    Note that the application instances are still created by the workers,
+    since their database connections may not be shared.
+
+    """
+
+    # the workers by pid, with the time they were started
+    children: dict[int, float] = {}
+
+    def spawn() -> None:
+        pid = os.fork()
+
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            status = 0
+            try:
+                bjoern.run(app, '127.0.0.1', port, reuse_port=True)
+            except BaseException:
+                traceback.print_exc()
+                status = 1
+            finally:
+                os._exit(status)
+
+        children[pid] = time.monotonic()
+
+    def terminate() -> None:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def stop(signum: int, frame: FrameType | None) -> None:
+        terminate()
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(workers):
+        spawn()
+
+    log.debug(
+        f'started onegov server with {workers} workers '
+        f'on http://127.0.0.1:{port}'
+    )
+
+    crashes = 0
+
+    while True:
+        pid, status = os.wait()
+        started = children.pop(pid, None)
+
+        if started is not None and (
+            time.monotonic() - started < WORKER_MIN_UPTIME
+        ):
+            crashes += 1
+        else:
+            crashes = 0
+
+        if crashes >= WORKER_MAX_CRASHES:
+            log.error(
+                f'Worker {pid} exited with status {status}, the workers '
+                f'crashed {crashes} times in a row during startup, giving up'
+            )
+            terminate()
+            sys.exit(1)
+
+        if crashes:
+            delay = min(2.0 ** (crashes - 1), WORKER_MAX_BACKOFF)
+            log.warning(
+                f'Worker {pid} exited with status {status} during startup, '
+                f'restarting in {delay:.0f}s'
+            )
+            time.sleep(delay)
+        else:
+            log.warning(
+                f'Worker {pid} exited with status {status}, restarting'
+            )
+
+        spawn()
+
+
+def print_startup_profile(server: Server) -> None:
+    """ Prints the time spent on each step of the startup, slowest first. """
+
+    profile = server.startup_profile
+    click.echo(f'startup took {sum(profile.values()):.2f}s')
+
+    for step, duration in sorted(
+        profile.items(),
+        key=itemgetter(1),
+        reverse=True
+    ):
+        click.echo(f'{duration:8.2f}s {step}')
+
+
 def run_debug(
     config_file: str | bytes,
     port: int,
     pdb: bool,
-    tracemalloc: bool
+    tracemalloc: bool,
+    startup_profile: bool = False
 ) -> None:
 
     multiprocessing.set_start_method('spawn')
 
     factory = partial(debug_wsgi_factory, config_file=config_file, pdb=pdb)
-    server = WsgiServer(factory, port=port, enable_tracemalloc=tracemalloc)
+    server = WsgiServer(
+        factory,
+        port=port,
+        enable_tracemalloc=tracemalloc,
+        startup_profile=startup_profile
+    )
     server.start()
 
     observer = Observer()
@@ -398,7 +567,8 @@ class WsgiProcess(multiprocessing.Process):
         host: str = '127.0.0.1',
         port: int = 8080,
         env: dict[str, str] | None = None,
-        enable_tracemalloc: bool = False
+        enable_tracemalloc: bool = False,
+        startup_profile: bool = False
     ):
         env = env or {}
         multiprocessing.Process.__init__(self)
@@ -406,6 +576,7 @@ class WsgiProcess(multiprocessing.Process):
         self.host = host
         self.port = port
         self.enable_tracemalloc = enable_tracemalloc
+        self.startup_profile = startup_profile
 
         self._ready = multiprocessing.Value('i', 0)
 
@@ -470,7 +641,11 @@ class WsgiProcess(multiprocessing.Process):
             RESOURCE_TRACKER = ResourceTracker(
                 enable_tracemalloc=self.enable_tracemalloc)
 
-            wsgi_application = WSGIRequestMonitorMiddleware(self.app_factory())
+            application = self.app_factory()
+            if self.startup_profile and isinstance(application, Server):
+                print_startup_profile(application)
+
+            wsgi_application = WSGIRequestMonitorMiddleware(application)
             bjoern.listen(wsgi_application, self.host, self.port)
         except Exception:
             # if there's an error, print it
@@ -510,7 +685,8 @@ class WsgiServer(FileSystemEventHandler):
     def spawn(self) -> WsgiProcess:
         return WsgiProcess(self.app_factory, self._host, self._port, {
             'ONEGOV_DEVELOPMENT': '1',
-            'CHAMELEON_CACHE': '.chameleon_cache'
+            'CHAMELEON_CACHE': os.environ.get(
+                'CHAMELEON_CACHE', '.chameleon_cache')
         }, **self.kwargs)
 
     def join(self, timeout: float | None = None) -> None:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging.config
 
 from onegov.server.collection import ApplicationCollection
+from time import perf_counter
 from webob.exc import HTTPNotFound, HTTPForbidden
 from webob.request import BaseRequest
 from urllib.parse import urlparse
@@ -108,6 +109,9 @@ class Server:
             if not a.is_static
         }
 
+        #: the time in seconds spent on each step of the startup
+        self.startup_profile: dict[str, float] = {}
+
         if configure_logging:
             self.configure_logging(config.logging)
 
@@ -138,14 +142,22 @@ class Server:
 
         # morepath is only loaded if there's at lest one app depending on it
         if next(self.applications.morepath_applications(), None):
+            start = perf_counter()
             import morepath
             from onegov.server.utils import patch_morepath
             patch_morepath()
             morepath.autoscan()
+            self.startup_profile['scan'] = perf_counter() - start
 
             # Commit all registered morepath applications
             for app in self.applications.morepath_applications():
+                start = perf_counter()
                 morepath.commit(app.application_class)  # type: ignore[arg-type]
+                step = f'commit {app.application_class.__name__}'
+                self.startup_profile[step] = (
+                    self.startup_profile.get(step, 0.0)
+                    + perf_counter() - start
+                )
 
     def handle_request(
         self,
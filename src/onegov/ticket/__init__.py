@@ -4,6 +4,7 @@ from onegov.ticket.handler import Handler, HandlerRegistry
 handlers = HandlerRegistry()
 
 from onegov.ticket.models import Ticket
+from onegov.ticket.models import TicketCounter
 from onegov.ticket.models import TicketInvoice
 from onegov.ticket.models import TicketInvoiceItem
 from onegov.ticket.models import TicketPermission
@@ -16,6 +17,7 @@ __all__ = (
     'handlers',
     'Ticket',
     'TicketCollection',
+    'TicketCounter',
     'TicketInvoice',
     'TicketInvoiceCollection',
     'TicketInvoiceItem',
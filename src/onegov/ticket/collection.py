@@ -11,6 +11,7 @@ from onegov.ticket import handlers as global_handlers
 from onegov.ticket.models.invoice import TicketInvoice
 from onegov.ticket.models.invoice_item import TicketInvoiceItem
 from onegov.ticket.models.ticket import Ticket
+from onegov.ticket.models.ticket_counter import TicketCounter
 from sqlalchemy import and_, cast, desc, func, or_, UUID as UUIDType
 from sqlalchemy.orm import contains_eager, joinedload, selectinload, undefer
 from uuid import UUID
@@ -286,16 +287,28 @@ class TicketCollection(TicketCollectionPagination):
         return self.query().filter(Ticket.handler_id == handler_id).first()
 
     def get_count(self, excl_archived: bool = True) -> TicketCount:
-        query = self.query().with_entities(
-            Ticket.state, func.count(Ticket.state)
+        """ Returns the number of tickets by state.
+
+        The tickets aren't counted directly, the incrementally maintained
+        :class:`~onegov.ticket.models.TicketCounter` is used instead.
+
+        """
+        query = self.session.query(
+            TicketCounter.state, func.sum(TicketCounter.count)
         )
 
         if excl_archived:
-            query = query.filter(Ticket.state != 'archived')
+            query = query.filter(TicketCounter.state != 'archived')
+
+        query = query.group_by(TicketCounter.state)
 
-        query = query.group_by(Ticket.state)
+        return TicketCount(**{
+            state: int(count) for state, count in query.tuples()
+        })
 
-        return TicketCount(**dict(query.tuples()))
+    def reconcile_count(self) -> None:
+        """ Recounts the tickets, fixing up any drift in the counters. """
+        TicketCounter.reconcile(self.session)
 
     def by_handler_data_id(
         self,
@@ -3,11 +3,13 @@ from __future__ import annotations
 from onegov.ticket.models.invoice import TicketInvoice
 from onegov.ticket.models.invoice_item import TicketInvoiceItem
 from onegov.ticket.models.ticket import Ticket
+from onegov.ticket.models.ticket_counter import TicketCounter
 from onegov.ticket.models.ticket_permission import TicketPermission
 
 
 __all__ = (
     'Ticket',
+    'TicketCounter',
     'TicketInvoice',
     'TicketInvoiceItem',
     'TicketPermission',
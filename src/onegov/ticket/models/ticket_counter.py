@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from onegov.core.orm import Base
+from onegov.ticket.models.ticket import Ticket
+from sqlalchemy import delete, event, func, insert, inspect, select, text
+from sqlalchemy.orm import mapped_column, Mapped
+
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.orm import Mapper, Session
+
+
+class TicketCounter(Base):
+    """ Keeps track of the number of tickets per handler, group and state.
+
+    Whenever a ticket is added, removed or changes its state, handler or
+    group, a row with the resulting delta is appended inside the same
+    transaction. The counters are the sum of those deltas, which allows us
+    to count the tickets without having to scan the whole tickets table.
+
+    The deltas are only ever inserted, never updated, so concurrent
+    transactions do not compete for the same rows. They are compacted
+    periodically, which also fixes up the counters after bulk updates and
+    deletes, which bypass them. See :meth:`reconcile`.
+
+    """
+
+    __tablename__ = 'ticket_counters'
+
+    #: the internal id of the delta
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+    #: the handler code of the counted tickets
+    handler_code: Mapped[str]
+
+    #: the group of the counted tickets
+    group: Mapped[str]
+
+    #: the state of the counted tickets
+    state: Mapped[str]
+
+    #: the change in the number of tickets
+    count: Mapped[int] = mapped_column(default=0)
+
+    @classmethod
+    def change(
+        cls,
+        connection: Connection,
+        handler_code: str,
+        group: str,
+        state: str,
+        delta: int
+    ) -> None:
+        """ Records the given delta for the given counter. """
+
+        connection.execute(insert(cls).values(
+            handler_code=handler_code,
+            group=group,
+            state=state,
+            count=delta
+        ))
+
+    @classmethod
+    def reconcile(cls, session: Session) -> None:
+        """ Recounts all the tickets and replaces the accumulated deltas
+        with a single row per counter.
+
+        """
+
+        # block concurrent counter updates until we're done, so we don't
+        # lose any of the changes which happen while we recount
+        session.execute(text(
+            'LOCK TABLE ticket_counters IN EXCLUSIVE MODE'
+        ))
+        session.execute(delete(cls.__table__))
+        session.execute(insert(cls).from_select(
+            ('handler_code', 'group', 'state', 'count'),
+            select(
+                Ticket.handler_code,
+                Ticket.group,
+                Ticket.state,
+                func.count(Ticket.id)
+            ).group_by(Ticket.handler_code, Ticket.group, Ticket.state)
+        ))
+
+
+def counted_values(ticket: Ticket) -> tuple[str, str, str]:
+    return ticket.handler_code, ticket.group, ticket.state
+
+
+@event.listens_for(Ticket, 'after_insert', propagate=True)
+def count_inserted_ticket(
+    mapper: Mapper[Ticket],
+    connection: Connection,
+    ticket: Ticket
+) -> None:
+    TicketCounter.change(connection, *counted_values(ticket), delta=1)
+
+
+@event.listens_for(Ticket, 'after_update', propagate=True)
+def count_updated_ticket(
+    mapper: Mapper[Ticket],
+    connection: Connection,
+    ticket: Ticket
+) -> None:
+    state = inspect(ticket)
+    current = counted_values(ticket)
+    previous = tuple(
+        history.deleted[0] if history.deleted else value
+        for value, history in zip(current, (
+            state.attrs.handler_code.history,
+            state.attrs.group.history,
+            state.attrs.state.history
+        ), strict=True)
+    )
+
+    if previous != current:
+        TicketCounter.change(connection, *previous, delta=-1)
+        TicketCounter.change(connection, *current, delta=1)
+
+
+@event.listens_for(Ticket, 'after_delete', propagate=True)
+def count_deleted_ticket(
+    mapper: Mapper[Ticket],
+    connection: Connection,
+    ticket: Ticket
+) -> None:
+    TicketCounter.change(connection, *counted_values(ticket), delta=-1)
@@ -9,7 +9,7 @@ from decimal import Decimal
 from onegov.core.orm.types import JSON, UTCDateTime
 from onegov.core.upgrade import upgrade_task
 from onegov.pay import PaymentProvider
-from onegov.ticket import Ticket, TicketInvoice
+from onegov.ticket import Ticket, TicketCounter, TicketInvoice
 from sqlalchemy import Boolean, Column, Enum, ForeignKey, Integer, Numeric
 from sqlalchemy import String, Text, UUID
 from sqlalchemy import column, text, update, func, and_, true, false
@@ -466,3 +466,11 @@ def add_customer_message_ids_to_ticket(context: UpgradeContext) -> None:
     context.operations.add_column(
         'tickets', Column('customer_message_ids', ARRAY(String), nullable=True)
     )
+
+
+@upgrade_task('Populate ticket counters')
+def populate_ticket_counters(context: UpgradeContext) -> None:
+    if not context.has_table('tickets'):
+        return
+
+    TicketCounter.reconcile(context.session)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from asyncio import gather, sleep
+from json import dumps, loads
+from redis.asyncio import from_url
+from redis.exceptions import ConnectionError
+from uuid import uuid4
+
+from onegov.websockets import log
+
+
+from typing import Any, TYPE_CHECKING
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from onegov.core.types import JSONObject
+    from types import TracebackType
+    from typing import Self
+
+
+class Backplane:
+    """ Relays messages between multiple websocket server processes using
+    Redis pub/sub.
+
+    Each server only knows about the clients connected to itself. Whatever
+    a server delivers to its own clients it also publishes through the
+    backplane, the other servers then deliver it to their own clients.
+
+    Additionally, each server periodically stores the number of its
+    connections in Redis, so the status of all servers can be reported.
+
+    """
+
+    #: the interval in seconds in which the metrics are reported
+    heartbeat = 10
+
+    def __init__(self, url: str, prefix: str = 'onegov-websockets'):
+        self.redis = from_url(url, decode_responses=True)
+        self.prefix = prefix
+        self.channel = f'{prefix}:messages'
+        self.node = uuid4().hex
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None
+    ) -> None:
+        await self.redis.delete(self.metrics_key(self.node))
+        await self.redis.aclose()
+
+    def metrics_key(self, node: str) -> str:
+        return f'{self.prefix}:metrics:{node}'
+
+    async def publish(self, kind: str, **data: Any) -> None:
+        """ Publishes a message to all other servers. """
+
+        try:
+            await self.redis.publish(self.channel, dumps({
+                'node': self.node,
+                'kind': kind,
+                **data
+            }))
+        except ConnectionError:
+            log.exception(f'Unable to publish {kind} message')
+
+    async def listen(
+        self,
+        handler: Callable[[JSONObject], Awaitable[None]]
+    ) -> None:
+        """ Passes the messages published by the other servers to the given
+        handler. Reconnects if the connection to Redis is lost.
+
+        """
+
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    async for message in pubsub.listen():
+                        if message['type'] != 'message':
+                            continue
+
+                        payload = loads(message['data'])
+                        if payload.get('node') == self.node:
+                            continue
+
+                        try:
+                            await handler(payload)
+                        except Exception:
+                            log.exception('Unable to relay message')
+            except ConnectionError:
+                log.exception('Lost connection to backplane, reconnecting')
+                await sleep(1)
+
+    async def report(
+        self,
+        metrics: Callable[[], JSONObject]
+    ) -> None:
+        """ Periodically stores the metrics of this server. The metrics
+        expire if the server stops reporting them.
+
+        """
+
+        while True:
+            try:
+                await self.redis.set(
+                    self.metrics_key(self.node),
+                    dumps(metrics()),
+                    ex=self.heartbeat * 3
+                )
+            except ConnectionError:
+                log.exception('Unable to report metrics')
+            await sleep(self.heartbeat)
+
+    async def metrics(self) -> dict[str, JSONObject]:
+        """ Returns the last reported metrics of all servers by node. """
+
+        keys = [
+            key async for key in self.redis.scan_iter(
+                match=self.metrics_key('*')
+            )
+        ]
+        if not keys:
+            return {}
+
+        return {
+            key.rsplit(':', 1)[-1]: loads(value)
+            for key, value in zip(keys, await self.redis.mget(keys))
+            if value is not None
+        }
+
+    async def run(
+        self,
+        handler: Callable[[JSONObject], Awaitable[None]],
+        metrics: Callable[[], JSONObject]
+    ) -> None:
+        """ Listens for messages and reports metrics until cancelled. """
+
+        await gather(self.listen(handler), self.report(metrics))
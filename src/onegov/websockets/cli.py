@@ -40,6 +40,16 @@ cli = command_group()
 @click.option('--sentry-dsn')
 @click.option('--sentry-environment', default='testing')
 @click.option('--sentry-release')
+@click.option(
+    '--db-workers',
+    type=int,
+    default=4,
+    help='Number of threads used for database access'
+)
+@click.option(
+    '--redis-url',
+    help='Relay messages between multiple servers through this Redis'
+)
 @pass_group_context
 def serve(
     group_context: GroupContext,
@@ -48,7 +58,9 @@ def serve(
     token: str | None,
     sentry_dsn: str | None,
     sentry_environment: str | None,
-    sentry_release: str | None
+    sentry_release: str | None,
+    db_workers: int,
+    redis_url: str | None
 ) -> None:
     """ Starts the global websocket server.
 
@@ -56,6 +68,11 @@ def serve(
 
         onegov-websockets serve
 
+    To run multiple servers side by side, pass the same Redis URL to each
+    of them. Broadcasts and chat messages are then relayed between them.
+
+        onegov-websockets serve --redis-url redis://127.0.0.1:6379/0
+
     """
 
     if not all((host, port, token)) and group_context.config.applications:
@@ -77,7 +94,14 @@ def serve(
             environment=sentry_environment,
         )
 
-    run(main(host, port, token, group_context.config))
+    run(main(
+        host,
+        port,
+        token,
+        group_context.config,
+        db_workers,
+        redis_url
+    ))
 
 
 @cli.command('listen')
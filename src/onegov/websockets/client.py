@@ -13,6 +13,8 @@ if TYPE_CHECKING:
 
     class StatusMessage(TypedDict):
         connections: dict[str, int]
+        schemas: dict[str, dict[str, int]]
+        nodes: int
 
 
 async def acknowledged(websocket: ClientConnection) -> None:
@@ -1,39 +1,44 @@
 from __future__ import annotations
 
 import http
-from asyncio import Future
+import threading
+from asyncio import get_running_loop, to_thread, Future
+from concurrent.futures import ThreadPoolExecutor
 from cryptography.hazmat.primitives.hashes import SHA256
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from functools import cached_property, partial
 from http.cookies import SimpleCookie
 from json import dumps, loads
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 from urllib.parse import urlparse
 
 import transaction
 from itsdangerous import BadSignature, Signer
 from markupsafe import escape
+from sqlalchemy import cast, func, update
+from sqlalchemy.dialects.postgresql import JSONB
 from websockets.asyncio.server import broadcast, serve, ServerConnection
 from websockets.exceptions import ConnectionClosed, InvalidOrigin
 
-from onegov.chat.collections import ChatCollection
+from onegov.chat.models import Chat
 from onegov.chat.utils import param_from_path
 from onegov.core import cache
 from onegov.core.browser_session import BrowserSession
 from onegov.core.orm import Base, SessionManager
-from onegov.user import User, UserCollection
+from onegov.user import User
 from onegov.websockets import log
+from onegov.websockets.backplane import Backplane
 from onegov.websockets.security import (WebsocketSecurityError,
                                         consume_websocket_token)
 from uuid import UUID
+from zope.sqlalchemy import mark_changed
 
 if TYPE_CHECKING:
-    from collections.abc import Collection
+    from collections.abc import Callable, Collection
 
     from sqlalchemy.orm import Session
     from websockets import Request, Response
 
-    from onegov.chat.models import Chat
     from onegov.core.types import JSONObject, JSONObject_ro
     from onegov.server.config import Config
 
@@ -41,13 +46,285 @@ if TYPE_CHECKING:
 CONNECTIONS: dict[str, set[WebSocketServer]] = {}
 TOKEN = ''  # nosec: B105
 
-NOTFOUND = object()
-SESSIONS: dict[str, Session] = {}
 STAFF_CONNECTIONS: dict[str, set[WebSocketServer]] = {}
-STAFF: dict[str, dict[str, User]] = {}  # For Authentication of User
-ACTIVE_CHATS: dict[str, dict[UUID, Chat]] = {}  # For DB
+STAFF: dict[str, frozenset[str]] = {}  # For Authentication of User
+ACTIVE_CHATS: dict[str, dict[UUID, ChatState]] = {}  # For DB
 CHANNELS: dict[str, dict[str, set[WebSocketServer]]] = {}
 
+#: the schema of each key in CONNECTIONS, the keys may include a channel
+SCHEMA_CHANNELS: dict[str, str] = {}
+
+#: relays messages to the other server processes, if configured
+BACKPLANE: Backplane | None = None
+
+#: the session manager is bound to a single schema at a time, so we need to
+#: make sure that no other thread switches the schema while we create a
+#: session for our own
+SCHEMA_LOCK = threading.Lock()
+
+
+class ChatState(NamedTuple):
+    """ The parts of a chat needed by the server, detached from the session
+    they were loaded with, so they can be cached and passed between threads.
+
+    """
+    id: UUID
+    topic: str
+    user_id: UUID | None
+    active: bool
+
+
+def load_staff(session: Session) -> frozenset[str]:
+    """ Returns the usernames of all staff members. """
+    return frozenset(
+        username for username, in session.query(User.username).filter(
+            User.role.in_(['editor', 'admin'])
+        )
+    )
+
+
+def update_chat(
+    session: Session,
+    id: UUID | str,
+    **values: Any
+) -> tuple[ChatState, list[dict[str, Any]]] | None:
+    """ Updates the given chat with a single statement, without loading it
+    first. Returns the new state of the chat and its history, or None if the
+    chat doesn't exist.
+
+    """
+    table = Chat.__table__
+    row = session.execute(update(table).where(
+        table.c.id == id
+    ).values(**values).returning(
+        table.c.id,
+        table.c.topic,
+        table.c.user_id,
+        table.c.active,
+        table.c.chat_history
+    )).first()
+
+    if row is None:
+        return None
+
+    mark_changed(session)
+    *state, history = row
+    return ChatState(*state), history
+
+
+def load_chat(
+    session: Session,
+    id: UUID | str
+) -> tuple[ChatState, list[dict[str, Any]]] | None:
+    """ Returns the state of the given chat and its history. """
+    row = session.query(
+        Chat.id,
+        Chat.topic,
+        Chat.user_id,
+        Chat.active,
+        Chat.chat_history
+    ).filter(Chat.id == id).first()
+
+    if row is None:
+        return None
+
+    *state, history = row
+    return ChatState(*state), history
+
+
+def append_to_chat_history(
+    session: Session,
+    id: UUID | str,
+    content: JSONObject_ro
+) -> ChatState | None:
+    """ Appends the given message to the history of the given chat, without
+    having to load the whole history first.
+
+    """
+    table = Chat.__table__
+    entry = {
+        'userId': escape(content['userId']),
+        'user': escape(content['user']),
+        'text': escape(content['text']),
+        'time': escape(content['time']),
+    }
+    result = update_chat(
+        session,
+        id,
+        chat_history=func.coalesce(
+            table.c.chat_history,
+            cast([], JSONB)
+        ).op('||')(cast([entry], JSONB))
+    )
+    return result and result[0]
+
+
+def store_chat(schema: str, chat: ChatState) -> None:
+    """ Caches the given chat state if it's active. """
+    chats = ACTIVE_CHATS.setdefault(schema, {})
+    if chat.active:
+        chats[chat.id] = chat
+    else:
+        chats.pop(chat.id, None)
+
+
+def connection_metrics() -> JSONObject:
+    """ Returns the number of connections to this server. """
+
+    schemas: dict[str, dict[str, int]] = {}
+
+    def add(schema: str, key: str, count: int) -> None:
+        if count:
+            metrics = schemas.setdefault(
+                schema, {'listeners': 0, 'staff': 0, 'chats': 0}
+            )
+            metrics[key] += count
+
+    for schema_channel, connections in CONNECTIONS.items():
+        schema = SCHEMA_CHANNELS.get(schema_channel, schema_channel)
+        add(schema, 'listeners', len(connections))
+    for schema, connections in STAFF_CONNECTIONS.items():
+        add(schema, 'staff', len(connections))
+    for schema, channels in CHANNELS.items():
+        add(schema, 'chats', sum(1 for c in channels.values() if c))
+
+    return {
+        'connections': {
+            key: len(values)
+            for key, values in CONNECTIONS.items()
+            if values
+        },
+        'schemas': schemas  # type:ignore[dict-item]
+    }
+
+
+async def publish(kind: str, **data: Any) -> None:
+    """ Publishes a message to the other server processes, if there are
+    any.
+
+    """
+    if BACKPLANE is not None:
+        await BACKPLANE.publish(kind, **data)
+
+
+def deliver_broadcast(
+    schema_channel: str,
+    message: Any,
+    groupids: list[str] | None
+) -> int:
+    """ Delivers a broadcast to the clients connected to this server.
+
+    Returns the number of receivers.
+
+    """
+    connections = CONNECTIONS.get(schema_channel, set())
+    if isinstance(groupids, list):
+        connections = {
+            connection
+            for connection in connections
+            if connection.role == 'admin'
+            or not connection.groupids.isdisjoint(groupids)
+        }
+    if connections:
+        broadcast(
+            connections,
+            dumps({
+                'type': 'notification',
+                'message': message
+            })
+        )
+    return len(connections)
+
+
+async def deliver_chat_message(
+    connections: set[WebSocketServer],
+    message: str | bytes
+) -> None:
+    """ Delivers a chat message to the given connections of a channel,
+    removing the closed ones from it.
+
+    """
+    closed_connections = []
+
+    for client in connections:
+
+        try:
+            await client.send(dumps({
+                'type': 'notification',
+                'message': message,
+            }))
+        except ConnectionClosed as err:
+            log.error(
+                'Attempting to communicate with a closed'
+                'connection, removing client from channels.',
+                exc_info=err
+            )
+
+            closed_connections.append(client)
+
+    connections.difference_update(closed_connections)
+
+
+def notify_staff(
+    schema: str,
+    message: str,
+    exclude: WebSocketServer | None = None
+) -> None:
+    """ Sends a notification to the staff members connected to this
+    server.
+
+    """
+    connections = STAFF_CONNECTIONS.get(schema, set())
+    broadcast(
+        (c for c in connections if c is not exclude),
+        dumps({
+            'type': 'notification',
+            'message': message,
+        })
+    )
+
+
+async def relay(payload: JSONObject) -> None:
+    """ Delivers a message published by another server process to the
+    clients connected to this server.
+
+    """
+    kind = payload['kind']
+    schema = payload['schema']
+    assert isinstance(schema, str)
+
+    if kind == 'broadcast':
+        groupids = payload['groupids']
+        deliver_broadcast(
+            schema,
+            payload['message'],
+            groupids if isinstance(groupids, list) else None  # type:ignore
+        )
+    elif kind == 'chat':
+        channel = payload['channel']
+        message = payload['message']
+        assert isinstance(channel, str) and isinstance(message, str)
+        await deliver_chat_message(
+            CHANNELS.get(schema, {}).get(channel, set()),
+            message
+        )
+    elif kind == 'staff':
+        message = payload['message']
+        assert isinstance(message, str)
+        notify_staff(schema, message)
+    elif kind == 'chat-state':
+        state = payload['state']
+        assert isinstance(state, list)
+        id, topic, user_id, active = state
+        store_chat(schema, ChatState(
+            UUID(id),  # type:ignore[arg-type]
+            topic,  # type:ignore[arg-type]
+            UUID(user_id) if user_id else None,  # type:ignore[arg-type]
+            bool(active)
+        ))
+    else:
+        log.warning(f'Unknown message relayed: {kind}')
+
 
 class WebSocketServer(ServerConnection):
     """ A websocket server connection.
@@ -83,46 +360,80 @@ class WebSocketServer(ServerConnection):
         self.session_manager = session_manager
         self.host = host
 
-    def populate_staff(self) -> None:
+    def run_in_session[T](self, fn: Callable[[Session], T]) -> T:
+        """ Runs the given function with a session bound to the schema of
+        this connection and commits the transaction afterwards.
+
+        This blocks, use :meth:`run` from within the event loop.
+
         """
-        Populate staff users.
+        assert self.session_manager is not None
+
+        with SCHEMA_LOCK:
+            self.session_manager.set_current_schema(self.schema)
+            session = self.session_manager.session()
+
+        try:
+            result = fn(session)
+            transaction.commit()
+        except BaseException:
+            transaction.abort()
+            raise
+
+        return result
+
+    async def run[T](self, fn: Callable[[Session], T]) -> T:
+        """ Runs the given function in the database executor, so slow
+        queries don't block the other connections.
+
+        The executor threads each keep their own session per schema.
+
         """
-        STAFF[self.schema] = {
-            user.username: user for user in
-            (
-                UserCollection(self.session)
-                .query()
-                .filter(User.role.in_(['editor', 'admin']))
-            )
-        }
+        return await to_thread(self.run_in_session, fn)
 
-        transaction.commit()
+    async def populate_staff(self) -> None:
+        """
+        Populate staff users.
+        """
+        STAFF[self.schema] = await self.run(load_staff)
 
-    async def get_chat(self, id: UUID) -> Chat:
-        chat = ACTIVE_CHATS.setdefault(self.schema, {}).get(id, NOTFOUND)
+    async def get_chat(self, id: UUID) -> ChatState | None:
+        """ Returns the state of the given chat if it's active.
 
-        # Force (cached) session to fetch latest state of the database,
-        # otherwise new chats are not visible to this session.
-        self.session.expire_all()
-        transaction.commit()
+        Active chats are cached, the cache is refreshed whenever the chat
+        is changed through this server.
 
-        if chat is NOTFOUND:
-            chat = ChatCollection(self.session).by_id(id)
+        """
+        chats = ACTIVE_CHATS.setdefault(self.schema, {})
+        chat = chats.get(id)
 
+        if chat is None:
             log.debug(f'searching for chat with id {id}')
+            result = await self.run(partial(load_chat, id=id))
+            chat = result and result[0]
             log.debug(f'chat from collection {chat}')
 
-            if chat and not chat.active:
-                chat = None
+            if chat is None or not chat.active:
+                return None
 
-            ACTIVE_CHATS[self.schema][id] = chat  # type: ignore
+            store_chat(self.schema, chat)
+        return chat
 
-        transaction.commit()
-        return chat  # type: ignore
+    async def cache_chat(self, chat: ChatState | None) -> None:
+        """ Caches the given chat after it was changed through this server
+        and lets the other servers know about the change.
 
-    async def update_database(self) -> None:
-        self.session.flush()
-        transaction.commit()
+        """
+        if chat is None:
+            return
+
+        store_chat(self.schema, chat)
+        await publish('chat-state', schema=self.schema, state=[
+            chat.id.hex,
+            chat.topic,
+            chat.user_id and chat.user_id.hex,
+            chat.active
+        ])
 
     @cached_property
     def identity_secret(self) -> str:
@@ -150,17 +461,6 @@ class WebSocketServer(ServerConnection):
         except BadSignature:
             return None
 
-    @property
-    def session(self) -> Session:
-        assert self.session_manager is not None
-        self.session_manager.set_current_schema(self.schema)
-
-        session = self.session_manager.session()
-
-        ACTIVE_CHATS[self.schema] = {}
-
-        return session
-
     @cached_property
     def session_cache(self) -> cache.RedisCacheRegion:
         """ A cache that is kept for a long-ish time. """
@@ -270,6 +570,7 @@ async def handle_listen(
     log.debug(f'{websocket.id} listens @ {schema_channel}')
     connections = CONNECTIONS.setdefault(schema_channel, set())
     connections.add(websocket)
+    SCHEMA_CHANNELS[schema_channel] = schema
     try:
         await websocket.wait_closed()
     finally:
@@ -309,14 +610,32 @@ async def handle_status(
 
     await acknowledge(websocket)
 
+    metrics = connection_metrics()
+    if BACKPLANE is None:
+        nodes = {'local': metrics}
+    else:
+        # the metrics of this server are reported periodically, so we
+        # replace them with the current ones
+        nodes = await BACKPLANE.metrics()
+        nodes[BACKPLANE.node] = metrics
+
+    connections: dict[str, int] = {}
+    schemas: dict[str, dict[str, int]] = {}
+    for node in nodes.values():
+        for key, count in node['connections'].items():  # type:ignore
+            connections[key] = connections.get(key, 0) + count
+        for schema, values in node['schemas'].items():  # type:ignore
+            totals = schemas.setdefault(schema, {})
+            for key, count in values.items():
+                totals[key] = totals.get(key, 0) + count
+
     await websocket.send(
         dumps({
             'type': 'status',
             'message': {
-                'connections': {
-                    key: len(values)
-                    for key, values in CONNECTIONS.items()
-                }
+                'connections': connections,
+                'schemas': schemas,
+                'nodes': len(nodes)
             }
         })
     )
@@ -349,26 +668,23 @@ async def handle_broadcast(
     await acknowledge(websocket)
 
     schema_channel = f'{schema}-{channel}' if channel else schema
-    connections = CONNECTIONS.get(schema_channel, set())
-    if isinstance(groupids, list):
-        connections = {
-            connection
-            for connection in connections
-            if connection.role == 'admin'
-            or not connection.groupids.isdisjoint(groupids)
-        }
-    if connections:
-        broadcast(
-            connections,
-            dumps({
-                'type': 'notification',
-                'message': message
-            })
-        )
+    if not isinstance(groupids, list):
+        groupids = None
+    count = deliver_broadcast(
+        schema_channel,
+        message,
+        groupids  # type:ignore[arg-type]
+    )
+    await publish(
+        'broadcast',
+        schema=schema_channel,
+        message=message,
+        groupids=groupids
+    )
 
     log.debug(
         f'{websocket.id} sent {message}'
-        f' to {len(connections)} receiver(s) @ {schema_channel}'
+        f' to {count} local receiver(s) @ {schema_channel}'
     )
 
 
@@ -425,9 +741,8 @@ async def handle_customer_chat(
     )
 
     channel_connections.add(websocket)
-    staff_connections = STAFF_CONNECTIONS.setdefault(schema, set())
 
-    chat = await websocket.get_chat(channel.hex)
+    await websocket.get_chat(channel)
 
     log.debug(f'added {websocket.id} to channel-connections')
 
@@ -437,70 +752,48 @@ async def handle_customer_chat(
             log.debug(f'customer {websocket.id!r} got the message {message!r}')
 
             if loads(message)['type'] == 'message':
-                stored = ChatCollection(websocket.session).by_id(channel)
+                content = loads(message)
+                chat = await websocket.run(partial(
+                    append_to_chat_history,
+                    id=channel,
+                    content=content
+                ))
 
-                if not stored:
+                if not chat:
                     log.error(f'Unable to find stored chat with {channel=}')
                     continue
 
-                chat = stored
-                content = loads(message)
-
-                closed_connections = []
-
-                for client in channel_connections:
-
-                    try:
-                        await client.send(dumps({
-                            'type': 'notification',
-                            'message': message,
-                        }))
-                    except ConnectionClosed as err:
-                        log.error(
-                            'Attempting to communicate with a closed'
-                            'connection, removing client from channels.',
-                            exc_info=err
-                        )
+                await websocket.cache_chat(chat)
 
-                        closed_connections.append(client)
-
-                for connection in closed_connections:
-                    channel_connections.remove(connection)
+                await deliver_chat_message(channel_connections, message)
+                await publish(
+                    'chat',
+                    schema=schema,
+                    channel=channel.hex,
+                    message=message
+                )
 
-                # If customer is the only connection send chat request
+                # If customer is the only connection send chat request,
+                # staff members connected to other servers have accepted
+                # the chat if it has a user
                 if len(channel_connections) == 1 and not chat.user_id:
                     log.debug('only client in channel, sending request.')
-                    for client in staff_connections:
-                        await client.send(dumps({
-                            'type': 'notification',
-                            'message': dumps({
-                                'type': 'request',
-                                'text': content['text'],
-                                'userId': content['userId'],
-                                'user': content['user'],
-                                'topic': chat.topic,
-                                'channel': channel.hex
-                            })
-                        }))
-
-                chat_history = chat.chat_history.copy()
-
-                chat_history.append({
-                    'userId': escape(content['userId']),
-                    'user': escape(content['user']),
-                    'text': escape(content['text']),
-                    'time': escape(content['time']),
-                })
-                chat.chat_history = chat_history
-                await websocket.update_database()
+                    request = dumps({
+                        'type': 'request',
+                        'text': content['text'],
+                        'userId': content['userId'],
+                        'user': content['user'],
+                        'topic': chat.topic,
+                        'channel': channel.hex
+                    })
+                    notify_staff(schema, request)
+                    await publish('staff', schema=schema, message=request)
 
     except Exception as e:
         if not isinstance(e, ConnectionClosed):
             log.exception('The debugged error message is -', exc_info=e)
         channel_connections.remove(websocket)
         log.debug(f'removed {websocket.id} from channel-connections')
-    finally:
-        await websocket.update_database()
 
     return None
 
@@ -518,16 +811,16 @@ async def handle_staff_chat(
         await error(websocket, f'invalid schema: {schema}')
         return
 
-    _ = websocket.session
     await acknowledge(websocket)
 
-    if websocket.user_id in STAFF[schema]:
+    if websocket.user_id in STAFF.get(schema, ()):
         log.debug('User is in Database.')
 
         all_channels = CHANNELS.setdefault(schema, {})
         staff_connections = STAFF_CONNECTIONS.setdefault(schema, set())
         staff_connections.add(websocket)
         channel_connections: set[WebSocketServer] = set()
+        channel_key: str | None = None
         open_channel: UUID | None = None
 
         log.debug(f'added {websocket.id} to staff-connections')
@@ -545,26 +838,14 @@ async def handle_staff_chat(
                 log.debug(
                     f'current channel connections: {channel_connections}')
 
-                closed_connections = []
-
-                for client in channel_connections:
-
-                    try:
-                        await client.send(dumps({
-                            'type': 'notification',
-                            'message': message,
-                        }))
-                    except ConnectionClosed as err:
-                        log.error(
-                            'Attempting to communicate with a closed'
-                            'connection, removing client from channels.',
-                            exc_info=err
-                        )
-
-                        closed_connections.append(client)
-
-                for connection in closed_connections:
-                    channel_connections.remove(connection)
+                await deliver_chat_message(channel_connections, message)
+                if channel_key is not None:
+                    await publish(
+                        'chat',
+                        schema=schema,
+                        channel=channel_key,
+                        message=message
+                    )
 
                 # If the type is a message, save to DB
                 if content['type'] == 'message':
@@ -575,10 +856,11 @@ async def handle_staff_chat(
                         )
                         continue
 
-                    chat = (
-                        ChatCollection(websocket.session)
-                        .by_id(open_channel)
-                    )
+                    chat = await websocket.run(partial(
+                        append_to_chat_history,
+                        id=open_channel,
+                        content=content
+                    ))
 
                     if not chat:
                         log.error(
@@ -586,35 +868,29 @@ async def handle_staff_chat(
                         )
                         continue
 
+                    await websocket.cache_chat(chat)
                     log.debug(f'staff received message {content}')
 
-                    chat_history = chat.chat_history.copy()
-                    chat_history.append({
-                        'userId': escape(content['userId']),
-                        'user': escape(content['user']),
-                        'text': escape(content['text']),
-                        'time': escape(content['time']),
-                    })
-                    chat.chat_history = chat_history
-                    await websocket.update_database()
-
                 elif content['type'] == 'reconnect':
                     log.debug(f'reconnecting to channel {content["channel"]}')
+                    channel_key = content['channel']
                     channel_connections = all_channels.setdefault(
-                        content['channel'], set()
+                        channel_key, set()
                     )
                     channel_connections.add(websocket)
 
                 elif content['type'] == 'end-chat':
                     log.debug(f'ending chat with id {content["channel"]}')
                     try:
-                        chat = ChatCollection(websocket.session).by_id(
-                            UUID(content['channel'])
-                        )
+                        result = await websocket.run(partial(
+                            update_chat,
+                            id=UUID(content['channel']),
+                            active=False
+                        ))
                     except Exception:
-                        chat = None
+                        result = None
 
-                    if not chat:
+                    if not result:
                         log.error(
                             "Unable to find stored chat"
                             f"with {content['channel']=}"
@@ -622,8 +898,7 @@ async def handle_staff_chat(
 
                         continue
 
-                    chat.active = False
-                    await websocket.update_database()
+                    await websocket.cache_chat(result[0])
 
                 elif content['type'] == 'accepted':
                     log.debug('staff-member accepted-request')
@@ -635,35 +910,51 @@ async def handle_staff_chat(
                             f'Received malformed channel {raw_open_channel}'
                         )
                         continue
+                    channel_key = open_channel.hex
                     channel_connections = all_channels.setdefault(
-                        open_channel.hex, set()
+                        channel_key, set()
                     )
                     channel_connections.add(websocket)
 
-                    chat = ChatCollection(websocket.session).by_id(
-                        open_channel)
-                    if not chat:
+                    try:
+                        user_id: UUID | None = UUID(content['userId'])
+                    except Exception:
+                        user_id = None
+
+                    # assign the chat and fetch the history in one go
+                    if user_id is not None:
+                        result = await websocket.run(partial(
+                            update_chat,
+                            id=open_channel,
+                            user_id=user_id
+                        ))
+                    else:
+                        result = await websocket.run(partial(
+                            load_chat,
+                            id=open_channel
+                        ))
+
+                    if not result:
                         log.error(
                             'Unable to find stored chat'
                             f'with {open_channel=}'
                         )
                         continue
 
+                    chat, chat_history = result
+                    await websocket.cache_chat(chat)
+
                     # Tell everone else you've accepted
-                    for client in staff_connections:
-                        if client != websocket:
-                            inner = dumps({
-                                'type': 'hide-request',
-                                'channel': open_channel
-                            })
-                            await client.send(dumps({
-                                'type': 'notification',
-                                'message': inner,
-                            }))
+                    inner = dumps({
+                        'type': 'hide-request',
+                        'channel': channel_key
+                    })
+                    notify_staff(schema, inner, exclude=websocket)
+                    await publish('staff', schema=schema, message=inner)
 
                     inner = dumps({
                         'type': 'chat-history',
-                        'history': chat.chat_history,
+                        'history': chat_history,
                         'channel': open_channel
                     })
                     await websocket.send(dumps({
@@ -672,21 +963,20 @@ async def handle_staff_chat(
                     }))
                     log.debug('sent chat history')
 
-                    try:
-                        chat.user_id = UUID(content['userId'])
-                    except Exception:
+                    if user_id is None:
                         log.error(
                             f'Received invalid user id {content['userId']}'
                         )
                         continue
-                    await websocket.update_database()
 
                 elif content['type'] == 'request-chat-history':
                     open_channel = content['channel']
-                    chat = ChatCollection(websocket.session).by_id(
-                        open_channel)
+                    result = await websocket.run(partial(
+                        load_chat,
+                        id=open_channel
+                    ))
 
-                    if not chat:
+                    if not result:
                         log.error(
                             'Unable to find stored chat'
                             f'with {open_channel=}'
@@ -694,13 +984,16 @@ async def handle_staff_chat(
 
                         continue
 
+                    chat, chat_history = result
+
+                    channel_key = open_channel.hex
                     channel_connections = all_channels.setdefault(
-                        open_channel.hex, set())
+                        channel_key, set())
                     channel_connections.add(websocket)
                     log.debug('staff member reconnected')
                     inner = dumps({
                         'type': 'chat-history',
-                        'history': chat.chat_history,
+                        'history': chat_history,
                         'channel': open_channel
                     })
                     await websocket.send(dumps({
@@ -715,9 +1008,6 @@ async def handle_staff_chat(
                 staff_connections.remove(websocket)
             log.debug(f'removed {websocket.id} from staff-connections')
 
-        finally:
-            await websocket.update_database()
-
 
 async def handle_start(websocket: ServerConnection) -> None:
     assert isinstance(websocket, WebSocketServer)
@@ -739,7 +1029,7 @@ async def handle_start(websocket: ServerConnection) -> None:
     log.debug(f'{websocket.id} disconnected')
 
 
-def process_request(
+async def process_request(
     self: ServerConnection,
     request: Request
 ) -> Response | None:
@@ -821,20 +1111,29 @@ def process_request(
     except InvalidOrigin as err:
         log.debug('WebSocket connection will be rejected.', exc_info=err)
 
-    self.populate_staff()
+    await self.populate_staff()
 
     return None
 
 
 async def main(
     host: str, port: int, token: str,
-    config: Config | None = None
+    config: Config | None = None,
+    db_workers: int = 4,
+    redis_url: str | None = None
 ) -> None:
 
-    global TOKEN
+    global TOKEN, BACKPLANE
     TOKEN = token
     log.debug(f'Serving on ws://{host}:{port}')
 
+    # all database access happens in this executor, so it needs to be
+    # bounded to avoid exhausting the connection pool
+    get_running_loop().set_default_executor(ThreadPoolExecutor(
+        max_workers=db_workers,
+        thread_name_prefix='onegov-websockets'
+    ))
+
     if config:
         dsn = config.applications[0].configuration['dsn']
 
@@ -852,4 +1151,9 @@ async def main(
                      process_request=process_request,
                      create_connection=partial(WebSocketServer, config,  # type: ignore[arg-type]
                                                session_manager, host)):
-        await Future()
+        if redis_url is None:
+            await Future()
+        else:
+            log.debug(f'Relaying messages through {redis_url}')
+            async with Backplane(redis_url) as BACKPLANE:
+                await BACKPLANE.run(relay, connection_metrics)
@@ -100,7 +100,10 @@ def test_simple_match(
 
     # multiple runs lead to the same result
     for i in range(0, 2):
-        match(session, prebooking_period.id)
+        benchmark = match(session, prebooking_period.id)
+        assert benchmark.bookings == 2
+        assert benchmark.attendees == 2
+        assert benchmark.total >= 0
 
         bookings = collections.bookings.query().all()
 
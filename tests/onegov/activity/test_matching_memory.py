@@ -15,6 +15,7 @@ from onegov.activity.matching import PreferInAgeBracket
 from onegov.activity.matching import PreferMotivated
 from onegov.activity.matching import PreferOrganiserChildren
 from onegov.activity.matching import Scoring
+from onegov.activity.matching.core import AttendeeAgent
 from onegov.activity.matching.core import is_stable, OccasionAgent
 from onegov.activity.matching.utils import unblockable
 from onegov.core.utils import Bunch
@@ -776,6 +777,29 @@ def test_anti_affinity_groups() -> None:
     assert len(match(bookings, (foo, bar)).accepted) == 1
 
 
+def test_attendee_conflicts() -> None:
+    o1 = Occasion('1', [(today(), today() + days(1))])
+    o2 = Occasion('2', [(today(), today() + days(2))])
+    o3 = Occasion('3', [(today() + days(3), today() + days(4))])
+
+    b1 = o1.booking('Abed', 'open', 2)
+    b2 = o2.booking('Abed', 'open', 1)
+    b3 = o3.booking('Abed', 'open', 0)
+
+    attendee = AttendeeAgent(uuid4(), [b1, b2, b3])
+    assert attendee.conflicts == {b1: {b2}, b2: {b1}, b3: set()}
+
+    attendee.accept(b1)
+    assert attendee.blocked == {b2}
+    assert list(attendee.wishlist) == [b3]
+
+    attendee.accept(b3)
+    attendee.deny(b1)
+    assert attendee.accepted == {b3}
+    assert attendee.blocked == set()
+    assert set(attendee.wishlist) == {b1, b2}
+
+
 def test_limited_bookings_regression() -> None:
     """ When limiting attendees to a low limit of occasions, an error would
     result in attendees with lots of wishes not getting as many occasions
@@ -104,7 +104,7 @@ def test_view_api(client: Client, app: App) -> None:
     assert headers['Content-Type'] == 'application/vnd.collection+json'
     assert headers['X-RateLimit-Limit'] == '100'
     assert headers['X-RateLimit-Remaining'] == '99'
-    assert headers['X-RateLimit-Reset'] == 'Sun, 02 Feb 2020 20:35:00 GMT'
+    assert headers['X-RateLimit-Reset'] == 'Sun, 02 Feb 2020 20:20:09 GMT'
     assert response.json == {
         'collection': {
             'version': '1.0',
@@ -153,7 +153,7 @@ def test_view_api(client: Client, app: App) -> None:
     assert headers['Content-Type'] == 'application/vnd.collection+json'
     assert headers['X-RateLimit-Limit'] == '100'
     assert headers['X-RateLimit-Remaining'] == '98'
-    assert headers['X-RateLimit-Reset'] == 'Sun, 02 Feb 2020 20:35:00 GMT'
+    assert headers['X-RateLimit-Reset'] == 'Sun, 02 Feb 2020 20:20:18 GMT'
     assert response.json == {
         'collection': {
             'version': '1.0',
@@ -212,16 +212,21 @@ def test_view_api(client: Client, app: App) -> None:
         }
         assert Collection.from_json(response.body).version == '1.0'
 
-    # Rate Limit
+    # Rate Limit (a bucket of two requests, refilled every 7.5 minutes)
     app.rate_limit = (2, 900)
     with freeze_time('2020-02-02 20:20'):
+        response = client.get('/api/endpoint/1')
+        assert response.headers['X-RateLimit-Remaining'] == '1'
+        response = client.get('/api/endpoint/1')
+        assert response.headers['X-RateLimit-Remaining'] == '0'
         response = client.get('/api/endpoint/1', status=429)
     headers = response.headers
     assert headers['Content-Type'] == 'application/vnd.collection+json'
-    assert headers['Retry-After'] == 'Sun, 02 Feb 2020 20:35:00 GMT'
+    assert headers['Retry-After'] == 'Sun, 02 Feb 2020 20:27:30 GMT'
     assert headers['X-RateLimit-Limit'] == '2'
     assert headers['X-RateLimit-Remaining'] == '0'
     assert headers['X-RateLimit-Reset'] == 'Sun, 02 Feb 2020 20:35:00 GMT'
+    assert app.rate_limiter.blocked()['api'] >= 1
 
     with freeze_time('2020-02-02 20:36'):
         response = client.get('/api/endpoint/1')
@@ -229,7 +234,7 @@ def test_view_api(client: Client, app: App) -> None:
     assert headers['Content-Type'] == 'application/vnd.collection+json'
     assert headers['X-RateLimit-Limit'] == '2'
     assert headers['X-RateLimit-Remaining'] == '1'
-    assert headers['X-RateLimit-Reset'] == 'Sun, 02 Feb 2020 20:51:00 GMT'
+    assert headers['X-RateLimit-Reset'] == 'Sun, 02 Feb 2020 20:43:30 GMT'
     app.rate_limit = (100, 900)
 
     # Exceptions
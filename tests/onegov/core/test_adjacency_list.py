@@ -144,6 +144,71 @@ def test_page_by_path(session: Session) -> None:
     assert family.by_path('/news/jah-toast') is None
 
 
+def test_materialized_path(session: Session) -> None:
+    family = FamilyMemberCollection(session)
+
+    adam = family.add_root('Adam')
+    cain = family.add(parent=adam, title='Cain')
+    enoch = family.add(parent=cain, title='Enoch')
+    abel = family.add(parent=adam, title='Abel')
+
+    assert enoch.materialized_path == 'adam/cain/enoch'
+    assert enoch.root is adam
+    assert set(adam.descendants) == {cain, enoch, abel}
+    assert list(cain.descendants) == [enoch]
+
+    # renaming an item updates the paths of all its descendants
+    cain.name = 'kain'
+    assert cain.path == 'adam/kain'
+    session.flush()
+    assert cain.materialized_path == 'adam/kain'
+    assert enoch.materialized_path == 'adam/kain/enoch'
+    assert family.by_path('adam/kain/enoch') is enoch
+    assert family.by_path('adam/cain/enoch') is None
+
+    # as does moving it to another parent
+    cain.parent_id = abel.id
+    assert cain.path == 'adam/abel/kain'
+    session.flush()
+    session.expire_all()
+    assert enoch.path == 'adam/abel/kain/enoch'
+    assert list(enoch.ancestors) == [adam, abel, cain]
+    assert family.by_path('adam/abel/kain/enoch') is enoch
+
+
+def test_materialized_path_pending_ancestor(session: Session) -> None:
+    family = FamilyMemberCollection(session)
+
+    adam = family.add_root('Adam')
+    cain = family.add(parent=adam, title='Cain')
+    enoch = family.add(parent=cain, title='Enoch')
+    abel = family.add(parent=adam, title='Abel')
+    session.flush()
+
+    # the stored path of a descendant is outdated until the renamed
+    # ancestor is flushed
+    cain.name = 'kain'
+    assert enoch.materialized_path == 'adam/cain/enoch'
+    assert not enoch.has_stored_path
+    assert enoch.path == 'adam/kain/enoch'
+    assert list(enoch.ancestors) == [adam, cain]
+    assert enoch.root is adam
+
+    session.flush()
+    assert enoch.has_stored_path
+    assert enoch.path == 'adam/kain/enoch'
+
+    # the same goes for moved ancestors
+    cain.parent_id = abel.id
+    assert not enoch.has_stored_path
+    assert enoch.path == 'adam/abel/kain/enoch'
+
+    session.flush()
+    session.expire_all()
+    assert enoch.has_stored_path
+    assert enoch.path == 'adam/abel/kain/enoch'
+
+
 def test_delete(session: Session) -> None:
     family = FamilyMemberCollection(session)
 
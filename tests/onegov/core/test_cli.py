@@ -1,18 +1,21 @@
 from __future__ import annotations
 
+import click
 import json
 import os.path
 import pytest
 import transaction
 
 from click.testing import CliRunner
-from onegov.core.cli import cli, GroupContext
+from onegov.core.cli import cli, command_group, GroupContext
 from unittest.mock import patch, Mock
 
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from onegov.core import Framework
+    from onegov.core.request import CoreRequest
     from .conftest import SmtpApp, TestGroup
 
 
@@ -172,6 +175,39 @@ def test_create_command_default_selector(
         assert cli.called_request
 
 
+def test_parallel_jobs(cli_config: str) -> None:
+    group = command_group()
+
+    @group.command(context_settings={'default_selector': '*'})
+    def greet() -> Callable[[CoreRequest, Framework], None]:
+
+        def perform(request: CoreRequest, app: Framework) -> None:
+            if app.application_id == 'foobar/baz':
+                raise RuntimeError('Oh no')
+
+            click.echo(f'Hello {app.application_id}')
+
+        return perform
+
+    runner = CliRunner()
+    schemas = ['foobar-foo', 'foobar-bar', 'foobar-baz']
+
+    with patch.object(GroupContext, 'available_schemas', return_value=schemas):
+        result = runner.invoke(group, [
+            '--config', cli_config, '--jobs', '2', 'greet'
+        ])
+
+    assert result.exit_code == 1
+    assert 'Running 3 applications in 2 jobs' in result.output
+    assert 'Hello foobar/foo' in result.output
+    assert 'Hello foobar/bar' in result.output
+    assert 'Hello foobar/baz' not in result.output
+    assert 'RuntimeError: Oh no' in result.output
+    assert '/foobar/baz failed' in result.output
+    assert '1 of 3 applications failed' in result.output
+    assert '[3/3]' in result.output
+
+
 def test_sendmail(
     temporary_directory: str,
     maildir_app: Framework,
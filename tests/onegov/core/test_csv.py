@@ -6,10 +6,13 @@ from io import BytesIO
 from onegov.core import utils
 from onegov.core.csv import (
     CSVFile,
+    ExcelFile,
     convert_excel_to_csv,
     convert_list_of_dicts_to_csv,
+    convert_list_of_dicts_to_csv_file,
     convert_list_of_list_of_dicts_to_xlsx,
     convert_list_of_dicts_to_xlsx,
+    convert_list_of_dicts_to_xlsx_file,
     convert_xls_to_csv,
     convert_xlsx_to_csv,
     detect_encoding,
@@ -21,10 +24,16 @@ from onegov.core.csv import (
 from onegov.core.errors import (
     AmbiguousColumnsError,
     DuplicateColumnNamesError,
+    EmptyFileError,
     EmptyLineInFileError,
     MissingColumnsError,
 )
-from openpyxl import load_workbook
+from openpyxl import load_workbook, Workbook
+
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 
 def test_parse_header() -> None:
@@ -176,6 +185,54 @@ def test_convert_to_csv(excel_file: str) -> None:
         convert_excel_to_csv(f, '')
 
 
+@pytest.mark.parametrize("excel_file", [
+    utils.module_path('tests.onegov.core', 'fixtures/excel.xls'),
+    utils.module_path('tests.onegov.core', 'fixtures/excel.xlsx'),
+])
+def test_excel_file(excel_file: str) -> None:
+    with open(excel_file, 'rb') as f:
+        headers = ['ID', 'Namä', 'Date', 'Bool', 'Leer', 'Formel']
+        excel = ExcelFile(f, headers)
+
+        assert list(excel.headers.keys()) == headers
+        lines = list(excel.lines)
+        assert lines == list(CSVFile(convert_excel_to_csv(f), headers).lines)
+        assert lines[0] == excel.rowtype(
+            rownumber=2,
+            id='1',
+            nama='Döner',
+            date='2015-12-31T00:00:00',
+            bool='1',
+            leer='',
+            formel='2'
+        )
+
+        # the lines can be read more than once
+        assert list(excel.lines) == lines
+
+        # loaded lines are kept, the worksheet is not read again
+        excel = ExcelFile(f, headers)
+        assert excel.load() == tuple(lines)
+        excel.excelfile = BytesIO(b'')
+        assert list(excel.lines) == lines
+
+        with pytest.raises(NotImplementedError):
+            list(ExcelFile(f, sheet_name='Sheet 2').lines)
+        with pytest.raises(KeyError):
+            ExcelFile(f, sheet_name='Sheet 3')
+
+    with pytest.raises(IOError):
+        ExcelFile(BytesIO(b'abcd'))
+
+
+def test_excel_file_empty() -> None:
+    file = BytesIO()
+    Workbook().save(file)
+
+    with pytest.raises(EmptyFileError):
+        ExcelFile(file)
+
+
 def test_empty_line_csv_file() -> None:
     data = (
         b'Datum, Reale Temperatur, Gef\xfchlte Temperatur\n'
@@ -365,6 +422,59 @@ def test_convert_list_of_dicts_to_xlsx() -> None:
         assert rows[2][1].value == 'Rumsfeld'
 
 
+def test_convert_list_of_dicts_to_files() -> None:
+    def data() -> Iterator[dict[str, str]]:
+        yield {'first_name': 'Dick', 'last_name': 'Cheney'}
+        yield {'first_name': 'Donald', 'last_name': 'Rumsfeld'}
+        yield {'first_name': 'Condoleezza', 'title': 'Secretary of State'}
+
+    # the fields are taken from the sampled rows
+    with convert_list_of_dicts_to_csv_file(data(), sample_size=2) as f:
+        assert f.read().decode('utf-8').splitlines() == [
+            'first_name,last_name',
+            'Dick,Cheney',
+            'Donald,Rumsfeld',
+            'Condoleezza,'
+        ]
+
+    with convert_list_of_dicts_to_csv_file(data(), ('title', )) as f:
+        assert f.read().decode('utf-8').splitlines() == [
+            'title', '""', '""', 'Secretary of State'
+        ]
+
+    with convert_list_of_dicts_to_csv_file(iter(())) as f:
+        assert f.read() == b''
+
+    with convert_list_of_dicts_to_xlsx_file(data()) as f:
+        workbook = load_workbook(f)
+        assert workbook.active is not None
+        rows = tuple(workbook.active.values)
+
+        assert rows == (
+            ('first_name', 'last_name', 'title'),
+            ('Dick', 'Cheney', None),
+            ('Donald', 'Rumsfeld', None),
+            ('Condoleezza', None, 'Secretary of State'),
+        )
+
+    # lists are inspected completely, even beyond the sampled rows
+    rows = [{'id': str(ix)} for ix in range(1500)]
+    rows.append({'id': '1500', 'late': 'field'})
+
+    with convert_list_of_dicts_to_csv_file(rows) as f:
+        lines = f.read().decode('utf-8').splitlines()
+        assert lines[0] == 'id,late'
+        assert lines[1] == '0,'
+        assert lines[-1] == '1500,field'
+
+    with convert_list_of_dicts_to_xlsx_file(rows) as f:
+        workbook = load_workbook(f)
+        assert workbook.active is not None
+        values = tuple(workbook.active.values)
+        assert values[0] == ('id', 'late')
+        assert values[-1] == ('1500', 'field')
+
+
 def test_convert_irregular_list_of_dicts_to_csv() -> None:
     data = [
         {
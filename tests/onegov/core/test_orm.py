@@ -36,7 +36,7 @@ from psycopg.errors import FeatureNotSupported
 from pytz import timezone
 from sedate import utcnow
 from sqlalchemy import (
-    and_, func, inspect, select, text, ForeignKey, Integer
+    and_, func, inspect, select, text, update, ForeignKey, Integer
 )
 from sqlalchemy.exc import NotSupportedError, OperationalError
 from sqlalchemy.ext.mutable import MutableDict
@@ -1816,6 +1816,101 @@ def test_orm_cache_flush(postgres_dsn: str, redis_url: str) -> None:
     assert app.foo.title == 'Sup'
 
 
+def test_orm_cache_column_policy(postgres_dsn: str, redis_url: str) -> None:
+    class Base(DeclarativeBase, ModelBase):
+        registry = registry()
+
+    class Document(Base):
+        __tablename__ = 'documents'
+
+        id: Mapped[int] = mapped_column(primary_key=True)
+        title: Mapped[str | None]
+        body: Mapped[str | None]
+
+    class App(Framework):
+
+        @orm_cached(policy='on-column-change:documents:title')
+        def titles(self) -> list[str | None]:
+            return [t for t, in self.session().query(Document.title)]
+
+        @orm_cached(policy='on-table-change:documents')
+        def count(self) -> int:
+            return self.session().query(Document).count()
+
+    scan_morepath_modules(App)
+
+    app = App()
+    app.namespace = 'foo'
+    app.configure_application(
+        dsn=postgres_dsn,
+        base=Base,
+        redis_url=redis_url
+    )
+    # remove ORMBase
+    app.session_manager.bases.pop()
+    app.set_application_id('foo/bar')
+    app.clear_request_cache()
+
+    titles_ts = 'test_orm_cache_column_policy.<locals>.App.titles_ts'
+    count_ts = 'test_orm_cache_column_policy.<locals>.App.count_ts'
+
+    # inserts always evict the cache
+    assert app.titles == []
+    assert app.count == 0
+    app.session().add(Document(id=1, title='Foo', body='Lorem'))
+    transaction.commit()
+    assert app.cache.get(titles_ts) is NO_VALUE
+    assert app.cache.get(count_ts) is NO_VALUE
+
+    app.clear_request_cache()
+    assert app.titles == ['Foo']
+    assert app.count == 1
+
+    # the timestamps of all known keys are fetched at once
+    ts = app.cache.get(titles_ts)
+    assert app.orm_cache_timestamps == {
+        titles_ts: ts,
+        count_ts: app.cache.get(count_ts)
+    }
+    app.clear_request_cache()
+    assert app.orm_cache_timestamps is None
+    assert app.titles == ['Foo']
+    assert app.orm_cache_timestamps == {
+        titles_ts: ts,
+        count_ts: app.cache.get(count_ts)
+    }
+
+    # changes to other columns don't evict the cache
+    app.session().query(Document).one().body = 'Ipsum'
+    transaction.commit()
+    assert app.cache.get(titles_ts) == ts
+    assert app.cache.get(count_ts) is NO_VALUE
+
+    # changes to the listed columns do
+    app.clear_request_cache()
+    app.session().query(Document).one().title = 'Bar'
+    transaction.commit()
+    assert app.cache.get(titles_ts) is NO_VALUE
+
+    app.clear_request_cache()
+    assert app.titles == ['Bar']
+
+    # bulk updates are always considered a change
+    app.session().execute(update(Document).values(body='Dolor'))
+    transaction.commit()
+    assert app.cache.get(titles_ts) is NO_VALUE
+
+    # as are deletes
+    app.clear_request_cache()
+    assert app.titles == ['Bar']
+    app.session().query(Document).delete()
+    transaction.commit()
+    assert app.cache.get(titles_ts) is NO_VALUE
+
+    app.clear_request_cache()
+    assert app.titles == []
+
+
 def test_request_cache(postgres_dsn: str, redis_url: str) -> None:
     class Base(DeclarativeBase, ModelBase):
         registry = registry()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from freezegun import freeze_time
+from onegov.core import rate_limit
+from onegov.core.rate_limit import RateLimit, RateLimitRule
+
+
+def test_rate_limit_rule() -> None:
+    rule = RateLimitRule('search', '/search(/.*)?', RateLimit(10, 60))
+    assert rule.matches('/search')
+    assert rule.matches('/search/suggest')
+    assert not rule.matches('/searching')
+    assert not rule.matches('/topics/search')
+
+
+def test_rate_limiter(redis_url: str) -> None:
+    limiter = rate_limit.get(namespace='ns', redis_url=redis_url)
+    limit = RateLimit(2, 60)
+
+    with freeze_time('2024-01-01 12:00:00'):
+        result = limiter.hit('test', 'ip:1', limit)
+        assert result.allowed
+        assert result.remaining == 1
+        assert result.headers == {
+            'X-RateLimit-Limit': '2',
+            'X-RateLimit-Remaining': '1',
+            'X-RateLimit-Reset': 'Mon, 01 Jan 2024 12:00:30 GMT'
+        }
+
+        assert limiter.hit('test', 'ip:1', limit).allowed
+        result = limiter.hit('test', 'ip:1', limit)
+        assert not result.allowed
+        assert result.remaining == 0
+        assert result.headers['Retry-After'] == 'Mon, 01 Jan 2024 12:00:30 GMT'
+
+        # other clients and rules have their own buckets
+        assert limiter.hit('test', 'ip:2', limit).allowed
+        assert limiter.hit('other', 'ip:1', limit).allowed
+
+    # the bucket is refilled continuously
+    with freeze_time('2024-01-01 12:00:30'):
+        assert limiter.hit('test', 'ip:1', limit).allowed
+        assert not limiter.hit('test', 'ip:1', limit).allowed
+
+    assert limiter.blocked() == {'test': 2}
+    limiter.reset_blocked()
+    assert limiter.blocked() == {}
@@ -206,6 +206,53 @@ def test_link_with_query_parameters_and_fragment(
     )
 
 
+def test_link_cache(redis_url: str) -> None:
+
+    class App(Framework):
+        pass
+
+    @App.path(path='/items/{id}', converters={'tags': [str]})
+    class Item:
+        def __init__(self, id: Any, tags: list[str] | None = None) -> None:
+            self.id = id
+            self.tags = tags
+
+    @App.view(model=Item)
+    def view_item(self: Item, request: CoreRequest) -> str:
+        return '\n'.join((
+            request.link(self),
+            request.link(Item(2), 'edit'),
+            request.class_link(Item, {'id': 2, 'tags': None}, 'edit'),
+            request.link(Item(3, ['a', 'b'])),
+        ))
+
+    App.commit()
+
+    app = App()
+    app.namespace = 'test'
+    app.configure_application(identity_secure=False, redis_url=redis_url)
+    app.set_application_id('test/test')
+
+    client = Client(app)
+    assert client.get('/items/1').text == (
+        'http://localhost/items/1\n'
+        'http://localhost/items/2/edit\n'
+        'http://localhost/items/2/edit\n'
+        'http://localhost/items/3?tags=a&tags=b'
+    )
+
+    # lists (like the decoded tags of the viewed item) are not cached,
+    # the class link shares the entry of the second link
+    info = app.class_path_url.cache_info()  # type: ignore[attr-defined]
+    assert info.currsize == 1
+    assert info.hits == 1
+
+    client.get('/items/1')
+    info = app.class_path_url.cache_info()  # type: ignore[attr-defined]
+    assert info.currsize == 1
+    assert info.hits == 3
+
+
 def test_has_permission(redis_url: str) -> None:
 
     class App(Framework):
@@ -292,6 +339,84 @@ def test_has_permission(redis_url: str) -> None:
     assert c.get('/?permission=secret').text == 'true'
 
 
+def test_exclude_invisible(redis_url: str) -> None:
+
+    class App(Framework):
+        pass
+
+    @App.path(path='/')
+    class Root:
+        pass
+
+    class Document:
+        def __init__(
+            self,
+            name: str,
+            access: str = 'public',
+            published: bool = True
+        ) -> None:
+            self.name = name
+            self.access = access
+            self.published = published
+
+    class Special(Document):
+        pass
+
+    @App.permission_rule(model=Special, permission=object, identity=None)
+    def has_permission_special(
+        identity: None,
+        model: Special,
+        permission: object
+    ) -> bool:
+        return model.name == 'visible'
+
+    @App.view(model=Root, permission=Public)
+    def view(self: Root, request: CoreRequest) -> str:
+        models = [
+            Document('a'),
+            Document('b', access='private'),
+            Document('c', access='secret'),
+            Document('d', published=False),
+            Document('e'),
+            Special('visible', access='private'),
+            Special('hidden'),
+        ]
+        assert request.has_generic_visibility(Document)
+        assert request.has_generic_visibility(Special) is (
+            request.is_logged_in)
+
+        return ','.join(m.name for m in request.exclude_invisible(models))
+
+    @App.view(model=Root, permission=Public, name='login')
+    def login(self: Root, request: CoreRequest) -> str:
+
+        @request.after
+        def remember_identity(response: Response) -> None:
+            request.app.remember_identity(response, request, morepath.Identity(
+                uid='1',
+                userid='foo',
+                groupids=frozenset(),
+                role='admin',
+                application_id=request.app.application_id
+            ))
+
+        return 'ok'
+
+    scan_morepath_modules(App)
+    App.commit()
+
+    app = App()
+    app.namespace = 'test'
+    app.configure_application(identity_secure=False, redis_url=redis_url)
+    app.set_application_id('test/test')
+
+    c = Client(app)
+    assert c.get('/').text == 'a,e,visible'
+
+    c.get('/login')
+    assert c.get('/').text == 'a,b,c,d,e,visible,hidden'
+
+
 def test_permission_by_view(redis_url: str) -> None:
     class App(Framework):
         pass
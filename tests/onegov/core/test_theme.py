@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import morepath
+import pytest
 
+from fs.memoryfs import MemoryFS
+from onegov.core import cache
 from onegov.core.framework import Framework
-from onegov.core.theme import get_filename
+from onegov.core.theme import compile as compile_theme, get_filename
 from webtest import TestApp as Client
 
 
@@ -93,3 +96,49 @@ def test_theme_application(temporary_directory: str, redis_url: str) -> None:
 
     new_theme_url = client.get('/').text
     assert theme_url != new_theme_url
+
+
+def test_compile_with_lock(
+    redis_url: str,
+    monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage = MemoryFS()
+    theme_cache = cache.get('theme-test', 60, redis_url)
+    theme = MockTheme('test', '1.0', 'body {{ background: {color} }}')
+
+    red = compile_theme(storage, theme, {'color': 'red'},
+                        cache=theme_cache, application_id='tests/foo')
+    assert storage.readtext(red) == 'body { background: red }'
+    assert theme_cache.get('tests/foo') == red
+
+    # while another process compiles the theme, the previous one is used
+    blue_filename = get_filename(theme, {'color': 'blue'})
+    lock = theme_cache.lock(f'compile:{blue_filename}', timeout=60)
+    assert lock.acquire(blocking=False)
+
+    blue = compile_theme(storage, theme, {'color': 'blue'},
+                         cache=theme_cache, application_id='tests/foo')
+    assert blue == red
+    assert not storage.exists(blue_filename)
+
+    lock.release()
+
+    blue = compile_theme(storage, theme, {'color': 'blue'},
+                         cache=theme_cache, application_id='tests/foo')
+    assert blue == blue_filename
+    assert storage.readtext(blue) == 'body { background: blue }'
+    assert theme_cache.get('tests/foo') == blue
+
+    # without a previous theme, we only wait a bit for the other process
+    monkeypatch.setattr('onegov.core.theme.COMPILE_WAIT_TIMEOUT', 0.1)
+    green_filename = get_filename(theme, {'color': 'green'})
+    lock = theme_cache.lock(f'compile:{green_filename}', timeout=60)
+    assert lock.acquire(blocking=False)
+
+    green = compile_theme(storage, theme, {'color': 'green'},
+                          cache=theme_cache, application_id='tests/bar')
+    assert green == green_filename
+    assert storage.readtext(green) == 'body { background: green }'
+    assert theme_cache.get('tests/bar') == green
+
+    lock.release()
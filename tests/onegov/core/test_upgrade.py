@@ -3,11 +3,14 @@ from __future__ import annotations
 import os.path
 import pytest
 import textwrap
+import transaction
 
 from click.testing import CliRunner
 from onegov.core.cli import cli
 from onegov.core.upgrade import get_tasks, upgrade_task, get_module_order_key
-from unittest.mock import patch
+from onegov.core.upgrade import CatalogInvalidatingOperations, SchemaCatalog
+from sqlalchemy import text
+from unittest.mock import patch, Mock
 
 
 from typing import TYPE_CHECKING
@@ -398,3 +401,40 @@ def test_get_module_order_key() -> None:
         'onegov.user:foo',
         'onegov.agency:bar',
     ]
+
+
+def test_schema_catalog(session_manager: SessionManager) -> None:
+    session_manager.set_current_schema('foo-bar')
+    session = session_manager.session()
+    session.execute(text("CREATE TYPE mood AS ENUM ('happy', 'sad')"))
+    session.execute(text(
+        'CREATE TABLE people (id integer PRIMARY KEY, mood mood)'))
+    session.execute(text('CREATE VIEW moods AS SELECT mood FROM people'))
+
+    catalog = SchemaCatalog.load(session.connection(), 'foo-bar')
+    assert {'people', 'upgrades'} <= catalog.tables
+    assert 'moods' not in catalog.tables
+    assert catalog.columns['people'] == {'id', 'mood'}
+    assert catalog.columns['moods'] == {'mood'}
+    assert ('people', 'people_pkey', 'PRIMARY KEY') in catalog.constraints
+    assert 'mood' in catalog.types
+    assert catalog.enums == {'mood': {'happy', 'sad'}}
+
+    # other schemas are not included
+    session_manager.ensure_schema_exists('foo-fah')
+    catalog = SchemaCatalog.load(session.connection(), 'foo-fah')
+    assert 'people' not in catalog.tables
+    assert catalog.enums == {}
+
+    transaction.abort()
+
+
+def test_catalog_invalidating_operations() -> None:
+    operations = Mock()
+    context = Mock()
+    wrapped = CatalogInvalidatingOperations(operations, context)
+    assert not context.invalidate_catalog.called
+
+    wrapped.add_column('people', 'name')
+    operations.add_column.assert_called_once_with('people', 'name')
+    assert context.invalidate_catalog.called
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import transaction
+
+from decimal import Decimal
 from markupsafe import Markup
 from sedate import utcnow
 from datetime import date, timedelta
 from freezegun import freeze_time
 from uuid import uuid4
 
+from onegov.activity import Booking, BookingPeriodInvoiceCollection
 from onegov.core.utils import Bunch
+from onegov.feriennet.collections import BillingCollection
 from onegov.feriennet.models.notification_template import TemplateVariables
 
 from typing import Any, TYPE_CHECKING
@@ -155,3 +160,69 @@ def test_add_vacation_activity(scenario: Scenario) -> None:
     assert activity.organizer_name == 'Max'
     assert activity.organization_text == 'Donut Lovers Inc. 12345 Donut City'
     assert activity.organizer_details_text == 'Max 079 123 4567'
+
+
+def test_create_invoices_incrementally(scenario: Scenario) -> None:
+    scenario.add_period(confirmed=True, all_inclusive=False)
+    scenario.add_user(username='member@example.org', role='member')
+    scenario.add_attendee(name='George', username='member@example.org')
+    scenario.add_activity(title='Foobar', state='accepted')
+    scenario.add_occasion()
+    scenario.add_booking(state='accepted', cost=100)
+    scenario.add_user(username='other@example.org', role='member')
+    scenario.add_attendee(name='Ringo', username='other@example.org')
+    scenario.add_booking(state='accepted', cost=50)
+    scenario.commit()
+    scenario.refresh()
+
+    session = scenario.session
+    period = scenario.latest_period
+    assert period is not None
+
+    def invoice_collection(**kwargs: Any) -> BookingPeriodInvoiceCollection:
+        return BookingPeriodInvoiceCollection(session, **kwargs)
+
+    billing = BillingCollection(request=Bunch(  # type: ignore[arg-type]
+        session=session,
+        app=Bunch(invoice_collection=invoice_collection)
+    ), period=period)
+    invoices = BookingPeriodInvoiceCollection(session, period_id=period.id)
+
+    def invoice_ids() -> dict[str, Any]:
+        return {i.user.username: i.id for i in invoices.query()}
+
+    billing.create_invoices()
+    transaction.commit()
+
+    before = invoice_ids()
+    assert len(before) == 2
+    assert invoices.total_amount == Decimal('150.00')
+
+    # unchanged bookings leave the invoices alone
+    billing.create_invoices()
+    transaction.commit()
+    assert invoice_ids() == before
+
+    # changed bookings only replace the invoices of the affected users
+    booking = session.query(Booking).filter_by(
+        username='member@example.org').one()
+    booking.cost = Decimal('200.00')
+    transaction.commit()
+
+    billing.create_invoices()
+    transaction.commit()
+
+    after = invoice_ids()
+    assert after['member@example.org'] != before['member@example.org']
+    assert after['other@example.org'] == before['other@example.org']
+    assert invoices.total_amount == Decimal('250.00')
+
+    # cancelled bookings remove the invoice
+    booking = session.query(Booking).filter_by(
+        username='other@example.org').one()
+    booking.state = 'cancelled'
+    transaction.commit()
+
+    billing.create_invoices()
+    transaction.commit()
+    assert invoice_ids().keys() == {'member@example.org'}
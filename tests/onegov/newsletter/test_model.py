@@ -121,3 +121,37 @@ def test_newsletter_recipients_cascade(session: Session) -> None:
     newsletter = session.query(Newsletter).one()
     assert len(newsletter.recipients) == 0
     assert session.query(newsletter_recipients).count() == 0
+
+
+def test_recipients_subscribed_to_any(session: Session) -> None:
+    session.add_all([
+        Recipient(address='news@example.org', subscribed_categories=['News']),
+        Recipient(
+            address='sport@example.org',
+            subscribed_categories=['Sport', 'Kultur']
+        ),
+        Recipient(address='legacy@example.org', subscribed_categories=None),
+        Recipient(address='empty@example.org', subscribed_categories=[]),
+    ])
+    session.flush()
+
+    def addresses(*categories: str, include_unselected: bool) -> set[str]:
+        return {
+            address for address, in session.query(Recipient.address).filter(
+                Recipient.subscribed_to_any(categories, include_unselected)
+            )
+        }
+
+    assert addresses('News', include_unselected=False) == {
+        'news@example.org'
+    }
+    assert addresses('Kultur', 'News', include_unselected=False) == {
+        'news@example.org', 'sport@example.org'
+    }
+    assert addresses('Sport', include_unselected=True) == {
+        'sport@example.org', 'legacy@example.org', 'empty@example.org'
+    }
+    assert addresses(include_unselected=True) == {
+        'legacy@example.org', 'empty@example.org'
+    }
+    assert addresses(include_unselected=False) == set()
@@ -708,3 +708,95 @@ def test_api_directory_content_hash(client: Client) -> None:
     items = api_items(client, '/api/clubs')
     item_data = api_item_data(items[0])
     assert item_data['content_hash'] != first_hash
+
+
+def test_api_forms_paginate_by_cursor(client: Client) -> None:
+    session = client.app.session()
+    forms = FormCollection(session)
+
+    for ix in range(100):
+        form = forms.definitions.add(
+            f'API Form {ix:02d}',
+            parsed=ParsedForm.from_formcode('E-Mail *= @@@'),
+            type='custom',
+        )
+        form.access = 'public'  # type:ignore[attr-defined]
+
+    hidden_form = forms.definitions.add(
+        'API Form Hidden',
+        parsed=ParsedForm.from_formcode('E-Mail *= @@@'),
+        name='hidden',
+        type='custom',
+    )
+    hidden_form.access = 'private'  # type:ignore[attr-defined]
+
+    session.add(ExternalFormLink(
+        title='API External Form',
+        url='https://example.org/forms/public',
+        group='API',
+    ))
+    transaction.commit()
+
+    titles = []
+    url: str | None = '/api/forms?cursor='
+    while url:
+        collection = client.get(url).json['collection']
+        assert not collection['items'] or len(collection['items']) <= 100
+        titles.extend(
+            api_item_data(item)['title'] for item in collection['items']
+        )
+        links = {link['rel']: link['href'] for link in collection['links']}
+        assert links['prev'] is None
+        url = links['next']
+        assert url is None or 'cursor=' in url
+
+    relevant = [title for title in titles if title.startswith('API ')]
+    assert len(titles) == len(set(titles))
+    assert len(relevant) == 101
+    assert 'API External Form' in relevant
+    assert 'API Form Hidden' not in relevant
+
+    client.get('/api/forms?cursor=x.y', status=400)
+
+
+def test_api_conditional_requests(client: Client) -> None:
+    session = client.app.session()
+    session.add(Person(first_name='Hans', last_name='Muster'))
+    transaction.commit()
+
+    response = client.get('/api/people')
+    etag = response.headers['ETag']
+    assert etag.startswith('W/"')
+    assert 'Last-Modified' in response.headers
+
+    response = client.get(
+        '/api/people',
+        headers={'If-None-Match': etag},
+        status=304
+    )
+    assert not response.body
+
+    # other pages and filters have their own tags
+    response = client.get('/api/people?cursor=')
+    assert response.headers['ETag'] != etag
+
+    session = client.app.session()
+    session.query(Person).one().function = 'Mayor'
+    transaction.commit()
+
+    response = client.get('/api/people', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert api_item_data(response.json['collection']['items'][0])[
+        'function'] == 'Mayor'
+
+    # as do the settings of the organisation
+    etag = response.headers['ETag']
+    client.app.org.hidden_people_fields = ['function']
+    transaction.commit()
+
+    response = client.get('/api/people', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+    assert 'function' not in api_item_data(
+        response.json['collection']['items'][0])
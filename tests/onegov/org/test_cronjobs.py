@@ -1136,6 +1136,55 @@ def test_send_daily_reservation_reminders_only_enabled_resources(
     assert 'Disabled Room' not in body
 
 
+def test_process_resource_rules(client: Client[TestOrgApp]) -> None:
+    client.login_admin()
+
+    for title in ('Room', 'Other Room'):
+        page = client.get('/resources').click('Raum')
+        page.form['title'] = title
+        page.form.submit()
+
+    page = (
+        client.get('/resource/room')
+        .click('Verfügbarkeitszeiträume')
+        .click('Verfügbarkeitszeitraum')
+    )
+    page.form['title'] = 'Täglich'
+    page.form['extend'] = 'daily'
+    page.form['start'] = '2019-01-01'
+    page.form['end'] = '2019-01-02'
+    page.form['as_whole_day'] = 'yes'
+    page = page.form.submit().follow()
+    assert 'Verfügbarkeitszeitraum aktiv, 2 Verfügbarkeiten erstellt' in page
+
+    def count_allocations(name: str) -> int:
+        url = f'/resource/{name}/slots?start=2000-01-01&end=2050-01-31'
+        return len(client.get(url).json)
+
+    job = get_cronjob_by_name(client.app, 'process_resource_rules')
+    assert job is not None
+    job.app = client.app
+    url = get_cronjob_url(job)
+
+    with freeze_time('2019-01-02 22:00:00'):
+        client.get(url)
+
+    assert count_allocations('room') == 3
+    assert count_allocations('other-room') == 0
+
+    # running it again on the same day is harmless
+    with freeze_time('2019-01-02 23:00:00'):
+        client.get(url)
+
+    assert count_allocations('room') == 3
+
+    with freeze_time('2019-01-03 22:00:00'):
+        client.get(url)
+
+    assert count_allocations('room') == 4
+    assert count_allocations('other-room') == 0
+
+
 @pytest.mark.parametrize('secret_content_allowed', [False, True])
 def test_send_scheduled_newsletters(
     client: Client[TestOrgApp],
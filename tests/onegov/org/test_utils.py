@@ -123,6 +123,39 @@ def test_predict_next_daterange() -> None:
     )) == (datetime(2017, 1, 7, 10), datetime(2017, 1, 7, 12))
 
 
+def test_holidays_in_range() -> None:
+    utils.holidays_in_range.cache_clear()
+
+    holidays = utils.holidays_in_range(
+        ('ZG', ),
+        ((1, 3, 'Fooyears day'), ),
+        ((2017, 7, 1, 2017, 8, 13), ),
+        date(2017, 7, 30),
+        date(2017, 8, 2)
+    )
+    assert holidays == (
+        (date(2017, 7, 1), date(2017, 8, 13), 'School holidays'),
+        (date(2017, 8, 1), None, 'Nationalfeiertag'),
+    )
+
+    assert utils.holidays_in_range(
+        ('ZG', ), (), (), date(2017, 1, 3), date(2017, 1, 4)
+    ) == ()
+    assert utils.holidays_in_range(
+        (), ((1, 3, 'Fooyears day'), ), (), date(2017, 1, 2), date(2017, 1, 4)
+    ) == ((date(2017, 1, 3), None, 'Fooyears day'), )
+
+    # the same settings and range are only computed once
+    utils.holidays_in_range(
+        ('ZG', ),
+        ((1, 3, 'Fooyears day'), ),
+        ((2017, 7, 1, 2017, 8, 13), ),
+        date(2017, 7, 30),
+        date(2017, 8, 2)
+    )
+    assert utils.holidays_in_range.cache_info().hits == 1
+
+
 def test_predict_next_daterange_dst_st_transitions() -> None:
     tz_ch = timezone('Europe/Zurich')
 
@@ -8,6 +8,7 @@ from freezegun import freeze_time
 from onegov.core.utils import module_path
 from onegov.file import FileCollection
 from onegov.org.models import Topic
+from onegov.org.request import OrgRequest
 from onegov.page import Page, PageCollection
 from sedate import utcnow
 from webtest.forms import Textarea
@@ -375,6 +376,24 @@ def test_hide_page(client: Client) -> None:
     assert 'Test' not in page
 
 
+def test_pages_tree_by_role(client: Client) -> None:
+    client.login_editor()
+
+    new_page = client.get('/topics/organisation').click('Thema')
+    new_page.form['title'] = "Secret Plans"
+    new_page.form['access'] = 'private'
+    new_page.form.submit().follow()
+
+    anonymous = client.spawn()
+    assert 'Secret Plans' not in anonymous.get('/topics/organisation')
+    assert 'Secret Plans' in client.get('/topics/organisation')
+
+    # the pages are cached once for all roles and filtered when read
+    assert OrgRequest.page_rows.used_cache_keys == {
+        'OrgRequest.page_rows'
+    }
+
+
 def setup_main_and_subpage(client: Client) -> None:
     root_url = client.get('/').pyquery('.top-bar-section a').attr('href')
     client.login_admin()
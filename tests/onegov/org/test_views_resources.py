@@ -2512,6 +2512,35 @@ def test_occupancy_view(client: Client) -> None:
     assert data['pending'] == 1
     assert data['utilization'] == 100.0
 
+    # the combined feed for multiple resources
+    occupancy = client.get(
+        f'/resources/occupancy-json?resource={resource.id.hex}'
+        '&start=2015-08-28&end=2015-08-29'
+    )
+    data = occupancy.json
+    assert data['resources'] == [str(resource.id)]
+    reservations = data['reservations']
+    assert len(reservations['rows']) == 1
+    row = dict(zip(reservations['columns'], reservations['rows'][0]))
+    assert row['kind'] == 'reservation'
+    assert row['resource'] == str(resource.id)
+    assert 'event-pending' in row['classNames']
+    assert data['blockers'] == {'columns': [], 'rows': []}
+    availabilities = data['availabilities']
+    assert len(availabilities['rows']) == 1
+
+    occupancy = client.get(
+        '/resources/occupancy-json?group=Unknown'
+        '&start=2015-08-28&end=2015-08-29'
+    )
+    assert occupancy.json['resources'] == []
+    assert occupancy.json['reservations']['rows'] == []
+
+    client.get(
+        '/resources/occupancy-json?start=2015-08-28&end=2015-08-29',
+        status=400
+    )
+
 
 def test_occupancy_view_member_access(client: Client) -> None:
     # setup a resource that's visible to members
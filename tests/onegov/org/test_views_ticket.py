@@ -6,13 +6,19 @@ import os
 import pytest
 import re
 import transaction
+import zipfile
 
 from datetime import date, timedelta, datetime
 from freezegun import freeze_time
+from io import BytesIO
 from onegov.chat import MessageCollection
+from onegov.core.utils import normalize_for_url
 from onegov.form import FormCollection
 from onegov.form.parser import ParsedForm
 from onegov.reservation import ResourceCollection
+from onegov.ticket import Ticket
+from onegov.ticket import TicketPermission
+from onegov.user import UserGroup
 from textwrap import dedent
 from webtest import Upload
 
@@ -196,6 +202,80 @@ def test_tickets(client: Client) -> None:
     anon.get(ticket_url + '/archive', status=403)
 
 
+def test_ticket_files(client: Client) -> None:
+    collection = FormCollection(client.app.session())
+    collection.definitions.add(
+        'Statistics',
+        parsed=ParsedForm.from_formcode(dedent("""
+            E-Mail * = @@@
+            Datei * = *.txt
+        """)),
+        type='custom'
+    )
+    transaction.commit()
+
+    for content in (b'1;2;3', b'4;5;6'):
+        page = client.get('/form/statistics')
+        page.form['e_mail'] = 'info@example.org'
+        page.form['datei'] = Upload('README.txt', content)
+        page.form.submit().follow().form.submit().follow()
+
+    client.login_editor()
+    page = client.get('/tickets/ALL/open').click('Annehmen', index=0)
+    ticket_page = page.follow()
+    ticket = client.app.session().query(Ticket).filter_by(
+        state='pending').one()
+    number = normalize_for_url(ticket.number)
+
+    archive = client.get(ticket_page.request.url + '/files')
+    assert archive.content_type == 'application/zip'
+    with zipfile.ZipFile(BytesIO(archive.body)) as zipf:
+        names = zipf.namelist()
+        assert len(names) == 2
+        assert 'README.txt' in names
+        assert zipf.read('README.txt') in (b'1;2;3', b'4;5;6')
+        assert names[1].endswith('.pdf')
+
+    # all the files of the filtered ticket list
+    archive = client.get('/tickets/ALL/all/files')
+    assert archive.content_type == 'application/zip'
+    with zipfile.ZipFile(BytesIO(archive.body)) as zipf:
+        names = zipf.namelist()
+        assert len(names) == 2
+        assert all(name.endswith('/README.txt') for name in names)
+        assert sorted(zipf.read(name) for name in names) == [
+            b'1;2;3', b'4;5;6'
+        ]
+
+    archive = client.get('/tickets/ALL/pending/files')
+    with zipfile.ZipFile(BytesIO(archive.body)) as zipf:
+        assert zipf.namelist() == [f'{number}/README.txt']
+
+    archive = client.get('/tickets/ALL/closed/files')
+    with zipfile.ZipFile(BytesIO(archive.body)) as zipf:
+        assert zipf.namelist() == []
+
+    # files of restricted tickets are left out
+    session = client.app.session()
+    session.add(TicketPermission(
+        handler_code='FRM',
+        group='Statistics',
+        user_group=UserGroup(name='Statistics'),
+        exclusive=True
+    ))
+    transaction.commit()
+
+    archive = client.get('/tickets/ALL/all/files')
+    with zipfile.ZipFile(BytesIO(archive.body)) as zipf:
+        assert zipf.namelist() == []
+
+    admin = client.spawn()
+    admin.login_admin()
+    archive = admin.get('/tickets/ALL/all/files')
+    with zipfile.ZipFile(BytesIO(archive.body)) as zipf:
+        assert len(zipf.namelist()) == 2
+
+
 def test_tickets_search(client_with_fts: Client) -> None:
     client = client_with_fts
     client.login_editor()
@@ -3,6 +3,7 @@ from __future__ import annotations
 import transaction
 
 from datetime import date
+from dogpile.cache import make_region
 from decimal import Decimal
 from onegov.pas.calculate_pay import calculate_rate
 from onegov.pas.collections import AttendenceCollection
@@ -27,6 +28,9 @@ from onegov.pas.models.presidential_allowance import (
     LOHNART_ALLOWANCE_TEXT,
     PresidentialAllowance,
 )
+import onegov.pas.settlement_data as settlement_data_module
+from onegov.pas.settlement_data import get_party_lookup
+from onegov.pas.settlement_data import get_settlement_data
 import onegov.pas.views.settlement_run as settlement_run_views
 from onegov.pas.views.settlement_run import _get_commission_settlement_data
 from onegov.pas.views.settlement_run import _settlement_totals
@@ -36,7 +40,7 @@ from unittest.mock import Mock
 import pytest
 
 
-from typing import Literal, TYPE_CHECKING
+from typing import Any, Literal, TYPE_CHECKING
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
@@ -92,6 +96,9 @@ def test_parliamentarian_pdf_formats_hours_as_decimal(
     request = Mock(spec=TownRequest)
     request.session = session
     request.translate = lambda value: value
+    request.app = Mock(cache=make_region().configure(
+        'dogpile.cache.memory'
+    ))
 
     result = generate_parliamentarian_settlement_pdf(
         settlement_run,
@@ -387,10 +394,13 @@ def test_commission_export_one_member_one_president(session: Session) -> None:
     mock_request = Mock(spec=TownRequest)
     mock_request.session = session
     mock_request.translate = lambda x: x
+    mock_request.app = Mock(cache=make_region().configure(
+        'dogpile.cache.memory'
+    ))
 
     # Test the commission export function
     settlement_data = _get_commission_settlement_data(
-        settlement_run, mock_request, commission
+        get_settlement_data(settlement_run, mock_request), commission
     )
     assert len(settlement_data) == 2
     settlement_data.sort(key=lambda x: x[1].last_name)
@@ -409,13 +419,17 @@ def test_commission_export_one_member_one_president(session: Session) -> None:
     assert president_row[4] == Decimal('86')  # base rate (43 * 2 half-hours)
     assert president_row[5] == Decimal('104.85')
 
+    party_lookup = get_party_lookup(
+        session,
+        {member.id, president.id},
+        settlement_run.start,
+        settlement_run.end,
+    )
     totals = _settlement_totals(
         settlement_data,
         'party',
         'Total Test',
-        session,
-        settlement_run.start,
-        settlement_run.end,
+        party_lookup,
     )
     assert totals == [
         (
@@ -450,9 +464,7 @@ def test_commission_export_one_member_one_president(session: Session) -> None:
         settlement_data,
         'party',
         'Total Test',
-        session,
-        settlement_run.start,
-        settlement_run.end,
+        party_lookup,
     )
     assert totals_with_allowance == [
         (
@@ -534,10 +546,12 @@ def test_commission_export_uses_role_on_attendance_date(
     request = Mock(spec=TownRequest)
     request.session = session
     request.translate = lambda value: value
+    request.app = Mock(cache=make_region().configure(
+        'dogpile.cache.memory'
+    ))
 
     settlement_data = _get_commission_settlement_data(
-        settlement_run,
-        request,
+        get_settlement_data(settlement_run, request),
         commission,
     )
 
@@ -611,6 +625,9 @@ def test_settlement_pdf_formats_hours_as_decimal(
     request = Mock(spec=TownRequest)
     request.session = session
     request.translate = lambda value: value
+    request.app = Mock(cache=make_region().configure(
+        'dogpile.cache.memory'
+    ))
 
     entities: tuple[tuple[Literal['all', 'party'], Party | None], ...] = (
         ('all', None),
@@ -705,6 +722,9 @@ def test_settlement_pdf_lists_allowances_only_in_overview(
     request = Mock(spec=TownRequest)
     request.session = session
     request.translate = lambda value: value
+    request.app = Mock(cache=make_region().configure(
+        'dogpile.cache.memory'
+    ))
 
     commission_html = _settlement_pdf_html(
         settlement_run, request, 'commission', commission, monkeypatch
@@ -797,8 +817,96 @@ def test_plenary_uses_the_kantonsrat_president_rate(session: Session) -> None:
     request = Mock(spec=TownRequest)
     request.session = session
     request.translate = lambda value: value
+    request.app = Mock(cache=make_region().configure(
+        'dogpile.cache.memory'
+    ))
 
     amounts = sorted(
         row[12] for row in generate_fibu_export_rows(settlement_run, request)
     )
     assert amounts == [Decimal('300'), Decimal('500')]
+
+
+def test_settlement_data_is_cached_until_attendances_change(
+    session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rate_set = RateSet(
+        year=2024,
+        cost_of_living_adjustment=Decimal('0'),
+        plenary_none_member_halfday=Decimal('300'),
+    )
+    settlement_run = SettlementRun(
+        name='Q1 2024',
+        start=date(2024, 1, 1),
+        end=date(2024, 3, 31),
+        active=True,
+    )
+    member = PASParliamentarian(
+        first_name='Max',
+        last_name='Member',
+        gender='male',
+    )
+    session.add_all(
+        [
+            rate_set,
+            settlement_run,
+            member,
+            Attendence(
+                parliamentarian=member,
+                date=date(2024, 1, 15),
+                duration=205,
+                type='plenary',
+            ),
+        ]
+    )
+    session.flush()
+
+    request = Mock(spec=TownRequest)
+    request.session = session
+    request.translate = lambda value: value
+    request.app = Mock(cache=make_region().configure(
+        'dogpile.cache.memory'
+    ))
+
+    computed = []
+    compute = settlement_data_module.compute_settlement_rows
+
+    def compute_settlement_rows(*args: Any) -> Any:
+        computed.append(args)
+        return compute(*args)
+
+    monkeypatch.setattr(
+        settlement_data_module,
+        'compute_settlement_rows',
+        compute_settlement_rows
+    )
+
+    data = get_settlement_data(settlement_run, request)
+    assert [entry.value for entry in data.attendances] == [Decimal('3.42')]
+    assert data.party_lookup == {member.id: None}
+
+    data = get_settlement_data(settlement_run, request)
+    assert [entry.value for entry in data.attendances] == [Decimal('3.42')]
+    assert len(computed) == 1
+
+    session.add(
+        Attendence(
+            parliamentarian=member,
+            date=date(2024, 2, 15),
+            duration=60,
+            type='plenary',
+        )
+    )
+    session.flush()
+
+    data = get_settlement_data(settlement_run, request)
+    assert [entry.value for entry in data.attendances] == [
+        Decimal('1.00'),
+        Decimal('3.42'),
+    ]
+    assert [entry.compensation.base for entry in data.attendances] == [
+        Decimal('300'),
+        Decimal('300'),
+    ]
+    assert len(computed) == 2
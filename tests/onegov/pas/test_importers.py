@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import json
 import pytest
 
 from datetime import date
-from uuid import UUID
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from unittest.mock import Mock
+from uuid import UUID, uuid4
 
 from onegov.pas.importer.json_import import (
     MembershipImporter,
     PeopleImporter,
     OrganizationImporter,
 )
+from onegov.pas.importer.orchestrator import AdaptiveLimit, KubImporter
 from onegov.pas.models import (
+    ImportLog,
     PASCommission,
     PASCommissionMembership,
     PASParliamentarian,
@@ -21,6 +28,7 @@ from onegov.pas.utils import is_active_kantonsrat_member
 
 from typing import Any, cast, TYPE_CHECKING
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from onegov.pas.importer.types import MembershipData
     from sqlalchemy.orm import Session
 
@@ -578,6 +586,118 @@ def test_membership_importer_adopts_and_keeps_manual_rows(
     assert len(parliamentarian.commission_memberships) == 2
 
 
+def test_membership_importer_upserts_by_kub_id(
+    session: Session,
+    nussbaumer: tuple[MembershipImporter, PASParliamentarian, PASCommission],
+) -> None:
+    """New rows are inserted in bulk. A row which already holds the KUB id
+    but wasn't prefetched (it belongs to someone else) is taken over instead
+    of violating the unique constraint."""
+
+    importer, parliamentarian, commission = nussbaumer
+
+    someone_else = PASParliamentarian(first_name='Anna', last_name='Meier')
+    session.add(someone_else)
+    session.flush()
+    session.add(
+        PASCommissionMembership(
+            parliamentarian_id=someone_else.id,
+            commission_id=commission.id,
+            external_kub_id=UUID('024247e5-1a2b-4c3d-8e4f-5a6b7c8d9e0f'),
+            role='member',
+        )
+    )
+    session.flush()
+
+    _, counts = importer.bulk_import(
+        [
+            membership_data(
+                '024247e5-1a2b-4c3d-8e4f-5a6b7c8d9e0f',
+                COMMISSION,
+                'Präsident/-in',
+                '2026-04-30',
+                None,
+            ),
+            membership_data(
+                '5b008748-7c0f-4c1f-9e4b-6a1e2d3c4b5a',
+                KANTONSRAT,
+                'Mitglied des Kantonsrates',
+                '2024-12-20',
+                None,
+            ),
+        ]
+    )
+    session.flush()
+
+    assert counts['commission_memberships'] == 1
+    assert counts['parliamentarian_roles'] == 1
+    assert set(importer.timings) == {
+        'parliamentarians', 'prefetch', 'compute', 'write', 'delete'
+    }
+
+    membership = session.query(PASCommissionMembership).one()
+    assert membership.parliamentarian_id == parliamentarian.id
+    assert membership.role == 'president'
+    assert membership.start == date(2026, 4, 30)
+    assert someone_else.commission_memberships == []
+    assert len(parliamentarian.roles) == 1
+    assert parliamentarian.roles[0].meta == {'org_type': 'Kantonsrat'}
+
+
+def test_membership_importer_unflushed_parents(session: Session) -> None:
+    """The parliamentarians and commissions created earlier in the same
+    import have not been flushed yet, their memberships still need their
+    ids."""
+
+    from uuid import UUID
+
+    parliamentarian = PASParliamentarian(
+        first_name='Karl',
+        last_name='Nussbaumer',
+        external_kub_id=UUID(PERSON_ID),
+    )
+    commission = PASCommission(
+        name='ad-hoc Kommission Polizeigesetz',
+        external_kub_id=UUID(COMMISSION_ID),
+    )
+    session.add_all([parliamentarian, commission])
+
+    importer = MembershipImporter(session)
+    importer.init(
+        session=session,
+        parliamentarian_map={PERSON_ID: parliamentarian},
+        commission_map={COMMISSION_ID: commission},
+        parliamentary_group_map={},
+        party_map={},
+        other_organization_map={},
+    )
+    importer.bulk_import(
+        [
+            membership_data(
+                '024247e5-1a2b-4c3d-8e4f-5a6b7c8d9e0f',
+                COMMISSION,
+                'Mitglied',
+                '2026-04-30',
+                None,
+            ),
+            membership_data(
+                '5b008748-7c0f-4c1f-9e4b-6a1e2d3c4b5a',
+                KANTONSRAT,
+                'Mitglied des Kantonsrates',
+                '2024-12-20',
+                None,
+            ),
+        ]
+    )
+    session.flush()
+    session.expire_all()
+
+    membership = session.query(PASCommissionMembership).one()
+    assert membership.parliamentarian_id == parliamentarian.id
+    assert membership.commission_id == commission.id
+    assert len(parliamentarian.roles) == 1
+
+
 @pytest.fixture
 def sample_memberships() -> list[dict[str, Any]]:
     """Provide test membership data covering all organization types and
@@ -674,3 +794,144 @@ def sample_memberships() -> list[dict[str, Any]]:
             'end': None,
         },
     ]
+
+
+class MockKubHandler(BaseHTTPRequestHandler):
+    """ Serves /people/<id> like the KUB API, including ETags. """
+
+    people: dict[str, dict[str, Any]]
+    requests: list[tuple[str, int]]
+
+    def do_GET(self) -> None:
+        person = self.people.get(self.path.rsplit('/', 1)[-1])
+        if person is None:
+            return self.respond(404)
+
+        body = json.dumps(person).encode('utf-8')
+        etag = f'"{sha256(body).hexdigest()}"'
+        if self.headers.get('If-None-Match') == etag:
+            return self.respond(304)
+
+        self.respond(200, body, etag)
+
+    def respond(
+        self,
+        status: int,
+        body: bytes = b'',
+        etag: str | None = None
+    ) -> None:
+        self.requests.append((self.path, status))
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture(scope='function')
+def kub_server() -> Iterator[tuple[str, type[MockKubHandler]]]:
+    handler = type('Handler', (MockKubHandler, ), {
+        'people': {},
+        'requests': []
+    })
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}', handler
+    server.shutdown()
+    server.server_close()
+
+
+def test_update_custom_data_skips_unchanged_people(
+    session: Session,
+    kub_server: tuple[str, type[MockKubHandler]]
+) -> None:
+
+    base_url, handler = kub_server
+    kub_ids = [uuid4() for _ in range(3)]
+    for index, kub_id in enumerate(kub_ids):
+        session.add(PASParliamentarian(
+            first_name=f'First {index}',
+            last_name=f'Last {index}',
+            gender='male',
+            external_kub_id=kub_id
+        ))
+        handler.people[str(kub_id)] = {
+            'customValues': {'beruf': f'Job {index}'},
+            'addresses': [],
+            'sex': 2
+        }
+    session.flush()
+
+    def sync() -> tuple[int, int]:
+        import_log = ImportLog(
+            details={},
+            status='in_progress',
+            import_type='automatic'
+        )
+        session.add(import_log)
+        session.flush()
+
+        request = Mock(session=session)
+        with KubImporter('token', base_url) as importer:
+            updated, errors, _messages = importer.update_custom_data(
+                request,
+                Mock(),
+                max_workers=2,
+                import_log_id=import_log.id,
+                incremental=True
+            )
+        return updated, errors
+
+    assert sync() == (3, 0)
+    assert sorted(
+        p.occupation for p in session.query(PASParliamentarian)
+    ) == ['Job 0', 'Job 1', 'Job 2']
+    assert all(
+        p.gender == 'female' for p in session.query(PASParliamentarian)
+    )
+    assert sorted(status for _, status in handler.requests) == [200] * 3
+
+    # nothing changed, the API answers with 304 Not Modified
+    handler.requests.clear()
+    assert sync() == (0, 0)
+    assert sorted(status for _, status in handler.requests) == [304] * 3
+
+    # only the changed person is fetched and updated again
+    handler.requests.clear()
+    handler.people[str(kub_ids[1])]['customValues']['beruf'] = 'New Job'
+    assert sync() == (1, 0)
+    assert sorted(status for _, status in handler.requests) == [
+        200, 304, 304
+    ]
+    assert session.query(PASParliamentarian).filter_by(
+        external_kub_id=kub_ids[1]
+    ).one().occupation == 'New Job'
+
+
+def test_adaptive_limit() -> None:
+    limit = AdaptiveLimit(maximum=4)
+    assert limit.limit == 2
+
+    for _ in range(2):
+        limit.success()
+    assert limit.limit == 3
+
+    for _ in range(3):
+        limit.success()
+    assert limit.limit == 4
+
+    for _ in range(10):
+        limit.success()
+    assert limit.limit == 4
+
+    limit.overload()
+    assert limit.limit == 2
+    limit.overload()
+    limit.overload()
+    assert limit.limit == 1
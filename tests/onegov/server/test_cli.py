@@ -5,7 +5,12 @@ import port_for
 import pytest
 import time
 
+from itertools import count
+from onegov.server.cli import print_startup_profile, run_prefork
 from onegov.server.cli import WsgiProcess, WsgiServer
+from onegov.server.config import Config
+from onegov.server.core import Server
+from unittest.mock import patch
 from wsgiref.simple_server import demo_app
 from multiprocessing import get_start_method, set_start_method
 
@@ -84,3 +89,51 @@ def test_wsgi_server(use_spawn_process: None) -> None:
     assert "Hello world!" in response.text
 
     server.stop()
+
+
+def test_print_startup_profile(capsys: pytest.CaptureFixture[str]) -> None:
+    server = Server(Config({'applications': []}))
+    assert server.startup_profile == {}
+
+    server.startup_profile = {'scan': 2.5, 'commit OrgApp': 0.5}
+    print_startup_profile(server)
+
+    assert capsys.readouterr().out.splitlines() == [
+        'startup took 3.00s',
+        '    2.50s scan',
+        '    0.50s commit OrgApp',
+    ]
+
+
+def test_run_prefork_gives_up_on_crashing_workers() -> None:
+    pids = count(1000)
+    running: list[int] = []
+
+    def fork() -> int:
+        running.append(next(pids))
+        return running[-1]
+
+    def wait() -> tuple[int, int]:
+        # the oldest worker crashes right away
+        return running.pop(0), 256
+
+    with (
+        patch('onegov.server.cli.os.fork', fork),
+        patch('onegov.server.cli.os.wait', wait),
+        patch('onegov.server.cli.os.kill') as kill,
+        patch('onegov.server.cli.signal.signal'),
+        patch('onegov.server.cli.time.sleep') as sleep,
+        pytest.raises(SystemExit) as excinfo
+    ):
+        run_prefork(demo_app, port=8080, workers=2)
+
+    assert excinfo.value.code == 1
+
+    # the restarts are delayed exponentially
+    assert [call.args[0] for call in sleep.call_args_list] == [
+        1, 2, 4, 8, 16, 32, 60
+    ]
+
+    # the remaining worker is stopped
+    assert kill.call_count == 1
+    assert kill.call_args.args[0] == running[0]
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from onegov.ticket import Handler, Ticket, TicketCollection
+from onegov.ticket import Handler, Ticket, TicketCollection, TicketCounter
 from onegov.ticket.collection import ArchivedTicketCollection
 from onegov.user import User, UserCollection
 from unittest.mock import Mock
@@ -119,6 +119,54 @@ def test_ticket_count(session: Session) -> None:
     assert TicketCollection(session).for_state('all').subset().count() == 6
 
 
+def test_ticket_counters(session: Session) -> None:
+    collection = TicketCollection(session)
+    for i, group in enumerate(('foo', 'foo', 'bar'), start=1):
+        session.add(Ticket(
+            number='ABC-1000-{:04d}'.format(i),
+            title='test', group=group,
+            handler_code='ABC',
+            handler_id=str(i)
+        ))
+
+    assert collection.get_count() == (3, 0, 0, 0)
+    # every change is recorded as a separate delta
+    assert session.query(
+        TicketCounter.group, TicketCounter.count
+    ).filter(TicketCounter.state == 'open').order_by(
+        TicketCounter.group
+    ).all() == [('bar', 1), ('foo', 1), ('foo', 1)]
+
+    user = UserCollection(session).add('admin', 'hunter2', 'admin')
+    ticket = collection.by_handler_id('1')
+    assert ticket is not None
+    ticket.accept_ticket(user)
+    assert collection.get_count() == (2, 1, 0, 0)
+
+    ticket.close_ticket()
+    assert collection.get_count() == (2, 0, 1, 0)
+
+    ticket.archive_ticket()
+    assert collection.get_count() == (2, 0, 0, 0)
+    assert collection.get_count(excl_archived=False) == (2, 0, 0, 1)
+
+    session.delete(ticket)
+    assert collection.get_count(excl_archived=False) == (2, 0, 0, 0)
+
+    # bulk updates bypass the counters until they are reconciled
+    session.query(Ticket).update({'state': 'closed'})
+    assert collection.get_count() == (2, 0, 0, 0)
+
+    # reconciling compacts the deltas into a single row per counter
+    collection.reconcile_count()
+    assert collection.get_count() == (0, 0, 2, 0)
+    assert session.query(
+        TicketCounter.group, TicketCounter.state, TicketCounter.count
+    ).order_by(TicketCounter.group).all() == [
+        ('bar', 'closed', 1), ('foo', 'closed', 1)
+    ]
+
+
 def test_handler_subset(session: Session) -> None:
     session.add(Ticket(
         number='FOO-1000-0001',
@@ -76,6 +76,7 @@ def test_cli_serve(
     assert main.call_args[0][0] == '127.0.0.1'
     assert main.call_args[0][1] == websocket_config['port']
     assert main.call_args[0][2] == 'super-super-secret-token'
+    assert main.call_args[0][5] is None
 
     result = runner.invoke(cli, [
         '--config', cfg_path,
@@ -86,7 +87,8 @@ def test_cli_serve(
         '--token', 'not-so-secret-token',
         '--sentry-dsn', 'https://sentry.io/foo-bar',
         '--sentry-environment', 'foo-bar',
-        '--sentry-release', '1.0'
+        '--sentry-release', '1.0',
+        '--redis-url', 'redis://127.0.0.1:6379/1'
     ])
     assert result.exit_code == 0
     assert init_sentry.call_count == 1
@@ -100,6 +102,7 @@ def test_cli_serve(
     assert main.call_args[0][0] == '127.0.0.2'
     assert main.call_args[0][1] == 8887
     assert main.call_args[0][2] == 'not-so-secret-token'
+    assert main.call_args[0][5] == 'redis://127.0.0.1:6379/1'
 
 
 @patch('onegov.websockets.cli.connect')
@@ -2,19 +2,33 @@ from __future__ import annotations
 
 import pytest
 
-from asyncio import sleep
+from asyncio import create_task, sleep
 from json import loads
 from json import dumps
+from onegov.chat.models import Chat
+from onegov.user import UserCollection
+from onegov.websockets import server
+from onegov.websockets.backplane import Backplane
 from onegov.websockets.client import authenticate
 from onegov.websockets.client import broadcast
 from onegov.websockets.client import register
 from onegov.websockets.client import status
+from onegov.websockets.server import ChatState
+from onegov.websockets.server import append_to_chat_history
+from onegov.websockets.server import connection_metrics
+from onegov.websockets.server import load_chat
+from onegov.websockets.server import load_staff
+from onegov.websockets.server import relay
+from onegov.websockets.server import update_chat
 from tests.shared.asyncio import run_in_separate_thread
+from uuid import uuid4
 from websockets import connect
 
 
 from typing import Any, TYPE_CHECKING
 if TYPE_CHECKING:
+    from onegov.core.types import JSONObject
+    from sqlalchemy.orm import Session
     from tests.shared.fixtures import WebsocketThread
 
 
@@ -198,3 +212,115 @@ async def test_manage(websocket_server: WebsocketThread) -> None:
         response = await status(manage)
         assert response is not None
         assert not response['connections'].get('bar-two')
+
+
+def test_chat_queries(session: Session) -> None:
+    users = UserCollection(session)
+    users.add('admin@example.org', 'hunter2', 'admin')
+    users.add('editor@example.org', 'hunter2', 'editor')
+    users.add('member@example.org', 'hunter2', 'member')
+    assert load_staff(session) == {'admin@example.org', 'editor@example.org'}
+
+    chat = Chat(customer_name='Jane', email='jane@example.org', topic='Tax')
+    session.add(chat)
+    session.flush()
+
+    result = load_chat(session, chat.id)
+    assert result is not None
+    state, history = result
+    assert state == (chat.id, 'Tax', None, True)
+    assert history == []
+
+    content = {'userId': '1', 'user': 'Jane', 'text': '<b>Hi</b>', 'time': '1'}
+    assert append_to_chat_history(session, chat.id, content) == state
+    assert append_to_chat_history(session, chat.id, content) == state
+
+    result = update_chat(session, chat.id, active=False)
+    assert result is not None
+    state, history = result
+    assert not state.active
+    assert history == [{
+        'userId': '1',
+        'user': 'Jane',
+        'text': '&lt;b&gt;Hi&lt;/b&gt;',
+        'time': '1'
+    }] * 2
+
+    session.expire_all()
+    assert len(chat.chat_history) == 2
+    assert update_chat(session, uuid4(), active=False) is None
+
+
+@run_in_separate_thread
+async def test_backplane(redis_url: str) -> None:
+    received = []
+
+    async def handler(payload: JSONObject) -> None:
+        received.append(payload)
+
+    async with Backplane(redis_url) as one, Backplane(redis_url) as two:
+        one.heartbeat = two.heartbeat = 1
+        tasks = [
+            create_task(two.listen(handler)),
+            create_task(one.report(lambda: {'schemas': {'foo': 1}})),
+            create_task(two.report(lambda: {'schemas': {'bar': 2}})),
+        ]
+        await sleep(0.5)
+
+        # messages are only relayed to the other servers
+        await one.publish('broadcast', schema='foo', message='bar')
+        await two.publish('broadcast', schema='foo', message='baz')
+        await sleep(0.5)
+
+        assert received == [{
+            'node': one.node,
+            'kind': 'broadcast',
+            'schema': 'foo',
+            'message': 'bar'
+        }]
+        assert await one.metrics() == {
+            one.node: {'schemas': {'foo': 1}},
+            two.node: {'schemas': {'bar': 2}},
+        }
+
+        for task in tasks:
+            task.cancel()
+
+    # the metrics are removed when the server stops
+    async with Backplane(redis_url) as three:
+        assert await three.metrics() == {}
+
+
+@run_in_separate_thread
+async def test_relay() -> None:
+    id, user_id = uuid4(), uuid4()
+    await relay({
+        'kind': 'chat-state',
+        'schema': 'foo',
+        'state': [id.hex, 'Tax', user_id.hex, True]
+    })
+    assert server.ACTIVE_CHATS['foo'][id] == ChatState(
+        id, 'Tax', user_id, True
+    )
+
+    await relay({
+        'kind': 'chat-state',
+        'schema': 'foo',
+        'state': [id.hex, 'Tax', user_id.hex, False]
+    })
+    assert id not in server.ACTIVE_CHATS['foo']
+
+    # nobody is connected to this server
+    await relay({
+        'kind': 'broadcast',
+        'schema': 'foo-bar',
+        'message': 'baz',
+        'groupids': None
+    })
+    await relay({
+        'kind': 'chat',
+        'schema': 'foo',
+        'channel': id.hex,
+        'message': 'baz'
+    })
+    assert 'foo' not in connection_metrics()['schemas']  # type:ignore
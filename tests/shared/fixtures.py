@@ -408,6 +408,7 @@ def browser(playwright_browser: Browser) -> Iterator[ExtendedBrowser]:
 @pytest.fixture(scope="function")
 def redis_url(redis_server: RedisExecutor) -> Iterator[str]:
     import onegov.core.cache.redis as redis_cache
+    import onegov.core.rate_limit as rate_limit
     url = f'redis://{redis_server.host}:{redis_server.port}/0'
     yield url
     with Redis.from_url(url) as client:
@@ -416,6 +417,7 @@ def redis_url(redis_server: RedisExecutor) -> Iterator[str]:
     # clear the cached connection pools, so they can be gc'd
     redis_cache.get_pool.cache_clear()
     redis_cache.get.cache_clear()
+    rate_limit.get.cache_clear()
 
 
 @pytest.fixture(scope="session")